@@ -0,0 +1,5 @@
+"""
+Nexus Userbot benchmarks
+
+Run from the repository root, e.g. ``python -m benchmarks.userbot``.
+"""
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS ASSISTANT LOAD GENERATOR                      ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Replays synthetic public traffic (commands and inline keystroke sequences
+from many simulated users) against AssistantBot's handlers on the fake
+client. Reports p50/p99 latency, cooldown hit rates, growth of the
+cooldown and command stats tables, and outbound messages per second as JSON.
+
+    python -m benchmarks.assistant --events 100000 --users 20000 --rate 2000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks.userbot import ROOT, percentile, _ms
+
+# Weights pick what a user does next; an inline pick is one keystroke per event
+DEFAULT_MIX = "start:1,help:1,ping:4,info:2,webshot:1,inline:1"
+DEFAULT_INLINE = ["ping", "webshot:https://example.com", "translate:hello world", "tr"]
+
+# API calls that put something in front of a user
+OUTBOUND_METHODS = {
+    'send_message', 'edit_message_text', 'send_photo', 'send_document', 'answer_inline_query'
+}
+
+
+def _parse_mix(text: str) -> Tuple[List[str], List[float]]:
+    kinds, weights = [], []
+    for item in text.split(','):
+        kind, _, weight = item.strip().partition(':')
+        kinds.append(kind)
+        weights.append(float(weight or 1))
+    return kinds, weights
+
+
+def _table_bytes(table) -> int:
+    """Approximate size of a dict-like table and its keys and values"""
+    items = table.items() if hasattr(table, 'items') else []
+    return sys.getsizeof(table) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in items)
+
+
+def generate_traffic(args):
+    """
+    Yield (kind, text, user) events: commands, and inline queries typed
+    one keystroke at a time. Users are drawn with a Zipf-like skew so a few
+    users are much more active than the rest.
+    """
+    from benchmarks.fake_client import FakeUser
+
+    rng = random.Random(args.seed)
+    kinds, weights = _parse_mix(args.mix)
+    users = [FakeUser(100000 + index, f"User{index}", f"user{index}") for index in range(args.users)]
+    user_weights = list(itertools.accumulate(1 / (rank + 1) ** args.skew for rank in range(args.users)))
+    targets = [target.strip() for target in args.inline.split(',')] if args.inline else DEFAULT_INLINE
+
+    emitted = 0
+    while emitted < args.events:
+        kind = rng.choices(kinds, weights)[0]
+        user = rng.choices(users, cum_weights=user_weights)[0]
+        if kind == 'inline':
+            target = rng.choice(targets)
+            for length in range(1, len(target) + 1):
+                yield 'inline', target[:length], user
+                emitted += 1
+                if emitted >= args.events:
+                    return
+        else:
+            argument = " example.com" if kind == 'webshot' else ""
+            yield kind, f"/{kind}{argument}", user
+            emitted += 1
+
+
+async def start_assistant(args):
+    """AssistantBot on fake clients, without BotFather or worker processes"""
+    import bot.assistant_bot as assistant_module
+    from bot.assistant_bot import AssistantBot
+    from benchmarks.fake_client import FakeClient, FakeUser
+    from config import Config
+
+    def client_factory(*client_args, **client_kwargs):
+        return FakeClient(*client_args, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                          flood_every=args.flood_every, flood_wait=args.flood_wait,
+                          me=FakeUser(2, "Nexus Assistant", "nexus_assistant_bot", is_self=True, is_bot=True),
+                          **client_kwargs)
+
+    assistant_module.Client = client_factory
+    overrides = {
+        'API_ID': os.getenv('API_ID', '1'),
+        'API_HASH': os.getenv('API_HASH', 'benchmark'),
+        'BOT_TOKEN': '1:benchmark',
+        'AUTO_SETUP_BOTFATHER': 'false',
+        'AUTO_UPDATE_BOT_PROFILE': 'false',
+        'ASSISTANT_WORKERS': '0',
+        'ENABLE_LOG_GROUP': 'false',
+        'LOG_FILE': ''
+    }
+    if args.cooldown is not None:
+        overrides['PUBLIC_COMMAND_COOLDOWN'] = str(args.cooldown)
+    config = Config(overrides)
+
+    assistant = AssistantBot(config, FakeClient("user"))
+    if not await assistant.initialize_bot():
+        raise SystemExit("AssistantBot failed to initialize")
+    return assistant
+
+
+def _count_cooldowns(assistant) -> Dict[str, Counter]:
+    """Wrap _check_cooldown to count allowed and blocked checks per command"""
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    check = assistant._check_cooldown
+
+    def counted(user_id: int, command: str) -> bool:
+        allowed = check(user_id, command)
+        counts[command]['allowed' if allowed else 'blocked'] += 1
+        return allowed
+
+    assistant._check_cooldown = counted
+    return counts
+
+
+async def run(args) -> dict:
+    from pyrogram.handlers import InlineQueryHandler, MessageHandler
+
+    assistant = await start_assistant(args)
+    client = assistant.bot_client
+    cooldowns = _count_cooldowns(assistant)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=args.workers * 4)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    growth = []
+    sample_every = max(1, args.events // args.samples)
+
+    async def worker():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            kind, text, user, enqueued = item
+            if kind == 'inline':
+                await client.dispatch(client.inline_query(text, user), InlineQueryHandler)
+            else:
+                await client.dispatch(client.incoming(text, user), MessageHandler)
+            latencies[kind].append(time.perf_counter() - enqueued)
+
+    def sample(events: int):
+        growth.append({
+            'events': events,
+            'cooldowns': len(assistant.cooldowns),
+            'cooldowns_bytes': _table_bytes(assistant.cooldowns),
+            'counters': sum(len(table) for table in assistant.counters.totals.values()),
+            'counters_bytes': sum(_table_bytes(table) for table in assistant.counters.totals.values())
+        })
+
+    outbound_before = sum(client.calls[method] for method in OUTBOUND_METHODS)
+    tasks = [asyncio.create_task(worker()) for _ in range(args.workers)]
+    start = time.perf_counter()
+    sent = 0
+    for kind, text, user in generate_traffic(args):
+        if args.rate:
+            delay = start + sent / args.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await queue.put((kind, text, user, time.perf_counter()))
+        sent += 1
+        if sent % sample_every == 0:
+            sample(sent)
+    for _ in tasks:
+        await queue.put(None)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    sample(sent)
+
+    outbound = {method: client.calls[method] for method in OUTBOUND_METHODS if client.calls[method]}
+    everything = [value for values in latencies.values() for value in values]
+    await assistant.stop_bot()
+
+    import pyrogram
+    return {
+        'benchmark': 'assistant',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'pyrogram': pyrogram.__version__,
+        'params': vars(args),
+        'events': sent,
+        'elapsed_s': round(elapsed, 3),
+        'events_per_s': round(sent / elapsed, 1),
+        'latency_p50_ms': _ms(percentile(everything, 50)),
+        'latency_p99_ms': _ms(percentile(everything, 99)),
+        'per_kind': {
+            kind: {
+                'count': len(values),
+                'p50_ms': _ms(percentile(values, 50)),
+                'p99_ms': _ms(percentile(values, 99))
+            }
+            for kind, values in sorted(latencies.items())
+        },
+        'cooldown': {
+            command: {
+                'checks': sum(counts.values()),
+                'hit_rate': round(counts['blocked'] / sum(counts.values()), 4)
+            }
+            for command, counts in sorted(cooldowns.items())
+        },
+        'outbound_per_s': round((sum(outbound.values()) - outbound_before) / elapsed, 1),
+        'outbound_calls': outbound,
+        'growth': growth,
+        'client': {
+            'flood_waits': client.flood_waits,
+            'handler_errors': client.handler_errors
+        }
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Synthetic public traffic for the assistant bot")
+    parser.add_argument('--events', type=int, default=50000, help="updates to replay")
+    parser.add_argument('--users', type=int, default=5000, help="simulated users")
+    parser.add_argument('--skew', type=float, default=1.0, help="Zipf exponent of user activity (0 = uniform)")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help="kind:weight list; kinds are commands or 'inline'")
+    parser.add_argument('--inline', default='', help="comma-separated inline queries typed keystroke by keystroke")
+    parser.add_argument('--rate', type=float, default=0, help="updates per second (0 = unthrottled)")
+    parser.add_argument('--workers', type=int, default=8, help="concurrent dispatch workers")
+    parser.add_argument('--cooldown', type=int, default=None, help="override PUBLIC_COMMAND_COOLDOWN")
+    parser.add_argument('--latency-ms', type=float, default=0, help="latency of every API call")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="random extra latency per API call")
+    parser.add_argument('--flood-every', type=int, default=0, help="raise FloodWait on every Nth API call")
+    parser.add_argument('--flood-wait', type=int, default=0, help="FloodWait value in seconds")
+    parser.add_argument('--samples', type=int, default=10, help="table size samples over the run")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="also write the JSON result to this file")
+    parser.add_argument('--log-level', default='ERROR')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    result = asyncio.run(run(args))
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS FAKE PYROGRAM CLIENT                          ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+In-process stand-in for pyrogram.Client used by the benchmarks. Handlers are
+registered with the usual decorators and run through Pyrogram's own filters;
+every API call is counted and recorded instead of going to Telegram, with
+optional latency and FloodWait injection.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pyrogram import StopPropagation, ContinuePropagation, enums
+from pyrogram.errors import FloodWait
+from pyrogram.handlers import (
+    CallbackQueryHandler, ChosenInlineResultHandler, EditedMessageHandler,
+    InlineQueryHandler, MessageHandler, RawUpdateHandler
+)
+
+_ids = itertools.count(1000)
+
+
+class FakeUser:
+    def __init__(self, user_id: int, first_name: str = "User", username: Optional[str] = None,
+                 is_self: bool = False, is_bot: bool = False):
+        self.id = user_id
+        self.first_name = first_name
+        self.last_name = None
+        self.username = username
+        self.is_self = is_self
+        self.is_bot = is_bot
+        self.phone_number = None
+        self.language_code = "en"
+
+    @property
+    def mention(self) -> str:
+        return f"[{self.first_name}](tg://user?id={self.id})"
+
+
+class FakeChat:
+    def __init__(self, chat_id: int, chat_type: str = "private", title: Optional[str] = None):
+        self.id = chat_id
+        self.type = enums.ChatType(chat_type)
+        self.title = title
+        self.username = None
+        self.first_name = title
+        self.last_name = None
+
+
+class FakeDialog:
+    def __init__(self, chat: FakeChat):
+        self.chat = chat
+
+
+class FakeMessage:
+    """Message with the bound methods handlers use, backed by FakeClient calls"""
+
+    def __init__(self, client: 'FakeClient', chat: FakeChat, from_user: Optional[FakeUser], text: str = "",
+                 outgoing: bool = False, reply_to_message: Optional['FakeMessage'] = None, message_id: int = None):
+        self._client = client
+        self.id = message_id or next(_ids)
+        self.chat = chat
+        self.from_user = from_user
+        self.sender_chat = None
+        self.text = text
+        self.caption = None
+        self.outgoing = outgoing
+        self.reply_to_message = reply_to_message
+        self.reply_to_message_id = reply_to_message.id if reply_to_message else None
+        self.command = None
+        self.entities = None
+        self.media = None
+        self.document = None
+        self.photo = None
+        self.date = None
+
+    async def edit_text(self, text: str, **kwargs) -> 'FakeMessage':
+        return await self._client.edit_message_text(self.chat.id, self.id, text, **kwargs)
+
+    edit = edit_text
+
+    async def edit_caption(self, caption: str, **kwargs) -> 'FakeMessage':
+        return await self._client.edit_message_caption(self.chat.id, self.id, caption, **kwargs)
+
+    async def reply_text(self, text: str, **kwargs) -> 'FakeMessage':
+        kwargs.setdefault('reply_to_message_id', self.id)
+        return await self._client.send_message(self.chat.id, text, **kwargs)
+
+    reply = reply_text
+
+    async def reply_document(self, document, **kwargs) -> 'FakeMessage':
+        return await self._client.send_document(self.chat.id, document, **kwargs)
+
+    async def reply_photo(self, photo, **kwargs) -> 'FakeMessage':
+        return await self._client.send_photo(self.chat.id, photo, **kwargs)
+
+    async def reply_sticker(self, sticker, **kwargs) -> 'FakeMessage':
+        return await self._client.send_sticker(self.chat.id, sticker, **kwargs)
+
+    async def delete(self, revoke: bool = True):
+        return await self._client.delete_messages(self.chat.id, self.id)
+
+
+class FakeInlineQuery:
+    """Inline query whose answer() goes through FakeClient"""
+
+    def __init__(self, client: 'FakeClient', from_user: FakeUser, query: str, offset: str = ""):
+        self._client = client
+        self.id = str(next(_ids))
+        self.from_user = from_user
+        self.query = query
+        self.offset = offset
+        self.chat_type = None
+        self.location = None
+        self.matches = None
+
+    async def answer(self, results, cache_time: int = 300, is_personal: bool = False,
+                     next_offset: str = "", **kwargs):
+        return await self._client.answer_inline_query(self.id, results, cache_time=cache_time,
+                                                      is_personal=is_personal, next_offset=next_offset)
+
+
+class FakeClient:
+    """
+    Records what handlers send instead of talking to Telegram
+
+    Accepts the same constructor arguments as pyrogram.Client so it can be
+    swapped in where the bot creates its client.
+
+    Args:
+        latency: Seconds every API call takes (plus up to ``jitter``)
+        flood_every: Raise FloodWait on every Nth API call (0 = never)
+        flood_wait: FloodWait value in seconds
+        record_limit: Number of recent calls kept in ``log``
+    """
+
+    def __init__(self, name: str = "fake", *args, latency: float = 0.0, jitter: float = 0.0,
+                 flood_every: int = 0, flood_wait: int = 1, record_limit: int = 1000,
+                 me: Optional[FakeUser] = None, dialogs: Optional[List[FakeChat]] = None, **kwargs):
+        self.name = name
+        self.bot_token = kwargs.get('bot_token')
+        self.latency = latency
+        self.jitter = jitter
+        self.flood_every = flood_every
+        self.flood_wait = flood_wait
+        self.me = me or FakeUser(1, "Nexus", "nexus_fake", is_self=True, is_bot=bool(self.bot_token))
+        self.dialogs = dialogs if dialogs is not None else [
+            FakeChat(-100 - index, chat_type, f"{chat_type.title()} {index}")
+            for index, chat_type in enumerate(["group", "supergroup", "channel"] * 5)
+        ]
+        self.is_connected = False
+        self.executor = ThreadPoolExecutor(1, thread_name_prefix='fake-client')
+        self.handlers: Dict[int, List[Any]] = {}
+
+        self.calls: Counter = Counter()
+        self.total_calls = 0
+        self.log: deque = deque(maxlen=record_limit)
+        self.flood_waits = 0
+        self.handler_errors = 0
+
+    @property
+    def loop(self):
+        return asyncio.get_event_loop()
+
+    # Handler registration -------------------------------------------------
+
+    def add_handler(self, handler, group: int = 0):
+        self.handlers.setdefault(group, []).append(handler)
+        self.handlers = dict(sorted(self.handlers.items()))
+        return handler, group
+
+    def remove_handler(self, handler, group: int = 0):
+        if handler in self.handlers.get(group, []):
+            self.handlers[group].remove(handler)
+
+    def _decorator(self, handler_class, filters=None, group: int = 0):
+        def decorator(func):
+            handler = handler_class(func) if handler_class is RawUpdateHandler else handler_class(func, filters)
+            self.add_handler(handler, group)
+            return func
+        return decorator
+
+    def on_message(self, filters=None, group: int = 0):
+        return self._decorator(MessageHandler, filters, group)
+
+    def on_edited_message(self, filters=None, group: int = 0):
+        return self._decorator(EditedMessageHandler, filters, group)
+
+    def on_callback_query(self, filters=None, group: int = 0):
+        return self._decorator(CallbackQueryHandler, filters, group)
+
+    def on_inline_query(self, filters=None, group: int = 0):
+        return self._decorator(InlineQueryHandler, filters, group)
+
+    def on_chosen_inline_result(self, filters=None, group: int = 0):
+        return self._decorator(ChosenInlineResultHandler, filters, group)
+
+    def on_raw_update(self, group: int = 0):
+        return self._decorator(RawUpdateHandler, None, group)
+
+    # Dispatch ---------------------------------------------------------------
+
+    async def dispatch(self, update, handler_class=MessageHandler) -> bool:
+        """
+        Run an update through the registered handlers like Pyrogram's
+        dispatcher: groups in order, the first matching handler per group.
+        Returns whether any handler ran.
+        """
+        handled = False
+        for group in list(self.handlers.values()):
+            for handler in group:
+                if not isinstance(handler, handler_class):
+                    continue
+                try:
+                    if not await handler.check(self, update):
+                        continue
+                    handled = True
+                    await handler.callback(self, update)
+                except StopPropagation:
+                    return handled
+                except ContinuePropagation:
+                    continue
+                except Exception:
+                    self.handler_errors += 1
+                break
+        return handled
+
+    # API calls --------------------------------------------------------------
+
+    async def _api(self, method: str, chat_id=None, text: Optional[str] = None):
+        self.calls[method] += 1
+        self.total_calls += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.random() * self.jitter)
+        if self.flood_every and self.total_calls % self.flood_every == 0:
+            self.flood_waits += 1
+            raise FloodWait(value=self.flood_wait)
+        self.log.append((time.monotonic(), method, chat_id, text))
+
+    def _message(self, chat_id, text: str = "", message_id: int = None) -> FakeMessage:
+        return FakeMessage(self, FakeChat(chat_id), self.me, text, outgoing=True, message_id=message_id)
+
+    async def start(self):
+        await self._api('start')
+        self.is_connected = True
+        return self
+
+    async def stop(self):
+        self.is_connected = False
+        self.executor.shutdown(wait=False)
+        return self
+
+    async def get_me(self) -> FakeUser:
+        await self._api('get_me')
+        return self.me
+
+    async def get_chat(self, chat_id) -> FakeChat:
+        await self._api('get_chat', chat_id)
+        return FakeChat(chat_id)
+
+    async def get_users(self, user_ids):
+        await self._api('get_users')
+        if isinstance(user_ids, (list, tuple)):
+            return [FakeUser(user_id) for user_id in user_ids]
+        return FakeUser(user_ids)
+
+    async def get_dialogs(self, limit: int = 0):
+        await self._api('get_dialogs')
+        for chat in self.dialogs[:limit or None]:
+            yield FakeDialog(chat)
+
+    async def send_message(self, chat_id, text: str, **kwargs) -> FakeMessage:
+        await self._api('send_message', chat_id, text)
+        return self._message(chat_id, text)
+
+    async def edit_message_text(self, chat_id, message_id: int, text: str, **kwargs) -> FakeMessage:
+        await self._api('edit_message_text', chat_id, text)
+        return self._message(chat_id, text, message_id)
+
+    async def edit_message_caption(self, chat_id, message_id: int, caption: str, **kwargs) -> FakeMessage:
+        await self._api('edit_message_caption', chat_id, caption)
+        return self._message(chat_id, caption, message_id)
+
+    async def delete_messages(self, chat_id, message_ids, **kwargs) -> int:
+        await self._api('delete_messages', chat_id)
+        return 1
+
+    async def send_document(self, chat_id, document, **kwargs) -> FakeMessage:
+        await self._api('send_document', chat_id, kwargs.get('caption'))
+        return self._message(chat_id)
+
+    async def send_photo(self, chat_id, photo, **kwargs) -> FakeMessage:
+        await self._api('send_photo', chat_id, kwargs.get('caption'))
+        return self._message(chat_id)
+
+    async def send_sticker(self, chat_id, sticker, **kwargs) -> FakeMessage:
+        await self._api('send_sticker', chat_id)
+        return self._message(chat_id)
+
+    async def leave_chat(self, chat_id, **kwargs):
+        await self._api('leave_chat', chat_id)
+
+    async def answer_inline_query(self, inline_query_id: str, results, **kwargs) -> bool:
+        await self._api('answer_inline_query')
+        return True
+
+    def __getattr__(self, method: str):
+        # Any other API method is accepted and recorded
+        if method.startswith('_'):
+            raise AttributeError(method)
+
+        async def call(*args, **kwargs):
+            await self._api(method, args[0] if args else kwargs.get('chat_id'))
+            return True
+        return call
+
+    # Traffic ----------------------------------------------------------------
+
+    def outgoing(self, text: str, chat: Optional[FakeChat] = None) -> FakeMessage:
+        """A message typed by the account owner (what userbot commands react to)"""
+        return FakeMessage(self, chat or FakeChat(self.me.id), self.me, text, outgoing=True)
+
+    def incoming(self, text: str, user: FakeUser, chat: Optional[FakeChat] = None) -> FakeMessage:
+        """A message from another user"""
+        return FakeMessage(self, chat or FakeChat(user.id), user, text)
+
+    def inline_query(self, text: str, user: FakeUser, offset: str = "") -> FakeInlineQuery:
+        """An inline query typed by another user"""
+        return FakeInlineQuery(self, user, text, offset)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS STARTUP BENCHMARK                             ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Runs `main.py --startup-report` in fresh interpreters and checks the cold
+start (interpreter, imports, config and handler setup) against a budget.
+
+    python benchmarks/startup.py --runs 5 --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(runs: int) -> list:
+    """Wall-clock milliseconds of each cold start"""
+    env = dict(os.environ)
+    # Startup must not depend on real credentials or write a log file
+    env.setdefault('API_ID', '1')
+    env.setdefault('API_HASH', 'benchmark')
+    env['LOG_FILE'] = ''
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, os.path.join(ROOT, 'main.py'), '--startup-report'],
+            cwd=ROOT, env=env, capture_output=True, text=True
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode not in (0, 1):
+            sys.stderr.write(result.stderr)
+            raise SystemExit(f"main.py --startup-report failed with exit code {result.returncode}")
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[-2].strip())
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('STARTUP_BUDGET_MS', '1500')))
+    args = parser.parse_args()
+
+    timings = measure(max(1, args.runs))
+    median = statistics.median(timings)
+    print(json.dumps({
+        'benchmark': 'cold_start',
+        'runs': len(timings),
+        'median_ms': round(median, 1),
+        'min_ms': round(min(timings), 1),
+        'max_ms': round(max(timings), 1),
+        'budget_ms': args.budget_ms,
+        'within_budget': median <= args.budget_ms
+    }, indent=2))
+    return 0 if median <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS USERBOT BENCHMARK                             ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Starts NexusUserbot against the in-process FakeClient and measures cold
+start, time to first command, dispatch throughput over a mix of built-in
+and plugin commands, and memory retained per 10k messages. Prints JSON.
+
+    python -m benchmarks.userbot --messages 20000 --rate 500 --latency-ms 20
+"""
+
+import time
+
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Commands that reach external services or BotFather are left out by default
+DEFAULT_MIX = [
+    ".ping", ".help", ".alive", ".info", ".echo hello world", ".calc 2**10 + 3*4",
+    ".calc mean(1..1000)", ".time", ".repo", ".botstatus", ".groups",
+    ".sticker hi", ".stickerpack", "just a normal message"
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+async def start_userbot(args):
+    """Import and start NexusUserbot on a FakeClient, timing each step"""
+    import_start = time.perf_counter()
+    import main
+    from config import Config
+    from bot.streaming import configure_streaming
+    from benchmarks.fake_client import FakeClient
+    imported = time.perf_counter()
+
+    def client_factory(*client_args, **client_kwargs):
+        return FakeClient(*client_args, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                          flood_every=args.flood_every, flood_wait=args.flood_wait, **client_kwargs)
+
+    main.Client = client_factory
+    config = Config({
+        'API_ID': os.getenv('API_ID', '1'),
+        'API_HASH': os.getenv('API_HASH', 'benchmark'),
+        'BOT_TOKEN': '',
+        'LOG_FILE': '',
+        # The mix covers the bundled plugins
+        'PLUGIN_AUTO_LOAD': 'true',
+        'DATABASE_URL': f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='nexus-bench-'), 'bench.db')}"
+    })
+    configure_streaming(config)
+    userbot = main.NexusUserbot(config, show_banner=False)
+    if not await userbot.start():
+        raise SystemExit("NexusUserbot failed to start")
+    started = time.perf_counter()
+
+    client = userbot.client
+    await client.dispatch(client.outgoing(f"{config.COMMAND_PREFIX}ping"))
+    first_command = time.perf_counter()
+
+    timings = {
+        'process_to_import_ms': _ms(import_start - _PROCESS_START),
+        'import_ms': _ms(imported - import_start),
+        'start_ms': _ms(started - imported),
+        'cold_start_ms': _ms(started - _PROCESS_START),
+        'time_to_first_command_ms': _ms(first_command - _PROCESS_START),
+        'handlers': sum(len(group) for group in client.handlers.values()),
+        'plugins': sorted(userbot.plugin_manager.loaded_plugins) if userbot.plugin_manager else [],
+        'command_prefix': config.COMMAND_PREFIX
+    }
+    return userbot, timings
+
+
+async def run_traffic(client, mix: List[str], count: int, rate: float, workers: int):
+    """
+    Feed count messages through the client with a pool of dispatch workers
+    (as Pyrogram does); rate is messages per second, 0 for as fast as possible
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 4)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    unhandled: Dict[str, int] = defaultdict(int)
+
+    async def worker():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            text, enqueued = item
+            if not await client.dispatch(client.outgoing(text)):
+                unhandled[text] += 1
+            latencies[text].append(time.perf_counter() - enqueued)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    calls_before = client.total_calls
+    start = time.perf_counter()
+    for index in range(count):
+        if rate:
+            delay = start + index / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await queue.put((mix[index % len(mix)], time.perf_counter()))
+    for _ in tasks:
+        await queue.put(None)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    everything = [value for values in latencies.values() for value in values]
+    return {
+        'messages': count,
+        'elapsed_s': round(elapsed, 3),
+        'messages_per_s': round(count / elapsed, 1),
+        'api_calls_per_s': round((client.total_calls - calls_before) / elapsed, 1),
+        'latency_p50_ms': _ms(percentile(everything, 50)),
+        'latency_p99_ms': _ms(percentile(everything, 99)),
+        'unhandled': sum(unhandled.values()),
+        'unhandled_texts': dict(unhandled),
+        'per_command': {
+            text: {
+                'count': len(values),
+                'mean_ms': _ms(statistics.fmean(values)),
+                'p99_ms': _ms(percentile(values, 99))
+            }
+            for text, values in latencies.items()
+        }
+    }
+
+
+async def measure_memory(client, mix: List[str], count: int, workers: int):
+    """Memory still allocated after count messages, scaled to 10k"""
+    # The fake client's own call log is not the bot's memory
+    client.log.clear()
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    await run_traffic(client, mix, count, 0, workers)
+    client.log.clear()
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'messages': count,
+        'retained_bytes_per_10k': int((after - before) * 10000 / count),
+        'peak_bytes': peak - before
+    }
+
+
+async def run(args) -> dict:
+    userbot, startup = await start_userbot(args)
+    client = userbot.client
+    mix = [text.strip() for text in args.mix.split(',')] if args.mix else DEFAULT_MIX
+
+    throughput = await run_traffic(client, mix, args.messages, args.rate, args.workers)
+    memory = await measure_memory(client, mix, args.memory_messages, args.workers)
+    await userbot.stop()
+
+    import pyrogram
+    return {
+        'benchmark': 'userbot',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'pyrogram': pyrogram.__version__,
+        'params': vars(args),
+        'startup': startup,
+        'throughput': throughput,
+        'memory': memory,
+        'client': {
+            'api_calls': dict(client.calls),
+            'flood_waits': client.flood_waits,
+            'handler_errors': client.handler_errors
+        }
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="NexusUserbot benchmark on a fake Pyrogram client")
+    parser.add_argument('--messages', type=int, default=10000, help="messages in the throughput run")
+    parser.add_argument('--rate', type=float, default=0, help="messages per second (0 = unthrottled)")
+    parser.add_argument('--workers', type=int, default=8, help="concurrent dispatch workers")
+    parser.add_argument('--mix', default='', help="comma-separated message texts (default: built-in mix)")
+    parser.add_argument('--latency-ms', type=float, default=0, help="latency of every API call")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="random extra latency per API call")
+    parser.add_argument('--flood-every', type=int, default=0, help="raise FloodWait on every Nth API call")
+    parser.add_argument('--flood-wait', type=int, default=0, help="FloodWait value in seconds")
+    parser.add_argument('--memory-messages', type=int, default=10000, help="messages in the memory run")
+    parser.add_argument('--output', help="also write the JSON result to this file")
+    parser.add_argument('--log-level', default='ERROR')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    os.chdir(ROOT)  # Plugins are loaded from ./plugins
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    result = asyncio.run(run(args))
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + "\n")
+
+    # A command nobody handled means a missing plugin or handler, and figures that measure nothing
+    prefix = result['startup']['command_prefix']
+    missing = sorted(text for text in result['throughput']['unhandled_texts'] if text.startswith(prefix))
+    if missing:
+        print(f"Unhandled commands: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS ACCESS CONTROL                                ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from pyrogram.errors import RPCError
+
+logger = logging.getLogger(__name__)
+
+# List name -> (inline setting, file setting)
+LISTS = {
+    'authorized': ('AUTHORIZED_USERS', 'AUTHORIZED_USERS_FILE'),
+    'blacklisted': ('BLACKLISTED_USERS', 'BLACKLISTED_USERS_FILE'),
+}
+
+# Usernames per get_users request
+_RESOLVE_BATCH = 200
+
+
+def parse_entries(items: Iterable[str]) -> Tuple[Set[int], Set[str]]:
+    """Split list entries into user ids and lower-cased usernames"""
+    ids, usernames = set(), set()
+    for item in items:
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            ids.add(int(item))
+        except ValueError:
+            usernames.add(item.lstrip('@').lower())
+    return ids, usernames
+
+
+def read_list_file(path: str) -> List[str]:
+    """
+    Entries of a list file: one or more ids/usernames per line, separated
+    by commas or whitespace; '#' starts a comment
+    """
+    entries = []
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                entries.extend(line.split('#', 1)[0].replace(',', ' ').split())
+    except OSError as e:
+        logger.error(f"Failed to read user list {path}: {e}")
+    return entries
+
+
+class AccessControl:
+    """
+    Authorized and blacklisted users as integer frozensets
+
+    Built once from AUTHORIZED_USERS / BLACKLISTED_USERS and their list
+    files, rebuilt when those settings change. Usernames are resolved to
+    ids through the client; until then they do not match anyone. Owner
+    changes are kept across rebuilds and written to the list file when one
+    is configured. Membership checks are a single set lookup.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.authorized: FrozenSet[int] = frozenset()
+        self.blacklisted: FrozenSet[int] = frozenset()
+        self.restricted = False
+        self.pending: Dict[str, FrozenSet[str]] = {name: frozenset() for name in LISTS}
+        self.usernames: Dict[str, int] = {}
+        self._added: Dict[str, Set[int]] = {name: set() for name in LISTS}
+        self._removed: Dict[str, Set[int]] = {name: set() for name in LISTS}
+        self._client = None
+        self._resolving: Optional[asyncio.Task] = None
+        # One thread, so list file updates are applied in order
+        self._file_writer: Optional[ThreadPoolExecutor] = None
+        self.reload()
+        config.subscribe(lambda old, new, changed: self.reload(),
+                         keys=[key for keys in LISTS.values() for key in keys])
+
+    def is_blocked(self, user_id: int) -> bool:
+        """Whether the user is blacklisted"""
+        return user_id in self.blacklisted
+
+    def is_allowed(self, user_id: int) -> bool:
+        """Not blacklisted, and authorized when an authorized list is configured"""
+        if user_id in self.blacklisted:
+            return False
+        return not self.restricted or user_id in self.authorized
+
+    def _entries(self, name: str) -> List[str]:
+        setting, file_setting = LISTS[name]
+        entries = list(getattr(self.config, setting))
+        path = getattr(self.config, file_setting)
+        if path:
+            entries.extend(read_list_file(path))
+        return entries
+
+    def reload(self):
+        """Rebuild both sets from the configuration and list files"""
+        restricted = False
+        for name in LISTS:
+            entries = self._entries(name)
+            ids, usernames = parse_entries(entries)
+            ids.update(self.usernames[username] for username in usernames if username in self.usernames)
+            ids = (ids | self._added[name]) - self._removed[name]
+
+            self.pending[name] = frozenset(username for username in usernames if username not in self.usernames)
+            setattr(self, name, frozenset(ids))
+            if name == 'authorized':
+                restricted = bool(entries or self._added[name])
+        self.restricted = restricted
+
+        logger.info(f"Access lists loaded: {len(self.authorized)} authorized, "
+                    f"{len(self.blacklisted)} blacklisted")
+        self._schedule_resolve()
+
+    def _schedule_resolve(self):
+        if not self._client or not any(self.pending.values()):
+            return
+        if self._resolving and not self._resolving.done():
+            return
+        try:
+            self._resolving = asyncio.get_running_loop().create_task(self.resolve(self._client))
+        except RuntimeError:
+            pass
+
+    async def resolve(self, client) -> int:
+        """
+        Resolve pending usernames to ids with batched get_users calls
+
+        Returns:
+            Number of usernames resolved
+        """
+        self._client = client
+        names = sorted(set().union(*self.pending.values()))
+        if not names:
+            return 0
+
+        resolved = 0
+        for start in range(0, len(names), _RESOLVE_BATCH):
+            batch = names[start:start + _RESOLVE_BATCH]
+            try:
+                users = await client.get_users(batch)
+            except RPCError:
+                # One unknown username fails the whole request
+                users = []
+                for username in batch:
+                    try:
+                        users.append(await client.get_users(username))
+                    except RPCError as e:
+                        logger.warning(f"Could not resolve @{username}: {e}")
+            for user in users if isinstance(users, list) else [users]:
+                if user.username:
+                    self.usernames[user.username.lower()] = user.id
+                    resolved += 1
+
+        if resolved:
+            self.reload()
+        return resolved
+
+    def update(self, name: str, user_id: int, add: bool):
+        """
+        Add a user to, or remove one from, a list at runtime
+
+        Args:
+            name: 'authorized' or 'blacklisted'
+            user_id: Telegram user id
+            add: True to add, False to remove
+        """
+        if name not in LISTS:
+            raise ValueError(f"Unknown access list: {name}")
+
+        (self._added if add else self._removed)[name].add(user_id)
+        (self._removed if add else self._added)[name].discard(user_id)
+        current = getattr(self, name)
+        setattr(self, name, current | {user_id} if add else current - {user_id})
+        if name == 'authorized' and add:
+            self.restricted = True
+
+        # The list file is rewritten off the event loop; memory is already up to date
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._persist(name, user_id, add)
+            return
+        if self._file_writer is None:
+            self._file_writer = ThreadPoolExecutor(1, thread_name_prefix='nexus-access')
+        loop.run_in_executor(self._file_writer, self._persist, name, user_id, add)
+
+    def _persist(self, name: str, user_id: int, add: bool):
+        path = getattr(self.config, LISTS[name][1])
+        if not path:
+            return
+        try:
+            if add:
+                with open(path, 'a', encoding='utf-8') as file:
+                    file.write(f"{user_id}\n")
+                return
+
+            if not os.path.exists(path):
+                return
+            with open(path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+            kept = []
+            for line in lines:
+                entry, hash_mark, comment = line.partition('#')
+                tokens = [token for token in entry.replace(',', ' ').split() if token != str(user_id)]
+                if not hash_mark:
+                    if tokens:
+                        kept.append(' '.join(tokens) + "\n")
+                else:
+                    kept.append(' '.join(tokens + [f"#{comment}"]))
+            with open(path, 'w', encoding='utf-8') as file:
+                file.writelines(kept)
+        except OSError as e:
+            logger.error(f"Failed to update user list {path}: {e}")
+
+    def get_stats(self) -> dict:
+        """Sizes of the lists"""
+        return {
+            'authorized': len(self.authorized),
+            'blacklisted': len(self.blacklisted),
+            'restricted': self.restricted,
+            'pending_usernames': sum(len(names) for names in self.pending.values())
+        }
@@ -0,0 +1,195 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS TEXT ANIMATION                                ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+from pyrogram import enums
+from pyrogram.errors import FloodWait, MessageIdInvalid, MessageNotModified, RPCError
+
+logger = logging.getLogger(__name__)
+
+WRITE_CURSOR = '▌'
+TYPE_CURSOR = '|'
+TYPE_LOADING = ('⌨️ Typing.', '⌨️ Typing..', '⌨️ Typing...')
+
+# FloodWait doubles the edit interval up to this factor; successful edits ease it back
+_MAX_PENALTY = 8.0
+_RECOVERY = 0.9
+
+
+def _cuts(length: int, count: int) -> List[int]:
+    """``count`` increasing prefix lengths ending at ``length``, evenly spaced"""
+    count = max(1, min(count, length))
+    return sorted({max(1, round(length * (i + 1) / count)) for i in range(count)})
+
+
+def write_frames(text: str, max_frames: int) -> List[str]:
+    """Text revealed left to right behind a block cursor"""
+    cuts = _cuts(len(text), max_frames)
+    return [text[:cut] + WRITE_CURSOR for cut in cuts[:-1]] + [text]
+
+
+def type_frames(text: str, max_frames: int) -> List[str]:
+    """A short typing indicator, then a typewriter with a blinking cursor"""
+    loading = list(TYPE_LOADING[:max(0, min(len(TYPE_LOADING), max_frames // 4))])
+    cuts = _cuts(len(text), max_frames - len(loading))
+    typed = [text[:cut] + (TYPE_CURSOR if i % 2 == 0 else ' ') for i, cut in enumerate(cuts[:-1])]
+    return loading + typed + [text]
+
+
+EFFECTS = {
+    'write': write_frames,
+    'type': type_frames,
+}
+
+
+class EditPacer:
+    """
+    Edit budget shared by every animation: at most one edit every
+    ``interval`` seconds, stretched after a FloodWait
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.penalty = 1.0
+        self._next = 0.0
+        self.flood_waits = 0
+
+    @property
+    def current_interval(self) -> float:
+        return self.interval * self.penalty
+
+    async def acquire(self):
+        """Wait for the next edit slot"""
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self.current_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def success(self):
+        self.penalty = max(1.0, self.penalty * _RECOVERY)
+
+    def flood(self, seconds: float):
+        """Hold every animation for a FloodWait and slow down afterwards"""
+        self.flood_waits += 1
+        self.penalty = min(_MAX_PENALTY, self.penalty * 2)
+        self._next = max(self._next, time.monotonic() + seconds)
+
+
+class Animator:
+    """
+    Plays frame sequences by editing a message
+
+    Frames are built up front, capped at ``max_frames``. Edits go through
+    the shared EditPacer, so concurrent animations together never edit
+    faster than it allows. Playback follows its own timeline: when edits
+    fall behind (slow RPCs, FloodWait) frames that are already overdue are
+    skipped and the final frame is always shown. Each animation runs in its
+    own task; starting another one in the same chat cancels it, and it
+    stops when its message is deleted.
+    """
+
+    def __init__(self, interval: float = 1.0, max_frames: int = 20):
+        self.pacer = EditPacer(interval)
+        self.max_frames = max_frames
+        self._active: Dict[int, asyncio.Task] = {}
+
+        self.edits = 0
+        self.skipped = 0
+        self.cancelled = 0
+
+    @classmethod
+    def from_config(cls, config) -> 'Animator':
+        return cls(max(config.ANIMATION_FRAME_INTERVAL, config.RATE_LIMIT_DELAY), config.ANIMATION_MAX_FRAMES)
+
+    def configure(self, config):
+        """Apply new pacing settings"""
+        self.pacer.interval = max(config.ANIMATION_FRAME_INTERVAL, config.RATE_LIMIT_DELAY)
+        self.max_frames = config.ANIMATION_MAX_FRAMES
+
+    def frames(self, effect: str, text: str) -> List[str]:
+        """Frame sequence of an effect, within the frame budget"""
+        if effect not in EFFECTS:
+            raise ValueError(f"Unknown animation: {effect}")
+        return EFFECTS[effect](text, self.max_frames)
+
+    def play(self, message, frames: List[str]) -> asyncio.Task:
+        """Start animating a message, cancelling any animation in the same chat"""
+        key = message.chat.id
+        previous = self._active.get(key)
+        if previous and not previous.done():
+            previous.cancel()
+            self.cancelled += 1
+
+        task = asyncio.get_running_loop().create_task(self._play(message, frames))
+        self._active[key] = task
+        task.add_done_callback(lambda done: self._active.pop(key, None) if self._active.get(key) is done else None)
+        return task
+
+    def animate(self, message, effect: str, text: str) -> asyncio.Task:
+        return self.play(message, self.frames(effect, text))
+
+    async def _play(self, message, frames: List[str]) -> bool:
+        last = len(frames) - 1
+        start = time.monotonic()
+        index = 0
+        while index <= last:
+            await self.pacer.acquire()
+
+            # Frames whose time has already passed are not worth an edit
+            due = min(last, int((time.monotonic() - start) / self.pacer.interval))
+            if due > index:
+                self.skipped += due - index
+                index = due
+
+            final = index == last
+            try:
+                await message.edit_text(
+                    frames[index],
+                    parse_mode=None if final else enums.ParseMode.DISABLED,
+                    disable_web_page_preview=True
+                )
+                self.edits += 1
+                self.pacer.success()
+            except FloodWait as e:
+                logger.warning(f"FloodWait {e.value}s during animation in {message.chat.id}")
+                self.pacer.flood(e.value)
+                continue
+            except MessageNotModified:
+                pass
+            except MessageIdInvalid:
+                logger.debug(f"Animated message in {message.chat.id} is gone")
+                return False
+            except RPCError as e:
+                logger.error(f"Animation in {message.chat.id} stopped: {e}")
+                return False
+            index += 1
+        return True
+
+    async def stop(self):
+        """Cancel every running animation"""
+        tasks = [task for task in self._active.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._active.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            'active': sum(1 for task in self._active.values() if not task.done()),
+            'edits': self.edits,
+            'skipped_frames': self.skipped,
+            'cancelled': self.cancelled,
+            'flood_waits': self.pacer.flood_waits,
+            'interval': self.pacer.current_interval
+        }
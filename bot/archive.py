@@ -0,0 +1,215 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS MESSAGE ARCHIVE                               ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Opt-in local copy of the text of every message the account sees, indexed
+with SQLite FTS5 for instant search. It lives in its own SQLite file
+(ARCHIVE_PATH) whatever DATABASE_URL points to.
+"""
+
+import logging
+import re
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from pyrogram import filters
+from pyrogram.handlers import EditedMessageHandler, MessageHandler
+
+from .storage import SQLiteStorage
+
+logger = logging.getLogger(__name__)
+
+# Runs after the command and auto-response handlers, and never stops them
+ARCHIVE_GROUP = 20
+
+MIGRATIONS = {
+    'archive': [
+        (1, (
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " chat_id INTEGER NOT NULL, message_id INTEGER NOT NULL, date REAL NOT NULL,"
+            " sender_id INTEGER, sender TEXT NOT NULL, chat TEXT NOT NULL, outgoing INTEGER NOT NULL,"
+            " text TEXT NOT NULL, PRIMARY KEY (chat_id, message_id))",
+            "CREATE INDEX IF NOT EXISTS messages_date ON messages (date)",
+            # External-content index over messages.text, kept in step by triggers
+            "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5("
+            " text, content='messages', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')",
+            "CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN"
+            " INSERT INTO messages_fts (rowid, text) VALUES (new.rowid, new.text); END",
+            "CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN"
+            " INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.rowid, old.text); END",
+            "CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE OF text ON messages BEGIN"
+            " INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.rowid, old.text);"
+            " INSERT INTO messages_fts (rowid, text) VALUES (new.rowid, new.text); END",
+        )),
+    ]
+}
+
+_INSERT = (
+    "INSERT INTO messages (chat_id, message_id, date, sender_id, sender, chat, outgoing, text)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (chat_id, message_id) DO UPDATE SET text = excluded.text"
+)
+
+_TOKEN = re.compile(r'\w+\*?', re.UNICODE)
+
+
+class SearchResult(NamedTuple):
+    chat_id: int
+    message_id: int
+    date: float
+    sender: str
+    chat: str
+    snippet: str
+
+    @property
+    def link(self) -> Optional[str]:
+        """t.me link for supergroup and channel messages"""
+        chat = str(self.chat_id)
+        if chat.startswith('-100'):
+            return f"https://t.me/c/{chat[4:]}/{self.message_id}"
+        return None
+
+
+def build_query(text: str) -> str:
+    """
+    FTS5 query for free text: every word must match, ``word*`` matches a
+    prefix, and operators or punctuation cannot cause syntax errors
+    """
+    terms = []
+    for token in _TOKEN.findall(text):
+        word, star = token.rstrip('*'), token.endswith('*')
+        if word:
+            terms.append(f'"{word}"*' if star else f'"{word}"')
+    return ' '.join(terms)
+
+
+def _display_name(user) -> str:
+    if user is None:
+        return ''
+    return f"{user.first_name or ''} {user.last_name or ''}".strip() or user.username or str(user.id)
+
+
+class MessageArchive:
+    """
+    Full-text archive of incoming and outgoing messages
+
+    Handlers only queue an upsert on the storage writer thread, which
+    commits in batches; FTS5 triggers keep the index in step, and edits
+    replace the stored text. Searches run on the reader connection and are
+    ranked by bm25. Messages older than ``retention_days`` and all but the
+    newest ``max_per_chat`` of each chat are removed by purge().
+    """
+
+    def __init__(self, config, storage: Optional[SQLiteStorage] = None):
+        self.config = config
+        self.storage = storage or SQLiteStorage(
+            config.ARCHIVE_PATH,
+            batch_size=config.STORAGE_BATCH_SIZE,
+            flush_interval=config.STORAGE_FLUSH_INTERVAL,
+            migrations=MIGRATIONS
+        )
+        self.ingested = 0
+        self.searches = 0
+
+    # Ingestion --------------------------------------------------------------
+
+    async def ingest(self, client, message):
+        """Queue a message (handler callback)"""
+        text = message.text or message.caption
+        if not text:
+            return
+        # The owner's own commands are not worth keeping
+        if message.outgoing and text.startswith(self.config.COMMAND_PREFIX):
+            return
+
+        chat = message.chat
+        sender = message.from_user or message.sender_chat
+        self.storage.write(_INSERT, (
+            chat.id,
+            message.id,
+            message.date.timestamp() if message.date else time.time(),
+            sender.id if sender else None,
+            _display_name(message.from_user) if message.from_user else getattr(sender, 'title', '') or '',
+            chat.title or _display_name(chat),
+            int(bool(message.outgoing)),
+            str(text)
+        ))
+        self.ingested += 1
+
+    def register(self, client, group: int = ARCHIVE_GROUP):
+        """Archive new and edited text messages"""
+        archived = filters.text | filters.caption
+        client.add_handler(MessageHandler(self.ingest, archived), group)
+        client.add_handler(EditedMessageHandler(self.ingest, archived), group)
+
+    # Search -----------------------------------------------------------------
+
+    async def search(self, text: str, chat_id: Optional[int] = None, limit: int = 10,
+                     offset: int = 0) -> Tuple[List[SearchResult], bool]:
+        """
+        Ranked matches for free text
+
+        Returns:
+            (results, whether more results follow)
+        """
+        query = build_query(text)
+        if not query:
+            return [], False
+        self.searches += 1
+
+        sql = (
+            "SELECT m.chat_id, m.message_id, m.date, m.sender, m.chat,"
+            " snippet(messages_fts, 0, '**', '**', '…', 16)"
+            " FROM messages_fts JOIN messages m ON m.rowid = messages_fts.rowid"
+            " WHERE messages_fts MATCH ?"
+        )
+        params: list = [query]
+        if chat_id is not None:
+            sql += " AND m.chat_id = ?"
+            params.append(chat_id)
+        sql += " ORDER BY rank LIMIT ? OFFSET ?"
+        params += [limit + 1, offset]
+
+        rows = await self.storage.fetch(sql, params)
+        return [SearchResult(*row) for row in rows[:limit]], len(rows) > limit
+
+    async def count(self) -> int:
+        row = await self.storage.fetch_one("SELECT COUNT(*) FROM messages")
+        return row[0] if row else 0
+
+    # Retention --------------------------------------------------------------
+
+    def purge(self):
+        """Apply ARCHIVE_RETENTION_DAYS and ARCHIVE_MAX_PER_CHAT"""
+        if self.config.ARCHIVE_RETENTION_DAYS:
+            self.storage.write("DELETE FROM messages WHERE date < ?",
+                               (time.time() - self.config.ARCHIVE_RETENTION_DAYS * 86400,))
+        if self.config.ARCHIVE_MAX_PER_CHAT:
+            self.storage.write(
+                "DELETE FROM messages WHERE rowid IN ("
+                " SELECT rowid FROM (SELECT rowid, ROW_NUMBER() OVER"
+                " (PARTITION BY chat_id ORDER BY date DESC) AS position FROM messages)"
+                " WHERE position > ?)",
+                (self.config.ARCHIVE_MAX_PER_CHAT,)
+            )
+        # Merge index segments left behind by deletes and small batches
+        self.storage.write("INSERT INTO messages_fts (messages_fts) VALUES ('optimize')")
+
+    # Lifecycle --------------------------------------------------------------
+
+    async def start(self):
+        await self.storage.start()
+
+    async def close(self):
+        await self.storage.close()
+
+    def get_stats(self) -> dict:
+        return {
+            'ingested': self.ingested,
+            'searches': self.searches,
+            **self.storage.get_stats()
+        }
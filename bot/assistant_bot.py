@@ -9,25 +9,62 @@
 
 import asyncio
 import os
+import logging
 from pyrogram import Client, filters
 from pyrogram.types import Message, InlineQuery, InlineQueryResultArticle, InputTextMessageContent
 from pyrogram.types import BotCommand
-import aiohttp
 from .botfather_manager import BotFatherManager
+from .peer_cache import peer_cache
+from .uploads import upload_cache
+from .log_sampling import get_sampled_logger
+from .templates import CommandRegistry, ReplyTemplates, build_help_text
+from .inline_index import InlineAction, InlineIndex, registered_inline_actions
+from .counters import CounterService
+from .assistant_workers import (
+    AssistantWorkerPool, SharedCooldownStore, QueuedMessage, QueuedInlineQuery,
+    serialize_message, serialize_inline_query
+)
+
+logger = logging.getLogger(__name__)
+sampled_logger = get_sampled_logger(__name__)
+
+# Seconds between purges of expired rows in the shared cooldown table
+COOLDOWN_PURGE_INTERVAL = 600
+# Keys of the assistant's rows in the storage cooldowns table
+COOLDOWN_PREFIX = 'assistant:'
+
+# Public commands: name -> (help section, usage, description)
+ASSISTANT_COMMANDS = {
+    "start": ("📋 General", "", "Start the assistant bot"),
+    "help": ("📋 General", "", "Show available commands"),
+    "ping": ("📊 Information", "", "Check bot response time"),
+    "info": ("📊 Information", "", "Get bot information"),
+    "webshot": ("🛠️ Utilities", "<url>", "Take website screenshot")
+}
 
 class AssistantBot:
     """
     Assistant bot for Nexus Userbot - handles public commands, inline mode, and profile management
     """
     
-    def __init__(self, config, user_client):
+    def __init__(self, config, user_client, counters: CounterService = None, storage=None):
         self.config = config
         self.user_client = user_client
         self.bot_client = None
         self.cooldowns = {}
-        self.command_stats = {}
+        # Public command cooldowns are kept in its cooldowns table across restarts
+        self.storage = storage
+        # Shared with the userbot; assistant commands are counted as "/name"
+        self.counters = counters or CounterService()
         self.error_count = 0
         self.botfather_manager = None
+        self.worker_pool = None
+        self.cooldown_store = None
+        self._purge_task = None
+        self._inline_index = None
+        self._inline_index_version = -1
+        self.templates = ReplyTemplates(config)
+        self._register_templates()
         
     async def initialize_bot(self):
         """Initialize the assistant bot client"""
@@ -36,7 +73,7 @@ class AssistantBot:
             
         try:
             self.bot_client = Client(
-                "nexus_assistant",
+                self.config.ASSISTANT_SESSION_NAME,
                 bot_token=self.config.BOT_TOKEN,
                 api_id=self.config.API_ID,
                 api_hash=self.config.API_HASH
@@ -52,32 +89,43 @@ class AssistantBot:
                 await self._setup_via_botfather()
             
             await self.setup_bot_profile()
+            
+            # Optional worker processes for update handling
+            if self.config.ASSISTANT_WORKERS > 0:
+                self.cooldown_store = SharedCooldownStore(self.config.ASSISTANT_STATE_DB)
+                self.worker_pool = AssistantWorkerPool(self.config, self.config.ASSISTANT_WORKERS)
+                self.worker_pool.start()
+                self._purge_task = asyncio.get_running_loop().create_task(self._purge_cooldowns())
+            elif self.storage:
+                await self._load_cooldowns()
+            
             await self.setup_bot_handlers()
             await self.setup_bot_commands()
             
             return True
         except Exception as e:
-            print(f"Failed to initialize assistant bot: {e}")
+            logger.error(f"Failed to initialize assistant bot: {e}")
             return False
     
     async def _setup_via_botfather(self):
         """Setup bot profile via BotFather automatically"""
         try:
-            print("🤖 Setting up bot profile via BotFather...")
+            logger.info("Setting up bot profile via BotFather...")
             
             # Get bot username
-            bot_me = await self.bot_client.get_me()
+            bot_me = await peer_cache.get_me(self.bot_client)
             bot_username = bot_me.username
             
             if not bot_username:
-                print("❌ Bot username not found, skipping BotFather setup")
+                logger.warning("Bot username not found, skipping BotFather setup")
                 return
             
             # Run BotFather setup
             success = await self.botfather_manager.setup_bot_profile(bot_username)
+            peer_cache.invalidate_me(self.bot_client)
             
             if success:
-                print("✅ BotFather setup completed successfully")
+                logger.info("BotFather setup completed successfully")
                 
                 # Log to group if enabled
                 if self.config.ENABLE_LOG_GROUP:
@@ -93,10 +141,10 @@ class AssistantBot:
                         f"Bot is now fully configured via BotFather!"
                     )
             else:
-                print("❌ BotFather setup failed")
+                logger.error("BotFather setup failed")
                 
         except Exception as e:
-            print(f"BotFather setup error: {e}")
+            logger.error(f"BotFather setup error: {e}")
     
     async def setup_bot_profile(self):
         """Update bot profile automatically"""
@@ -104,7 +152,7 @@ class AssistantBot:
             return
             
         try:
-            bot_me = await self.bot_client.get_me()
+            bot_me = await peer_cache.get_me(self.bot_client)
             
             # Update bot name if different
             if bot_me.first_name != self.config.ASSISTANT_NAME:
@@ -112,6 +160,7 @@ class AssistantBot:
                     chat_id="me",
                     title=self.config.ASSISTANT_NAME
                 )
+                peer_cache.invalidate_me(self.bot_client)
             
             # Update bot description
             await self.bot_client.set_chat_description(
@@ -119,36 +168,29 @@ class AssistantBot:
                 description=self.config.ASSISTANT_DESCRIPTION
             )
             
-            # Update profile picture if exists
+            # Update profile picture if it exists and changed since it was last set
             if os.path.exists(self.config.ASSISTANT_PROFILE_PIC):
-                await self.bot_client.set_chat_photo(
-                    chat_id="me",
-                    photo=self.config.ASSISTANT_PROFILE_PIC
-                )
+                await upload_cache.set_chat_photo(self.bot_client, "me", self.config.ASSISTANT_PROFILE_PIC)
                 
-            print("✅ Bot profile updated successfully")
+            logger.info("Bot profile updated successfully")
             
         except Exception as e:
-            print(f"Failed to update bot profile: {e}")
+            logger.error(f"Failed to update bot profile: {e}")
     
     async def setup_bot_commands(self):
         """Setup bot commands menu"""
         try:
             commands = [
-                BotCommand("start", "Start the assistant bot"),
-                BotCommand("help", "Show available commands"),
-                BotCommand("ping", "Check bot response time"),
-                BotCommand("info", "Get bot information"),
-                BotCommand("webshot", "Take website screenshot"),
-                BotCommand("translate", "Translate text"),
-                BotCommand("stats", "Show bot statistics")
+                BotCommand(command, description)
+                for command, (_, _, description) in ASSISTANT_COMMANDS.items()
+                if command in self.command_handlers
             ]
             
             await self.bot_client.set_bot_commands(commands)
-            print("✅ Bot commands menu updated")
+            logger.info("Bot commands menu updated")
             
         except Exception as e:
-            print(f"Failed to setup bot commands: {e}")
+            logger.error(f"Failed to setup bot commands: {e}")
     
     async def log_to_group(self, message_type: str, content: str, user_info: str = ""):
         """Send logs to the configured log group"""
@@ -170,7 +212,7 @@ class AssistantBot:
 {content}
 
 **Stats:**
-• Commands: {sum(self.command_stats.values())}
+• Commands: {self.counters.grand_total}
 • Errors: {self.error_count}
             """
             
@@ -179,19 +221,17 @@ class AssistantBot:
                 text=log_message
             )
         except Exception as e:
-            print(f"Failed to log to group: {e}")
+            sampled_logger.error('log_group', "Failed to log to group: %s", e)
     
     async def track_command_usage(self, command: str, user_id: int, username: str = ""):
         """Track command usage and log if enabled"""
-        if command not in self.command_stats:
-            self.command_stats[command] = 0
-        self.command_stats[command] += 1
+        self.counters.record(f"/{command}", user_id)
         
         if self.config.LOG_ALL_COMMANDS:
             user_info = f"@{username} ({user_id})" if username else f"ID: {user_id}"
             await self.log_to_group(
                 "COMMAND", 
-                f"Command: /{command}\nUsage Count: {self.command_stats[command]}", 
+                f"Command: /{command}\nUsage Count: {self.counters.count('command', f'/{command}')}", 
                 user_info
             )
     
@@ -206,23 +246,42 @@ class AssistantBot:
     
     async def setup_bot_handlers(self):
         """Setup assistant bot message handlers"""
+        if self.worker_pool:
+            # Worker mode: this process only forwards updates, keyed by chat id
+            self.bot_client.on_message(filters.command(list(self.command_handlers)))(self._forward_message)
+            self.bot_client.on_inline_query()(self._forward_inline_query)
+            return
         
-        @self.bot_client.on_message(filters.command("start"))
-        async def start_command(client, message: Message):
-            try:
-                await self.track_command_usage("start", message.from_user.id, message.from_user.username)
-                
-                welcome_text = f"""
+        for command, handler in self.command_handlers.items():
+            self.bot_client.on_message(filters.command(command))(handler)
+        self.bot_client.on_inline_query()(self.inline_query_handler)
+    
+    @property
+    def command_handlers(self) -> dict:
+        """Public commands and the methods that handle them"""
+        return {
+            "start": self.start_command,
+            "help": self.help_command,
+            "ping": self.ping_command,
+            "info": self.info_command,
+            "webshot": self.webshot_command
+        }
+    
+    def _register_templates(self):
+        """Register the static /start and /help replies"""
+        def start_template(config):
+            commands = "\n".join(
+                f"• `/{command}{' ' + usage if usage else ''}` - {description}"
+                for command, (_, usage, description) in ASSISTANT_COMMANDS.items()
+                if command != "start"
+            )
+            return f"""
 🤖 **Welcome to Nexus Assistant!**
 
-I'm the assistant bot for **Nexus Userbot v2.0**
+I'm the assistant bot for **Nexus Userbot v{config.BOT_VERSION}**
 
 **🔧 Available Commands:**
-• `/help` - Show all commands
-• `/ping` - Check response time
-• `/info` - Bot information
-• `/webshot <url>` - Website screenshot
-• `/translate <text>` - Translate text
+{commands}
 
 **💡 Features:**
 • Public command access
@@ -231,63 +290,86 @@ I'm the assistant bot for **Nexus Userbot v2.0**
 • Real-time assistance
 
 **👨‍💻 Developer:** @nexustech_dev
-**🏷️ Version:** {self.config.BOT_VERSION}
+**🏷️ Version:** {config.BOT_VERSION}
 
 Type `/help` for detailed command information!
-                """
-                await message.reply(welcome_text)
-            except Exception as e:
-                await self.log_error(str(e), "start", f"@{message.from_user.username} ({message.from_user.id})")
-        
-        @self.bot_client.on_message(filters.command("help"))
-        async def help_command(client, message: Message):
-            help_text = """
-🤖 **Nexus Assistant Commands**
-
-**📊 Information:**
-• `/ping` - Check bot latency
-• `/info` - Detailed bot information
-• `/stats` - Usage statistics
-
-**🛠️ Utilities:**
-• `/webshot <url>` - Take website screenshot
-• `/translate <text>` - Translate text to English
-• `/echo <text>` - Echo your message
-
-**📱 Inline Mode:**
-Use `@your_bot_username <query>` in any chat:
-• `webshot:url` - Quick screenshot
-• `translate:text` - Quick translation
-• `ping` - Quick ping test
-
-**ℹ️ About:**
-This is the assistant bot for Nexus Userbot v2.0
-Created by @nexustech_dev
             """
-            await message.reply(help_text)
         
-        @self.bot_client.on_message(filters.command("ping"))
-        async def ping_command(client, message: Message):
-            if not self._check_cooldown(message.from_user.id, "ping"):
-                await message.reply("⏳ Please wait before using this command again")
-                return
-                
-            import time
-            start_time = time.time()
-            sent_message = await message.reply("🏓 Pinging...")
-            end_time = time.time()
+        def help_template(config):
+            registry = CommandRegistry()
+            for command, (section, usage, description) in ASSISTANT_COMMANDS.items():
+                registry.add(command, usage, description, section)
+            
+            inline_lines = "\n".join(
+                f"• `{action.keyword}{':text' if action.takes_argument else ''}` - {action.title}"
+                for action in self._builtin_inline_actions() + registered_inline_actions()[1]
+            )
+            return build_help_text(
+                "🤖 Nexus Assistant Commands",
+                "/",
+                registry,
+                footer=f"**📱 Inline Mode:**\n"
+                       f"Use `@{config.BOT_USERNAME or 'your_bot_username'} <query>` in any chat:\n"
+                       f"{inline_lines}\n\n"
+                       f"**ℹ️ About:**\n"
+                       f"This is the assistant bot for Nexus Userbot v{config.BOT_VERSION}\n"
+                       f"Created by @nexustech_dev"
+            )
+        
+        self.templates.register('start', start_template)
+        self.templates.register('help', help_template)
+    
+    async def _forward_message(self, client, message: Message):
+        """Hand a command off to the worker that owns this chat"""
+        self.worker_pool.dispatch(serialize_message(message))
+    
+    async def _forward_inline_query(self, client, query: InlineQuery):
+        """Hand an inline query off to the worker that owns this user"""
+        self.worker_pool.dispatch(serialize_inline_query(query))
+    
+    async def process_update(self, payload: dict):
+        """Run a forwarded update inside a worker process"""
+        if payload['kind'] == 'inline':
+            await self.inline_query_handler(self.bot_client, QueuedInlineQuery(self.bot_client, payload))
+            return
+        
+        handler = self.command_handlers.get(payload['command'])
+        if handler:
+            await handler(self.bot_client, QueuedMessage(self.bot_client, payload))
+    
+    async def start_command(self, client, message: Message):
+        try:
+            await self.track_command_usage("start", message.from_user.id, message.from_user.username)
             
-            ping_time = round((end_time - start_time) * 1000, 2)
-            await sent_message.edit(f"🏓 **Pong!**\n📶 **Latency:** {ping_time}ms")
+            welcome_text = self.templates.render('start')
+            await message.reply(welcome_text)
+        except Exception as e:
+            await self.log_error(str(e), "start", f"@{message.from_user.username} ({message.from_user.id})")
+    
+    async def help_command(self, client, message: Message):
+        help_text = self.templates.render('help')
+        await message.reply(help_text)
+    
+    async def ping_command(self, client, message: Message):
+        if not self._check_cooldown(message.from_user.id, "ping"):
+            await message.reply("⏳ Please wait before using this command again")
+            return
+            
+        import time
+        start_time = time.time()
+        sent_message = await message.reply("🏓 Pinging...")
+        end_time = time.time()
         
-        @self.bot_client.on_message(filters.command("info"))
-        async def info_command(client, message: Message):
-            if not self._check_cooldown(message.from_user.id, "info"):
-                await message.reply("⏳ Please wait before using this command again")
-                return
-                
-            bot_me = await client.get_me()
-            info_text = f"""
+        ping_time = round((end_time - start_time) * 1000, 2)
+        await sent_message.edit(f"🏓 **Pong!**\n📶 **Latency:** {ping_time}ms")
+    
+    async def info_command(self, client, message: Message):
+        if not self._check_cooldown(message.from_user.id, "info"):
+            await message.reply("⏳ Please wait before using this command again")
+            return
+            
+        bot_me = await peer_cache.get_me(client)
+        info_text = f"""
 🤖 **Nexus Assistant Information**
 
 **📋 Details:**
@@ -304,110 +386,112 @@ Created by @nexustech_dev
 
 **👨‍💻 Developer:** @nexustech_dev
 **🌐 Repository:** The-Nexus-Bot/Nexus-Userbot
-            """
-            await message.reply(info_text)
-        
-        @self.bot_client.on_message(filters.command("webshot"))
-        async def webshot_command(client, message: Message):
-            if not self._check_cooldown(message.from_user.id, "webshot"):
-                await message.reply("⏳ Please wait before using this command again")
-                return
-                
-            args = message.text.split()[1:]
-            if not args:
-                await message.reply("Usage: `/webshot <url>`\nExample: `/webshot https://google.com`")
-                return
-                
-            url = args[0]
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-                
-            await message.reply(f"📸 Taking screenshot of: {url}\n⏳ Please wait...")
-            
-            # Use a simple screenshot service
-            screenshot_url = f"https://api.screenshotone.com/take?url={url}&viewport_width=1920&viewport_height=1080&device_scale_factor=1&format=png"
-            
-            try:
-                await client.send_photo(
-                    chat_id=message.chat.id,
-                    photo=screenshot_url,
-                    caption=f"📸 **Screenshot**\n🔗 **URL:** {url}",
-                    reply_to_message_id=message.id
-                )
-            except:
-                await message.reply("❌ Failed to take screenshot. Please check the URL.")
-        
-        # Inline query handler
-        @self.bot_client.on_inline_query()
-        async def inline_query_handler(client, query: InlineQuery):
-            if not self.config.ENABLE_INLINE_MODE:
-                return
-                
-            query_text = query.query.lower()
-            results = []
+        """
+        await message.reply(info_text)
+    
+    async def webshot_command(self, client, message: Message):
+        if not self._check_cooldown(message.from_user.id, "webshot"):
+            await message.reply("⏳ Please wait before using this command again")
+            return
             
-            if query_text.startswith("webshot:"):
-                url = query_text.replace("webshot:", "").strip()
-                if url:
-                    results.append(
-                        InlineQueryResultArticle(
-                            title=f"📸 Screenshot: {url}",
-                            description="Take a screenshot of this website",
-                            input_message_content=InputTextMessageContent(
-                                f"📸 Taking screenshot of: {url}"
-                            )
-                        )
-                    )
+        args = message.text.split()[1:]
+        if not args:
+            await message.reply("Usage: `/webshot <url>`\nExample: `/webshot https://google.com`")
+            return
             
-            elif query_text.startswith("translate:"):
-                text = query_text.replace("translate:", "").strip()
-                if text:
-                    results.append(
-                        InlineQueryResultArticle(
-                            title=f"🌐 Translate: {text[:50]}...",
-                            description="Translate this text",
-                            input_message_content=InputTextMessageContent(
-                                f"🌐 Translating: {text}"
-                            )
-                        )
-                    )
+        url = args[0]
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
             
-            elif query_text == "ping":
-                results.append(
-                    InlineQueryResultArticle(
-                        title="🏓 Ping Test",
-                        description="Check bot response time",
-                        input_message_content=InputTextMessageContent("🏓 Pong! Bot is online and responsive")
+        await message.reply(f"📸 Taking screenshot of: {url}\n⏳ Please wait...")
+        
+        # Use a simple screenshot service
+        screenshot_url = f"https://api.screenshotone.com/take?url={url}&viewport_width=1920&viewport_height=1080&device_scale_factor=1&format=png"
+        
+        try:
+            await client.send_photo(
+                chat_id=message.chat.id,
+                photo=screenshot_url,
+                caption=f"📸 **Screenshot**\n🔗 **URL:** {url}",
+                reply_to_message_id=message.id
+            )
+        except:
+            await message.reply("❌ Failed to take screenshot. Please check the URL.")
+    
+    async def inline_query_handler(self, client, query: InlineQuery):
+        if not self.config.ENABLE_INLINE_MODE:
+            return
+        
+        results, next_offset, personal = self.inline_index.lookup(query.query, query.offset)
+        
+        await query.answer(
+            results,
+            cache_time=self.config.INLINE_CACHE_TIME,
+            is_personal=personal,
+            next_offset=next_offset
+        )
+    
+    @property
+    def inline_index(self) -> InlineIndex:
+        """Inline index over built-in and plugin actions, rebuilt when plugins add actions"""
+        version, plugin_actions = registered_inline_actions()
+        if self._inline_index is None or self._inline_index_version != version:
+            self._inline_index = InlineIndex(self._builtin_inline_actions() + plugin_actions)
+            self._inline_index_version = version
+            self.templates.invalidate()
+        return self._inline_index
+    
+    def _builtin_inline_actions(self) -> list:
+        """Inline actions provided by the assistant itself"""
+        def webshot_results(url):
+            return [
+                InlineQueryResultArticle(
+                    title=f"📸 Screenshot: {url}",
+                    description="Take a screenshot of this website",
+                    input_message_content=InputTextMessageContent(
+                        f"📸 Taking screenshot of: {url}"
                     )
                 )
-            
-            else:
-                # Default suggestions
-                results = [
-                    InlineQueryResultArticle(
-                        title="📸 Website Screenshot",
-                        description="Type: webshot:url",
-                        input_message_content=InputTextMessageContent("📸 Use: webshot:https://example.com")
-                    ),
-                    InlineQueryResultArticle(
-                        title="🌐 Text Translation",
-                        description="Type: translate:text",
-                        input_message_content=InputTextMessageContent("🌐 Use: translate:Hello world")
-                    ),
-                    InlineQueryResultArticle(
-                        title="🏓 Ping Test",
-                        description="Type: ping",
-                        input_message_content=InputTextMessageContent("🏓 Pong! Bot is responsive")
+            ]
+        
+        def translate_results(text):
+            return [
+                InlineQueryResultArticle(
+                    title=f"🌐 Translate: {text[:50]}...",
+                    description="Translate this text",
+                    input_message_content=InputTextMessageContent(
+                        f"🌐 Translating: {text}"
                     )
-                ]
-            
-            await query.answer(results, cache_time=self.config.INLINE_CACHE_TIME)
+                )
+            ]
+        
+        ping_result = [
+            InlineQueryResultArticle(
+                title="🏓 Ping Test",
+                description="Check bot response time",
+                input_message_content=InputTextMessageContent("🏓 Pong! Bot is online and responsive")
+            )
+        ]
+        
+        return [
+            InlineAction("webshot", "📸 Website Screenshot", "Type: webshot:url",
+                         "📸 Use: webshot:https://example.com", webshot_results),
+            InlineAction("translate", "🌐 Text Translation", "Type: translate:text",
+                         "🌐 Use: translate:Hello world", translate_results),
+            InlineAction("ping", "🏓 Ping Test", "Type: ping",
+                         "🏓 Pong! Bot is responsive", lambda _: ping_result,
+                         takes_argument=False)
+        ]
     
     def _check_cooldown(self, user_id: int, command: str) -> bool:
         """Check if user is on cooldown for command"""
         import time
         
         key = f"{user_id}:{command}"
+        
+        if self.cooldown_store:
+            return self.cooldown_store.check(key, self.config.PUBLIC_COMMAND_COOLDOWN)
+        
         current_time = time.time()
         
         if key in self.cooldowns:
@@ -415,10 +499,39 @@ Created by @nexustech_dev
                 return False
         
         self.cooldowns[key] = current_time
+        if self.storage:
+            self.storage.cooldown_set(f"{COOLDOWN_PREFIX}{key}", current_time + self.config.PUBLIC_COMMAND_COOLDOWN)
         return True
     
+    async def _load_cooldowns(self):
+        """Restore public command cooldowns that were still running at the last stop"""
+        try:
+            running = await self.storage.cooldown_items(COOLDOWN_PREFIX)
+        except Exception as e:
+            logger.error(f"Failed to restore assistant cooldowns: {e}")
+            return
+        for key, expires_at in running.items():
+            self.cooldowns[key[len(COOLDOWN_PREFIX):]] = expires_at - self.config.PUBLIC_COMMAND_COOLDOWN
+    
+    async def _purge_cooldowns(self, interval: float = COOLDOWN_PURGE_INTERVAL):
+        """Drop expired rows from the shared cooldown table now and then"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await loop.run_in_executor(None, self.cooldown_store.purge, self.config.PUBLIC_COMMAND_COOLDOWN)
+            except Exception as e:
+                logger.error(f"Failed to purge cooldowns: {e}")
+    
     async def stop_bot(self):
         """Stop the assistant bot"""
+        if self._purge_task:
+            self._purge_task.cancel()
+            self._purge_task = None
+        if self.worker_pool:
+            await self.worker_pool.stop()
+            self.worker_pool = None
+        
         if self.bot_client:
             await self.bot_client.stop()
-            print("Assistant bot stopped")
\ No newline at end of file
+            logger.info("Assistant bot stopped")
\ No newline at end of file
@@ -0,0 +1,317 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      NEXUS ASSISTANT WORKER PROCESSES                       ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import sqlite3
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Updates waiting per worker before new ones are dropped
+WORKER_QUEUE_SIZE = 1000
+# A worker that died is restarted at most this often
+RESTART_INTERVAL = 30.0
+
+
+def serialize_message(message) -> dict:
+    """Reduce a command message to the picklable fields the handlers use"""
+    user = message.from_user
+    return {
+        'kind': 'message',
+        'command': message.command[0].lower() if message.command else '',
+        'chat_id': message.chat.id,
+        'message_id': message.id,
+        'text': message.text or '',
+        'user_id': user.id if user else 0,
+        'username': user.username if user else None,
+        'first_name': user.first_name if user else None
+    }
+
+
+def serialize_inline_query(query) -> dict:
+    """Reduce an inline query to the picklable fields the handlers use"""
+    return {
+        'kind': 'inline',
+        'query_id': query.id,
+        'query': query.query,
+        'offset': query.offset,
+        'chat_id': query.from_user.id,
+        'user_id': query.from_user.id,
+        'username': query.from_user.username,
+        'first_name': query.from_user.first_name
+    }
+
+
+class QueuedMessage:
+    """
+    Message stand-in rebuilt inside a worker from a serialized update
+    Replies go out through the worker's own bot session.
+    """
+
+    def __init__(self, client, payload: dict):
+        self._client = client
+        self.id = payload['message_id']
+        self.text = payload['text']
+        self.chat = SimpleNamespace(id=payload['chat_id'])
+        self.from_user = SimpleNamespace(
+            id=payload['user_id'],
+            username=payload['username'],
+            first_name=payload['first_name']
+        )
+
+    async def reply(self, text: str, **kwargs):
+        """Reply to the original message"""
+        return await self._client.send_message(
+            self.chat.id, text, reply_to_message_id=self.id, **kwargs
+        )
+
+
+class QueuedInlineQuery:
+    """InlineQuery stand-in rebuilt inside a worker from a serialized update"""
+
+    def __init__(self, client, payload: dict):
+        self._client = client
+        self.id = payload['query_id']
+        self.query = payload['query']
+        self.offset = payload['offset']
+        self.from_user = SimpleNamespace(
+            id=payload['user_id'],
+            username=payload['username'],
+            first_name=payload['first_name']
+        )
+
+    async def answer(self, results, **kwargs):
+        """Answer the original inline query"""
+        return await self._client.answer_inline_query(self.id, results, **kwargs)
+
+
+class SharedCooldownStore:
+    """
+    Cooldown timestamps in a local SQLite file
+    Every worker process checks and claims cooldowns through one table, so a
+    user cannot dodge the limit by landing on a different worker.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cooldowns (key TEXT PRIMARY KEY, last_used REAL NOT NULL)"
+        )
+
+    def check(self, key: str, cooldown: float) -> bool:
+        """Claim the cooldown for key, returning False while it is still active"""
+        now = time.time()
+        try:
+            # Single atomic upsert: the row is only touched once the cooldown expired
+            cursor = self.conn.execute(
+                "INSERT INTO cooldowns (key, last_used) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_used = excluded.last_used "
+                "WHERE excluded.last_used - cooldowns.last_used >= ?",
+                (key, now, cooldown)
+            )
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logger.error(f"Cooldown store error: {e}")
+            return True
+
+    def purge(self, older_than: float):
+        """Drop cooldowns that expired more than older_than seconds ago"""
+        self.conn.execute("DELETE FROM cooldowns WHERE last_used < ?", (time.time() - older_than,))
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+class AssistantWorkerPool:
+    """
+    Local update queue in front of N assistant worker processes
+
+    Updates are routed by chat id, so all updates of one chat land on the
+    same worker in arrival order while different chats use different cores.
+    Each worker opens its own bot session with updates disabled and only
+    sends replies. A worker that died is restarted (at most every
+    RESTART_INTERVAL seconds); until then its chats go to a live worker.
+    Queues are bounded, so a stuck worker drops updates instead of growing.
+    """
+
+    def __init__(self, config, workers: int):
+        self.config = config
+        self.workers = max(1, workers)
+        self.queues: List = []
+        self.processes: List = []
+        self._context = multiprocessing.get_context('spawn')
+        self._env = dict(getattr(config, '_env', {}))
+        self._restarted: List[float] = []
+        self.restarts = 0
+        self.dropped = 0
+
+    def _spawn(self, index: int):
+        work_queue = self._context.Queue(maxsize=WORKER_QUEUE_SIZE)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, work_queue, self._env),
+            name=f"nexus-assistant-{index}",
+            daemon=True
+        )
+        process.start()
+        return work_queue, process
+
+    def start(self):
+        """Spawn the worker processes"""
+        for index in range(self.workers):
+            work_queue, process = self._spawn(index)
+            self.queues.append(work_queue)
+            self.processes.append(process)
+            self._restarted.append(time.monotonic())
+
+        logger.info(f"Started {self.workers} assistant worker processes")
+
+    def _alive(self, index: int) -> bool:
+        """Whether a worker runs, restarting a dead one when allowed"""
+        process = self.processes[index]
+        if process.is_alive():
+            return True
+        now = time.monotonic()
+        if now - self._restarted[index] < RESTART_INTERVAL:
+            return False
+        logger.error(f"Assistant worker {index} died (exit code {process.exitcode}), restarting")
+        self.queues[index].close()
+        self.queues[index], self.processes[index] = self._spawn(index)
+        self._restarted[index] = now
+        self.restarts += 1
+        return True
+
+    def dispatch(self, payload: dict):
+        """Queue an update on the worker that owns its chat, or on a live one"""
+        owner = int(payload.get('chat_id') or 0) % len(self.queues)
+        for offset in range(len(self.queues)):
+            index = (owner + offset) % len(self.queues)
+            if not self._alive(index):
+                continue
+            try:
+                self.queues[index].put_nowait(payload)
+                return
+            except queue.Full:
+                break
+        self.dropped += 1
+        logger.warning(f"Assistant update for chat {payload.get('chat_id')} dropped: no worker can take it")
+
+    async def stop(self, timeout: float = 10.0):
+        """Ask workers to drain and exit, killing any that do not"""
+        for work_queue in self.queues:
+            try:
+                work_queue.put_nowait(None)
+            except queue.Full:
+                pass
+
+        loop = asyncio.get_running_loop()
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                process.terminate()
+
+        self.queues.clear()
+        self.processes.clear()
+        logger.info("Assistant worker processes stopped")
+
+
+def _worker_main(index: int, work_queue, env: Dict[str, str]):
+    """Entry point of a worker process"""
+    from config import Config
+
+    from .log_pipeline import setup_logging
+
+    config = Config(env)
+    # Each worker rotates its own file; processes must not share one
+    setup_logging(config, file_suffix=f"worker{index}")
+    try:
+        asyncio.run(_worker_loop(index, work_queue, config))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _worker_loop(index: int, work_queue, config):
+    """Pull updates from the queue and run them through AssistantBot"""
+    from pyrogram import Client
+    from .assistant_bot import AssistantBot
+    from .counters import CounterService
+    from .storage import open_storage
+
+    client = Client(
+        f"{config.ASSISTANT_SESSION_NAME}_worker{index}",
+        bot_token=config.BOT_TOKEN,
+        api_id=config.API_ID,
+        api_hash=config.API_HASH,
+        in_memory=True,
+        no_updates=True
+    )
+    await client.start()
+
+    # Usage counts go to the same storage as the userbot's; flushes add deltas
+    storage = open_storage(config)
+    try:
+        await storage.start()
+    except Exception as e:
+        logger.error(f"Worker {index} has no storage, its command counts are lost: {e}")
+        storage = None
+    counters = CounterService(storage, flush_interval=config.COUNTER_FLUSH_INTERVAL)
+    await counters.start()
+
+    bot = AssistantBot(config, None, counters)
+    bot.bot_client = client
+    bot.cooldown_store = SharedCooldownStore(config.ASSISTANT_STATE_DB)
+
+    loop = asyncio.get_running_loop()
+    chat_locks: Dict[int, asyncio.Lock] = {}
+    chat_pending: Dict[int, int] = {}
+    pending = set()
+
+    async def run_in_order(payload: dict):
+        # asyncio.Lock wakes waiters in FIFO order, keeping per-chat ordering
+        chat_id = payload.get('chat_id') or 0
+        lock = chat_locks.setdefault(chat_id, asyncio.Lock())
+        chat_pending[chat_id] = chat_pending.get(chat_id, 0) + 1
+        try:
+            async with lock:
+                await bot.process_update(payload)
+        except Exception as e:
+            logger.error(f"Worker {index} failed to process update: {e}")
+        finally:
+            chat_pending[chat_id] -= 1
+            if not chat_pending[chat_id]:
+                del chat_pending[chat_id]
+                del chat_locks[chat_id]
+
+    logger.info(f"Assistant worker {index} ready")
+
+    while True:
+        payload: Optional[dict] = await loop.run_in_executor(None, work_queue.get)
+        if payload is None:
+            break
+        task = asyncio.create_task(run_in_order(payload))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    bot.cooldown_store.close()
+    await counters.stop()
+    if storage:
+        await storage.close()
+    await client.stop()
@@ -0,0 +1,610 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS BATCH CALCULATOR                              ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import ast
+import asyncio
+import logging
+import math
+import re
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .calculator import SafeCalculator, CalculationError, _BINARY_OPERATORS, _UNARY_OPERATORS, _FUNCTIONS
+from .streaming import send_long, split_markdown
+from .lazy import optional_import
+from .utils import BotUtils
+
+# Loaded on the first batch calculation; pure Python kernels are used without it
+np = optional_import('numpy')
+
+logger = logging.getLogger(__name__)
+
+_NUM = r'\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'
+# a..b and a..b..step ranges, rewritten to span(a, b, step) before parsing
+_RANGE = re.compile(rf'(?<![\w.])(-?{_NUM})\s*\.\.\s*(-?{_NUM})(?:\s*\.\.\s*({_NUM}))?')
+_TOKEN_SEPARATORS = re.compile(r'[\s,;|]+')
+_DATA_NAMES = re.compile(r'\b(?:data|c\d+)\b')
+_BATCH_HINTS = re.compile(r'\.\.|\bfor\b|\b(?:mean|std|var|median|percentile|count|prod|span)\s*\(')
+
+_AGGREGATES = ('sum', 'mean', 'std', 'var', 'median', 'min', 'max', 'prod', 'count', 'len', 'percentile')
+
+# Scalar functions that may be applied element-wise
+_VECTOR_FUNCTIONS = ('abs', 'round', 'sqrt', 'exp', 'log', 'log10', 'log2', 'sin', 'cos', 'tan',
+                     'asin', 'acos', 'atan', 'floor', 'ceil', 'radians', 'degrees', 'hypot',
+                     'gcd', 'pow')
+
+# Largest intermediate allowed in int64 kernels before switching to float64
+_INT_LIMIT = 2 ** 62
+
+SUMMARY = (
+    ('count', 'count({})'),
+    ('sum', 'sum({})'),
+    ('mean', 'mean({})'),
+    ('std', 'std({})'),
+    ('min', 'min({})'),
+    ('p50', 'median({})'),
+    ('p90', 'percentile({}, 90)'),
+    ('p99', 'percentile({}, 99)'),
+    ('max', 'max({})')
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Worker threads for batch evaluation (NumPy kernels release the GIL)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='nexus-calc')
+    return _executor
+
+
+def _number(text: str):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def rewrite_ranges(expression: str) -> str:
+    """Turn ``1..1e6`` style ranges into ``span()`` calls"""
+    def replace(match):
+        start, stop, step = match.groups()
+        args = [str(_number(start)), str(_number(stop))]
+        if step:
+            args.append(str(_number(step)))
+        return f"span({', '.join(args)})"
+    return _RANGE.sub(replace, expression)
+
+
+def parse_columns(text: str) -> List[List[float]]:
+    """
+    Parse pasted numbers into columns
+
+    Each line is split on whitespace, commas, semicolons or pipes; the numeric
+    tokens of a row form its columns and rows without numbers (headers,
+    labels) are skipped.
+    """
+    columns: List[List[float]] = []
+    for line in text.splitlines():
+        row = []
+        for token in _TOKEN_SEPARATORS.split(line.strip()):
+            try:
+                row.append(float(token))
+            except ValueError:
+                continue
+        for index, value in enumerate(row):
+            if index == len(columns):
+                columns.append([])
+            columns[index].append(value)
+    return columns
+
+
+class _PythonKernels:
+    """Element-wise kernels over lists of floats"""
+
+    name = 'Python'
+
+    def is_array(self, value) -> bool:
+        return isinstance(value, list)
+
+    def array(self, values) -> list:
+        return [float(v) for v in values]
+
+    def span(self, start, stop, step, count: int) -> list:
+        return [float(start + i * step) for i in range(count)]
+
+    def full(self, count: int, value) -> list:
+        return [value] * count
+
+    def length(self, values) -> int:
+        return len(values)
+
+    def preview(self, values, count: int) -> list:
+        return values[:count]
+
+    def select(self, values, mask) -> list:
+        return [v for v, keep in zip(values, mask) if keep]
+
+    def _broadcast(self, func, left, right) -> list:
+        if isinstance(left, list) and isinstance(right, list):
+            if len(left) != len(right):
+                raise CalculationError("Lists have different lengths")
+            return [func(a, b) for a, b in zip(left, right)]
+        if isinstance(left, list):
+            return [func(a, right) for a in left]
+        return [func(left, b) for b in right]
+
+    def binary(self, op_type, op, left, right) -> list:
+        return self._broadcast(op, left, right)
+
+    def compare(self, op, left, right) -> list:
+        return self._broadcast(op, left, right)
+
+    def logical_and(self, left, right) -> list:
+        return [a and b for a, b in zip(left, right)]
+
+    def unary(self, op, values) -> list:
+        return [op(v) for v in values]
+
+    def apply(self, name: str, args: list):
+        if name not in _VECTOR_FUNCTIONS:
+            raise CalculationError(f"{name}() does not accept lists")
+        func = _FUNCTIONS[name]
+        if len(args) == 1:
+            return [func(v) for v in args[0]]
+        left, right = args
+        return self._broadcast(func, left, right)
+
+    def aggregate(self, name: str, values, q=None):
+        if name in ('count', 'len'):
+            return len(values)
+        if not values:
+            raise CalculationError(f"{name}() of an empty list")
+        if name == 'sum':
+            return math.fsum(values)
+        if name == 'mean':
+            return statistics.fmean(values)
+        if name == 'std':
+            return statistics.pstdev(values)
+        if name == 'var':
+            return statistics.pvariance(values)
+        if name == 'median':
+            return statistics.median(values)
+        if name == 'min':
+            return min(values)
+        if name == 'max':
+            return max(values)
+        if name == 'prod':
+            return math.prod(values)
+        # percentile with linear interpolation, as numpy.percentile
+        ordered = sorted(values)
+        rank = (len(ordered) - 1) * q / 100
+        low = math.floor(rank)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class _NumpyKernels:
+    """Vectorized kernels backed by NumPy arrays"""
+
+    name = 'NumPy'
+
+    _FUNCTIONS = {
+        'abs': 'abs', 'round': 'round', 'sqrt': 'sqrt', 'exp': 'exp',
+        'log': 'log', 'log10': 'log10', 'log2': 'log2', 'sin': 'sin',
+        'cos': 'cos', 'tan': 'tan', 'asin': 'arcsin', 'acos': 'arccos',
+        'atan': 'arctan', 'floor': 'floor', 'ceil': 'ceil', 'radians': 'radians',
+        'degrees': 'degrees', 'hypot': 'hypot', 'gcd': 'gcd', 'pow': 'power'
+    }
+
+    _AGGREGATES = {
+        'sum': 'sum', 'mean': 'mean', 'std': 'std', 'var': 'var', 'median': 'median',
+        'min': 'min', 'max': 'max', 'prod': 'prod'
+    }
+
+    def is_array(self, value) -> bool:
+        return isinstance(value, np.ndarray)
+
+    def array(self, values):
+        return np.asarray(values, dtype=np.float64)
+
+    def span(self, start, stop, step, count: int):
+        if all(isinstance(v, int) for v in (start, step)):
+            return np.arange(count, dtype=np.int64) * step + start
+        return np.arange(count, dtype=np.float64) * step + start
+
+    def full(self, count: int, value):
+        return np.full(count, value)
+
+    def length(self, values) -> int:
+        return int(values.size)
+
+    def preview(self, values, count: int) -> list:
+        return values[:count].tolist()
+
+    def select(self, values, mask):
+        return values[mask]
+
+    @staticmethod
+    def _is_int(value) -> bool:
+        if isinstance(value, np.ndarray):
+            return value.dtype.kind in 'iu'
+        return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+    @staticmethod
+    def _max_abs(value) -> int:
+        if isinstance(value, np.ndarray):
+            # np.abs() of the int64 minimum wraps around to itself
+            return max(abs(int(value.min())), abs(int(value.max()))) if value.size else 0
+        return abs(int(value))
+
+    def _int_overflows(self, op_type, left, right) -> bool:
+        """Whether an int64 kernel could overflow; such ops are done in float64"""
+        a, b = self._max_abs(left), self._max_abs(right)
+        if op_type in (ast.Add, ast.Sub):
+            return a + b >= _INT_LIMIT
+        if op_type is ast.Mult:
+            return a * b >= _INT_LIMIT
+        if op_type is ast.Pow:
+            negative = np.any(np.asarray(right) < 0)
+            return bool(negative) or (a > 1 and b * math.log2(a) >= 62)
+        if op_type is ast.LShift:
+            return b + a.bit_length() >= 62
+        return False
+
+    def binary(self, op_type, op, left, right):
+        if self._is_int(left) and self._is_int(right) and self._int_overflows(op_type, left, right):
+            left = np.asarray(left, dtype=np.float64)
+            right = np.asarray(right, dtype=np.float64)
+        with np.errstate(all='ignore'):
+            return op(left, right)
+
+    def compare(self, op, left, right):
+        return op(left, right)
+
+    def logical_and(self, left, right):
+        return np.logical_and(left, right)
+
+    def unary(self, op, values):
+        return op(values)
+
+    def apply(self, name: str, args: list):
+        if name not in _VECTOR_FUNCTIONS:
+            raise CalculationError(f"{name}() does not accept lists")
+        func = self._FUNCTIONS[name]
+        if name == 'pow' and all(self._is_int(a) for a in args):
+            return self.binary(ast.Pow, np.power, *args)
+        if name == 'round' and len(args) == 2 and isinstance(args[1], (int, np.integer)):
+            values, digits = args
+            if self._is_int(values) and digits < -18:
+                # Rounding to 10**19 or more does not fit in int64
+                values = np.asarray(values, dtype=np.float64)
+            # float64 has no digits beyond 10**308 either way
+            args = [values, min(max(int(digits), -308), 308)]
+        if any(self._is_int(a) and self._max_abs(a) >= _INT_LIMIT for a in args):
+            if name == 'gcd':
+                raise CalculationError("gcd() of lists takes integers below 2**62")
+            # Out of the int64 kernels' range, wrapping around would give garbage
+            args = [np.asarray(a, dtype=np.float64) if self._is_int(a) else a for a in args]
+        with np.errstate(all='ignore'):
+            return getattr(np, func)(*args)
+
+    def aggregate(self, name: str, values, q=None):
+        if name in ('count', 'len'):
+            return int(values.size)
+        if not values.size:
+            raise CalculationError(f"{name}() of an empty list")
+        if name == 'sum' and values.dtype.kind in 'iu' and self._max_abs(values) * values.size >= _INT_LIMIT:
+            values = values.astype(np.float64)
+        if name == 'prod':
+            values = values.astype(np.float64)
+        with np.errstate(all='ignore'):
+            if name == 'percentile':
+                return np.percentile(values, q).item()
+            return getattr(np, self._AGGREGATES[name])(values).item()
+
+
+class BatchCalculator(SafeCalculator):
+    """
+    SafeCalculator extended with lists, ranges and statistics
+
+    ``a..b`` ranges, list literals, pasted data columns and generator
+    expressions evaluate to arrays. Arithmetic over arrays runs element-wise
+    through NumPy kernels when NumPy is installed, otherwise through pure
+    Python loops with a lower element limit.
+    """
+
+    def __init__(self, variables: Optional[Dict[str, Any]] = None,
+                 max_elements: int = 10_000_000, **kwargs):
+        super().__init__(**kwargs)
+        self.kernels = _NumpyKernels() if np is not None else _PythonKernels()
+        # Pure Python loops are ~100x slower than NumPy kernels
+        self.max_elements = max_elements if np is not None else min(max_elements, 1_000_000)
+        self.variables = dict(variables or {})
+
+    @classmethod
+    def load_variables(cls, data_text: str) -> Dict[str, Any]:
+        """Parse pasted data into ``data`` (all numbers) and ``c1..cN`` columns"""
+        kernels = _NumpyKernels() if np is not None else _PythonKernels()
+        columns = parse_columns(data_text)
+        variables = {f"c{i}": kernels.array(column) for i, column in enumerate(columns, 1)}
+        if columns:
+            variables['data'] = kernels.array([v for column in columns for v in column]) \
+                if len(columns) > 1 else variables['c1']
+        return variables
+
+    def evaluate(self, expression: str):
+        return super().evaluate(rewrite_ranges(expression))
+
+    def _is_array(self, value) -> bool:
+        return self.kernels.is_array(value)
+
+    def _eval(self, node):
+        if isinstance(node, ast.Name) and node.id in self.variables:
+            self._tick()
+            return self.variables[node.id]
+
+        if isinstance(node, (ast.List, ast.Tuple)):
+            self._tick()
+            values = [self._eval(element) for element in node.elts]
+            if any(self._is_array(v) for v in values):
+                raise CalculationError("Nested lists are not supported")
+            return self.kernels.array(values)
+
+        if isinstance(node, (ast.GeneratorExp, ast.ListComp)):
+            self._tick()
+            return self._comprehension(node)
+
+        if isinstance(node, ast.Compare):
+            self._tick()
+            return self._compare(node)
+
+        if isinstance(node, ast.BinOp):
+            op = _BINARY_OPERATORS.get(type(node.op))
+            if op is None:
+                raise CalculationError("Operator not allowed")
+            self._tick()
+            left = self._eval(node.left)
+            right = self._eval(node.right)
+            if self._is_array(left) or self._is_array(right):
+                return self.kernels.binary(type(node.op), op, left, right)
+            self._check_binary(type(node.op), left, right)
+            return self._check_int(op(left, right))
+
+        if isinstance(node, ast.UnaryOp):
+            op = _UNARY_OPERATORS.get(type(node.op))
+            if op is None:
+                raise CalculationError("Operator not allowed")
+            self._tick()
+            operand = self._eval(node.operand)
+            if self._is_array(operand):
+                return self.kernels.unary(op, operand)
+            return op(operand)
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            return self._call(node)
+
+        return super()._eval(node)
+
+    def _call(self, node):
+        name = node.func.id
+        if name != 'span' and name not in _AGGREGATES and name not in _FUNCTIONS:
+            raise CalculationError("Function not allowed")
+        if node.keywords:
+            raise CalculationError("Keyword arguments are not allowed")
+
+        self._tick()
+        args = [self._eval(arg) for arg in node.args]
+
+        if name == 'span':
+            return self._span(*args)
+
+        arrays = [self._is_array(a) for a in args]
+        if name in _AGGREGATES and len(args) in (1, 2) and arrays[0] and not any(arrays[1:]):
+            if name == 'percentile':
+                if len(args) != 2 or not 0 <= args[1] <= 100:
+                    raise CalculationError("Usage: percentile(values, 0-100)")
+                return self.kernels.aggregate(name, args[0], args[1])
+            if len(args) == 1:
+                return self.kernels.aggregate(name, args[0])
+
+        if name not in _FUNCTIONS:
+            raise CalculationError(f"{name}() needs a list")
+
+        if any(arrays):
+            if len(args) not in (1, 2):
+                raise CalculationError(f"{name}() takes one or two lists")
+            return self.kernels.apply(name, args)
+
+        self._check_call(name, args)
+        return self._check_int(_FUNCTIONS[name](*args))
+
+    def _span(self, start=None, stop=None, step=1):
+        if stop is None or any(self._is_array(v) for v in (start, stop, step)):
+            raise CalculationError("Usage: span(start, stop[, step]) or start..stop")
+        if step == 0:
+            raise CalculationError("Range step cannot be zero")
+        if start > stop and step > 0:
+            step = -step
+
+        count = max(0, math.floor((stop - start) / step + 1e-9) + 1)
+        if count > self.max_elements:
+            raise CalculationError(f"Range too large (max {self.max_elements:,} values)")
+        return self.kernels.span(start, stop, step, count)
+
+    def _comprehension(self, node):
+        if len(node.generators) != 1:
+            raise CalculationError("Only one 'for' per expression is supported")
+        generator = node.generators[0]
+        if not isinstance(generator.target, ast.Name) or generator.is_async:
+            raise CalculationError("Loop variable must be a plain name")
+
+        name = generator.target.id
+        values = self._eval(generator.iter)
+        if not self._is_array(values):
+            raise CalculationError("Can only loop over a list or range")
+
+        shadowed = self.variables.get(name)
+        try:
+            self.variables[name] = values
+            for condition in generator.ifs:
+                mask = self._eval(condition)
+                if not self._is_array(mask):
+                    mask = self.kernels.full(self.kernels.length(values), bool(mask))
+                values = self.kernels.select(values, mask)
+                self.variables[name] = values
+
+            result = self._eval(node.elt)
+            if not self._is_array(result):
+                result = self.kernels.full(self.kernels.length(values), result)
+            return result
+        finally:
+            if shadowed is None:
+                self.variables.pop(name, None)
+            else:
+                self.variables[name] = shadowed
+
+    def _compare(self, node):
+        operators = {
+            ast.Lt: lambda a, b: a < b, ast.LtE: lambda a, b: a <= b,
+            ast.Gt: lambda a, b: a > b, ast.GtE: lambda a, b: a >= b,
+            ast.Eq: lambda a, b: a == b, ast.NotEq: lambda a, b: a != b
+        }
+        left = self._eval(node.left)
+        result = None
+        for op_node, right_node in zip(node.ops, node.comparators):
+            op = operators.get(type(op_node))
+            if op is None:
+                raise CalculationError("Comparison not allowed")
+            right = self._eval(right_node)
+            if self._is_array(left) or self._is_array(right):
+                current = self.kernels.compare(op, left, right)
+            else:
+                current = op(left, right)
+
+            if result is None:
+                result = current
+            elif self._is_array(result) or self._is_array(current):
+                result = self.kernels.logical_and(result, current)
+            else:
+                result = result and current
+            left = right
+        return result
+
+    def format_value(self, value) -> str:
+        """Format a scalar or a short preview of an array"""
+        if self._is_array(value):
+            count = self.kernels.length(value)
+            preview = ", ".join(self.format_value(v) for v in self.kernels.preview(value, 5))
+            more = ", …" if count > 5 else ""
+            return f"[{preview}{more}] ({count:,} values)"
+        if isinstance(value, float):
+            if value.is_integer() and abs(value) < 1e15:
+                return str(int(value))
+            return f"{value:.10g}"
+        return str(value)
+
+
+def _evaluate_line(expression: str, variables: Dict[str, Any], limits: Dict[str, Any]) -> str:
+    """Worker thread job: evaluate one expression and format the result"""
+    calculator = BatchCalculator(variables, **limits)
+    return calculator.format_value(calculator.evaluate(expression))
+
+
+def is_batch_request(expression: str, data_text: str = "") -> bool:
+    """Whether a .calc call needs the batch calculator"""
+    return bool(data_text.strip()) or bool(_BATCH_HINTS.search(expression)) \
+        or bool(_DATA_NAMES.search(expression))
+
+
+async def read_batch_input(message, config) -> Tuple[str, str]:
+    """
+    Split a .calc message into its expression and data text
+
+    Lines after the command are pasted data. Without pasted data, a replied
+    message or document supplies it when the expression is empty or refers
+    to ``data``/``cN``.
+    """
+    text = message.text or ""
+    first_line, _, data_text = text.partition("\n")
+    parts = first_line.split(None, 1)
+    expression = parts[1].strip() if len(parts) > 1 else ""
+
+    reply = message.reply_to_message
+    if data_text.strip() or not reply or (expression and not _DATA_NAMES.search(expression)):
+        return expression, data_text
+
+    if reply.document:
+        if (reply.document.file_size or 0) > config.CALC_MAX_DOCUMENT_SIZE:
+            raise CalculationError(
+                f"Document too large (max {BotUtils.format_bytes(config.CALC_MAX_DOCUMENT_SIZE)})"
+            )
+        buffer = await message._client.download_media(reply, in_memory=True)
+        return expression, bytes(buffer.getbuffer()).decode('utf-8', errors='ignore')
+
+    return expression, reply.text or reply.caption or ""
+
+
+async def stream_batch(message, expression: str, data_text: str, config):
+    """
+    Evaluate a batch request in worker threads, streaming results
+
+    Several expressions can be separated with ``;``. Without an expression a
+    summary of every data column is produced. The message is edited as
+    results arrive (at most once a second) and the final text is split into
+    pages.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    backend = _NumpyKernels if np is not None else _PythonKernels
+    header = f"**🧮 Batch Calculator** ({backend.name})"
+
+    try:
+        variables = await loop.run_in_executor(executor, BatchCalculator.load_variables, data_text)
+    except Exception as e:
+        await message.edit_text(f"❌ **Calculation Error:**\n`{e}`")
+        return
+
+    columns = sorted((name for name in variables if name != 'data'), key=lambda n: int(n[1:]))
+    header += f"\n**Data:** {len(columns)} column(s)" if columns else ""
+
+    if expression:
+        jobs = [(line.strip(), line.strip()) for line in expression.split(';') if line.strip()]
+    elif columns:
+        jobs = [(f"{column} {label}", template.format(column))
+                for column in columns[:5] for label, template in SUMMARY]
+    else:
+        await message.edit_text("❌ **Usage:** `.calc <expression>` or reply to numbers with `.calc`")
+        return
+
+    limits = {
+        'max_elements': config.CALC_MAX_ELEMENTS,
+        'time_budget': config.CALC_BATCH_TIME_BUDGET,
+        'max_digits': config.CALC_MAX_DIGITS
+    }
+
+    lines = [header, ""]
+    last_edit = time.monotonic()
+    for index, (label, job) in enumerate(jobs):
+        try:
+            result = await loop.run_in_executor(executor, _evaluate_line, job, variables, limits)
+            lines.append(f"`{label}` = `{result}`")
+        except CalculationError as e:
+            lines.append(f"`{label}` ❌ {e}")
+        except Exception as e:
+            logger.error(f"Batch calculation failed for {job}: {e}")
+            lines.append(f"`{label}` ❌ Calculation failed")
+
+        now = time.monotonic()
+        if index < len(jobs) - 1 and now - last_edit >= 1.0:
+            await message.edit_text(split_markdown("\n".join(lines), config.MAX_MESSAGE_LENGTH)[0])
+            last_edit = now
+
+    await send_long(message, "\n".join(lines))
@@ -13,7 +13,11 @@ import os
 from pyrogram.types import Message
 from pyrogram.errors import RPCError
 
+from .log_sampling import get_sampled_logger
+from .uploads import upload_cache
+
 logger = logging.getLogger(__name__)
+sampled_logger = get_sampled_logger(__name__)
 
 class BotFatherManager:
     """
@@ -58,7 +62,7 @@ class BotFatherManager:
         try:
             await self.user_client.send_message(self.botfather_id, command)
             await asyncio.sleep(wait_time)
-            logger.info(f"Sent BotFather command: {command}")
+            sampled_logger.info('botfather', "Sent BotFather command: %s", command)
             return True
         except Exception as e:
             logger.error(f"Failed to send BotFather command '{command}': {e}")
@@ -77,8 +81,10 @@ class BotFatherManager:
             await self._send_botfather_command("/setuserpic")
             await self._send_botfather_command(f"@{self.bot_username}")
             
-            # Send the profile picture
-            await self.user_client.send_photo(
+            # Send the profile picture (reuses the earlier upload when unchanged)
+            await upload_cache.send(
+                self.user_client,
+                'photo',
                 self.botfather_id,
                 self.config.ASSISTANT_PROFILE_PIC,
                 caption="New profile picture for the bot"
@@ -0,0 +1,333 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS SAFE CALCULATOR                               ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import ast
+import asyncio
+import logging
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+
+from .lazy import lazy_import
+
+# Only needed when CALC_SUBPROCESS is enabled
+multiprocessing = lazy_import('multiprocessing')
+
+logger = logging.getLogger(__name__)
+
+
+class CalculationError(ValueError):
+    """Raised for invalid, disallowed or too expensive expressions"""
+
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+    ast.Invert: operator.invert
+}
+
+_CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e,
+    'tau': math.tau,
+    'inf': math.inf
+}
+
+_FUNCTIONS = {
+    'abs': abs,
+    'round': round,
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'pow': pow,
+    'sqrt': math.sqrt,
+    'exp': math.exp,
+    'log': math.log,
+    'log10': math.log10,
+    'log2': math.log2,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'asin': math.asin,
+    'acos': math.acos,
+    'atan': math.atan,
+    'floor': math.floor,
+    'ceil': math.ceil,
+    'factorial': math.factorial,
+    'gcd': math.gcd,
+    'hypot': math.hypot,
+    'radians': math.radians,
+    'degrees': math.degrees
+}
+
+_LOG2_10 = math.log2(10)
+
+
+class SafeCalculator:
+    """
+    AST based arithmetic evaluator
+
+    Only numeric literals, whitelisted operators, constants and functions are
+    accepted. Every operation is counted and checked against a time budget,
+    and integer results are bounded in size before they are computed, so an
+    expression like ``9**9**9`` is rejected instead of pinning the CPU.
+    """
+
+    def __init__(self, max_digits: int = 1000, max_operations: int = 10000,
+                 time_budget: float = 0.5, max_length: int = 500,
+                 use_subprocess: bool = False, cache_size: int = 256, max_items: int = 10000):
+        self.max_digits = max_digits
+        self.max_bits = int(max_digits * _LOG2_10) + 1
+        self.max_operations = max_operations
+        self.time_budget = time_budget
+        self.max_length = max_length
+        self.max_items = max_items
+        self.use_subprocess = use_subprocess
+        self.cache_size = cache_size
+        self.cache: 'OrderedDict[str, Any]' = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config) -> 'SafeCalculator':
+        """Create a calculator with limits from Config"""
+        return cls(
+            max_digits=config.CALC_MAX_DIGITS,
+            time_budget=config.CALC_TIME_BUDGET,
+            use_subprocess=config.CALC_SUBPROCESS
+        )
+
+    def _limits(self) -> Dict[str, Any]:
+        return {
+            'max_digits': self.max_digits,
+            'max_operations': self.max_operations,
+            'time_budget': self.time_budget,
+            'max_length': self.max_length,
+            'max_items': self.max_items
+        }
+
+    # Evaluation
+
+    def evaluate(self, expression: str):
+        """Evaluate an expression in the current thread"""
+        expression = expression.strip()
+        if not expression:
+            raise CalculationError("Empty expression")
+        if len(expression) > self.max_length:
+            raise CalculationError(f"Expression too long (max {self.max_length} characters)")
+
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError:
+            raise CalculationError("Invalid expression")
+
+        self._operations = 0
+        self._deadline = time.monotonic() + self.time_budget
+
+        try:
+            return self._eval(tree.body)
+        except CalculationError:
+            raise
+        except ZeroDivisionError:
+            raise CalculationError("Division by zero")
+        except (OverflowError, MemoryError):
+            raise CalculationError("Result too large")
+        except (TypeError, ValueError) as e:
+            raise CalculationError(str(e))
+
+    def _tick(self):
+        self._operations += 1
+        if self._operations > self.max_operations:
+            raise CalculationError("Expression too complex")
+        if time.monotonic() > self._deadline:
+            raise CalculationError("Calculation took too long")
+
+    def _check_int(self, value):
+        if isinstance(value, int) and value.bit_length() > self.max_bits:
+            raise CalculationError(f"Result exceeds {self.max_digits} digits")
+        return value
+
+    def _eval(self, node):
+        self._tick()
+
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float, complex)):
+                raise CalculationError("Only numbers are allowed")
+            return self._check_int(node.value)
+
+        if isinstance(node, ast.Name):
+            if node.id in _CONSTANTS:
+                return _CONSTANTS[node.id]
+            raise CalculationError(f"Unknown name: {node.id}")
+
+        if isinstance(node, ast.UnaryOp):
+            op = _UNARY_OPERATORS.get(type(node.op))
+            if op is None:
+                raise CalculationError("Operator not allowed")
+            return op(self._eval(node.operand))
+
+        if isinstance(node, ast.BinOp):
+            op = _BINARY_OPERATORS.get(type(node.op))
+            if op is None:
+                raise CalculationError("Operator not allowed")
+            left = self._eval(node.left)
+            right = self._eval(node.right)
+            self._check_binary(type(node.op), left, right)
+            return self._check_int(op(left, right))
+
+        if isinstance(node, (ast.Tuple, ast.List)):
+            return [self._eval(element) for element in node.elts]
+
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS:
+                raise CalculationError("Function not allowed")
+            if node.keywords:
+                raise CalculationError("Keyword arguments are not allowed")
+            name = node.func.id
+            args = [self._eval(arg) for arg in node.args]
+            self._check_call(name, args)
+            return self._check_int(_FUNCTIONS[name](*args))
+
+        raise CalculationError("Unsupported syntax")
+
+    def _size(self, value) -> int:
+        """Items in a list, nested ones included (a sublist repeated n times counts n times)"""
+        if isinstance(value, (list, tuple)):
+            return len(value) + sum(self._size(item) for item in value)
+        return 0
+
+    def _check_sequence(self, op_type, left, right):
+        """Reject list repetition and concatenation beyond the item limit"""
+        sequences = (list, tuple)
+        if op_type is ast.Mult:
+            sequence, times = (left, right) if isinstance(left, sequences) else (right, left)
+            if not isinstance(times, int):
+                return
+            items = self._size(sequence) * max(times, 0)
+        elif op_type is ast.Add and isinstance(left, sequences) and isinstance(right, sequences):
+            items = self._size(left) + self._size(right)
+        else:
+            return
+        if items > self.max_items:
+            raise CalculationError(f"Result exceeds {self.max_items} list items")
+
+    def _check_binary(self, op_type, left, right):
+        """Reject integer operations whose result would exceed the digit limit"""
+        if isinstance(left, (list, tuple)) or isinstance(right, (list, tuple)):
+            self._check_sequence(op_type, left, right)
+            return
+        if not (isinstance(left, int) and isinstance(right, int)):
+            return
+
+        if op_type is ast.Pow:
+            if right > 0 and abs(left) > 1 and right * math.log2(abs(left)) > self.max_bits:
+                raise CalculationError(f"Result exceeds {self.max_digits} digits")
+        elif op_type is ast.Mult:
+            if left.bit_length() + right.bit_length() > self.max_bits + 1:
+                raise CalculationError(f"Result exceeds {self.max_digits} digits")
+        elif op_type is ast.LShift:
+            if right > self.max_bits:
+                raise CalculationError(f"Result exceeds {self.max_digits} digits")
+
+    def _check_call(self, name: str, args: list):
+        if name == 'pow' and len(args) == 2:
+            self._check_binary(ast.Pow, args[0], args[1])
+        elif name == 'factorial' and args and isinstance(args[0], int):
+            # log10(n!) ~ n*log10(n/e); n = 450 is already ~1000 digits
+            n = args[0]
+            if n > 1 and n * math.log10(n / math.e) > self.max_digits:
+                raise CalculationError(f"Result exceeds {self.max_digits} digits")
+        elif name == 'round' and len(args) == 2 and isinstance(args[1], int):
+            # round(x, -n) builds 10**n internally, whatever x is
+            if abs(args[1]) > self.max_digits:
+                raise CalculationError(f"round() digits exceed {self.max_digits}")
+
+    # Entry point used by commands
+
+    async def calculate(self, expression: str):
+        """
+        Evaluate an expression, memoizing results
+
+        With use_subprocess the work runs in a separate process that is
+        killed when it overruns the time budget; otherwise the bounded
+        evaluator runs inline.
+        """
+        key = expression.strip()
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        if self.use_subprocess:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self._evaluate_in_subprocess, key)
+        else:
+            result = self.evaluate(key)
+
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    def _evaluate_in_subprocess(self, expression: str):
+        """Run evaluate() in a child process with a hard kill on timeout"""
+        context = multiprocessing.get_context('spawn')
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_subprocess_evaluate,
+            args=(child_conn, expression, self._limits()),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            # Allow for interpreter start-up on top of the evaluation budget
+            if not parent_conn.poll(self.time_budget + 5.0):
+                logger.warning(f"Killing calculator process for: {expression[:50]}")
+                raise CalculationError("Calculation took too long")
+            ok, value = parent_conn.recv()
+        except EOFError:
+            raise CalculationError("Calculation failed")
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join(1)
+            parent_conn.close()
+
+        if not ok:
+            raise CalculationError(value)
+        return value
+
+
+def _subprocess_evaluate(conn, expression: str, limits: Dict[str, Any]):
+    """Child process entry point"""
+    try:
+        result = SafeCalculator(**limits).evaluate(expression)
+        conn.send((True, result))
+    except CalculationError as e:
+        conn.send((False, str(e)))
+    except Exception as e:
+        conn.send((False, f"Calculation failed: {e}"))
+    finally:
+        conn.close()
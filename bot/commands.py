@@ -11,35 +11,69 @@
 
 import asyncio
 import time
-import psutil
-import platform
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Callable
 from pyrogram.types import Message
-from pyrogram.errors import MessageTooLong
 
 from .utils import BotUtils
-from .fingerprint import SystemFingerprint
+from .templates import CommandRegistry, ReplyTemplates, build_help_text
+from .streaming import send_long
+from .log_sampling import get_sampled_logger
+from .peer_cache import peer_cache
+from .calculator import SafeCalculator, CalculationError
+from .batch_calc import is_batch_request, read_batch_input, stream_batch
+from .counters import CounterService
+from .lazy import lazy_import, optional_import
+
+# System modules are loaded by the first command that reports on the host
+psutil = lazy_import('psutil')
+platform = lazy_import('platform')
+fingerprint = optional_import(f'{__package__}.fingerprint')
 
 logger = logging.getLogger(__name__)
+sampled_logger = get_sampled_logger(__name__)
+
+HELP_SECTIONS = [
+    '📋 Basic Commands',
+    '🖥️ System Commands',
+    '🛠️ Utility Commands',
+    '⚡ Nexus Commands'
+]
+
+# command -> (help section, usage, description)
+COMMAND_HELP = {
+    'help': ('📋 Basic Commands', '[command]', 'Show this help or help for one command'),
+    'ping': ('📋 Basic Commands', '', 'Check bot latency and status'),
+    'info': ('📋 Basic Commands', '', 'Show detailed bot information'),
+    'stats': ('📋 Basic Commands', '', 'Display usage statistics'),
+    'uptime': ('📋 Basic Commands', '', 'Show bot uptime'),
+    'sys': ('🖥️ System Commands', '', 'System information'),
+    'echo': ('🛠️ Utility Commands', '<text>', 'Echo the provided text'),
+    'calc': ('🛠️ Utility Commands', '<expression>', 'Calculate expressions, ranges and stats over numbers'),
+    'time': ('🛠️ Utility Commands', '', 'Show current time'),
+    'nexus': ('⚡ Nexus Commands', '', 'Show Nexus branding information')
+}
 
 class CommandManager:
     """
     Manages all bot commands and their execution
     """
     
-    def __init__(self, client, config):
+    def __init__(self, client, config, counters: CounterService = None):
         self.client = client
         self.config = config
         self.utils = BotUtils()
-        self.fingerprint = SystemFingerprint()
+        self._fingerprint = None
         self.commands: Dict[str, Callable] = {}
-        self.command_stats: Dict[str, int] = {}
+        self.counters = counters or CounterService()
         self.command_aliases: Dict[str, str] = {}
+        self.templates = ReplyTemplates(config)
+        self.calculator = SafeCalculator.from_config(config)
         
         # Register all commands
         self._register_commands()
+        self._register_templates()
         
         # Store start time for uptime calculations
         self.start_time = datetime.now()
@@ -88,6 +122,13 @@ class CommandManager:
         
         logger.info(f"Registered {len(self.commands)} commands with {len(self.command_aliases)} aliases")
     
+    @property
+    def fingerprint(self):
+        """System fingerprint, created on first use (None when unavailable)"""
+        if self._fingerprint is None and fingerprint is not None:
+            self._fingerprint = fingerprint.SystemFingerprint()
+        return self._fingerprint
+    
     async def handle_command(self, message: Message):
         """Handle incoming commands"""
         try:
@@ -116,8 +157,9 @@ class CommandManager:
             
             # Log command usage
             if self.config.ENABLE_COMMAND_LOGGING:
-                self.command_stats[command] = self.command_stats.get(command, 0) + 1
-                logger.info(f"Command executed: {command} (args: {args})")
+                self.counters.record(command, message.from_user.id if message.from_user else None,
+                                     message.chat.id)
+                sampled_logger.info(command, "Command executed: %s (args: %s)", command, args)
             
             # Execute command
             await self.commands[command](message, args)
@@ -135,49 +177,12 @@ class CommandManager:
             # Show help for specific command
             command = args[0]
             help_text = f"**🔧 Command: {self.config.COMMAND_PREFIX}{command}**\n\n"
-            
-            # Add command-specific help here
-            command_help = {
-                'ping': 'Check bot latency and status',
-                'info': 'Show detailed bot information',
-                'stats': 'Display usage statistics',
-                'uptime': 'Show bot uptime',
-                'sys': 'System information',
-                'echo': 'Echo the provided text',
-                'calc': 'Calculate mathematical expressions',
-                'time': 'Show current time',
-                'nexus': 'Show Nexus branding information'
-            }
-            
-            help_text += command_help.get(command, 'No detailed help available for this command.')
-            
-        else:
-            # Show general help
-            help_text = f"""
-**🤖 Nexus Userbot v{self.config.BOT_VERSION} - Command Help**
-
-**📋 Basic Commands:**
-`{self.config.COMMAND_PREFIX}ping` - Check bot status
-`{self.config.COMMAND_PREFIX}info` - Bot information  
-`{self.config.COMMAND_PREFIX}stats` - Usage statistics
-`{self.config.COMMAND_PREFIX}uptime` - Bot uptime
-
-**🖥️ System Commands:**
-`{self.config.COMMAND_PREFIX}sys` - System information
-
-**🛠️ Utility Commands:**
-`{self.config.COMMAND_PREFIX}echo <text>` - Echo text
-`{self.config.COMMAND_PREFIX}calc <expression>` - Calculator
-`{self.config.COMMAND_PREFIX}time` - Current time
-
-**⚡ Nexus Commands:**
-`{self.config.COMMAND_PREFIX}nexus` - Nexus information
-
-**📱 Created by @nexustech_dev**
-Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
-            """.strip()
+            help_text += COMMAND_HELP.get(command, ('', '', 'No detailed help available for this command.'))[2]
+            await message.edit_text(help_text)
+            return
         
-        await message.edit_text(help_text)
+        # Show general help
+        await send_long(message, self.templates.render('help'))
     
     async def _cmd_ping(self, message, args):
         """Ping command"""
@@ -202,10 +207,13 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
     
     async def _cmd_info(self, message, args):
         """Bot information command"""
-        me = await self.client.get_me()
+        me = await peer_cache.get_me(self.client)
         
         # Get system info
         system_info = self.utils.get_platform_info()
+        instance_id = (
+            f"{self.fingerprint.generate_instance_id()[:16]}..." if self.fingerprint else "Unavailable"
+        )
         
         info_text = f"""
 **🤖 Nexus Userbot Information**
@@ -218,12 +226,12 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
 
 **🔧 Bot Details:**
 • **Version:** `v{self.config.BOT_VERSION}`
-• **Instance ID:** `{self.fingerprint.generate_instance_id()[:16]}...`
+• **Instance ID:** `{instance_id}`
 • **Command Prefix:** `{self.config.COMMAND_PREFIX}`
 • **Platform:** `{system_info['platform']}`
 
 **📊 Statistics:**
-• **Commands Used:** `{sum(self.command_stats.values())}`
+• **Commands Used:** `{self.counters.grand_total}`
 • **Available Commands:** `{len(self.commands)}`
 • **Command Aliases:** `{len(self.command_aliases)}`
 
@@ -253,17 +261,21 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
 • **System Uptime:** `{str(uptime).split('.')[0]}`
 
 **🤖 Bot Stats:**
-• **Total Commands:** `{sum(self.command_stats.values())}`
-• **Unique Commands:** `{len(self.command_stats)}`
+• **Total Commands:** `{self.counters.grand_total}`
+• **Unique Commands:** `{self.counters.distinct('command')}`
 
 **📈 Top Commands:**
         """.strip()
         
-        # Add top 5 most used commands
-        if self.command_stats:
-            sorted_commands = sorted(self.command_stats.items(), key=lambda x: x[1], reverse=True)[:5]
-            for i, (cmd, count) in enumerate(sorted_commands, 1):
+        # Add top 5 most used commands, all time and for the last hour/day
+        top_commands = self.counters.top('command', 5)
+        if top_commands:
+            for i, (cmd, count) in enumerate(top_commands, 1):
                 stats_text += f"\n{i}. `{cmd}` - {count} uses"
+            for label, window in (('Last Hour', 3600), ('Last Day', 86400)):
+                recent = self.counters.top('command', 3, window=window)
+                summary = ', '.join(f"`{cmd}` ({count})" for cmd, count in recent) or 'none'
+                stats_text += f"\n**{label}:** {summary}"
         else:
             stats_text += "\nNo commands used yet."
         
@@ -337,25 +349,29 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
             await message.edit_text("❌ Please provide text to echo.\nUsage: `.echo <text>`")
             return
         
-        text = " ".join(args)
+        text = message.text.split(None, 1)[1]
         echo_text = f"🔊 **Echo:**\n{text}"
         
-        await message.edit_text(echo_text)
+        await send_long(message, echo_text)
     
     async def _cmd_calc(self, message, args):
         """Calculator command"""
-        if not args:
-            await message.edit_text("❌ Please provide an expression to calculate.\nUsage: `.calc <expression>`")
+        try:
+            expression, data = await read_batch_input(message, self.config)
+        except CalculationError as e:
+            await message.edit_text(f"❌ **Calculation Error:**\n`{str(e)}`")
             return
         
-        expression = " ".join(args)
+        if is_batch_request(expression, data):
+            await stream_batch(message, expression, data, self.config)
+            return
+        
+        if not expression:
+            await message.edit_text("❌ Please provide an expression to calculate.\nUsage: `.calc <expression>`")
+            return
         
         try:
-            # Safe evaluation
-            result = eval(expression, {"__builtins__": {}}, {
-                "abs": abs, "round": round, "min": min, "max": max,
-                "sum": sum, "pow": pow, "len": len
-            })
+            result = await self.calculator.calculate(expression)
             
             calc_text = f"""
 **🧮 Calculator**
@@ -366,7 +382,7 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
 *Powered by Nexus Userbot*
             """.strip()
             
-        except Exception as e:
+        except CalculationError as e:
             calc_text = f"❌ **Calculation Error:**\n`{str(e)}`"
         
         await message.edit_text(calc_text)
@@ -390,8 +406,27 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
     
     async def _cmd_nexus(self, message, args):
         """Nexus information command"""
-        nexus_text = f"""
-**🌟 Nexus Userbot v{self.config.BOT_VERSION}**
+        await message.edit_text(self.templates.render('nexus'))
+    
+    def _register_templates(self):
+        """Register the static replies compiled by ReplyTemplates"""
+        def help_template(config):
+            registry = CommandRegistry(HELP_SECTIONS)
+            for command in self.commands:
+                section, usage, description = COMMAND_HELP.get(command, ('⚡ Nexus Commands', '', ''))
+                registry.add(command, usage, description, section)
+            
+            return build_help_text(
+                f"🤖 Nexus Userbot v{config.BOT_VERSION} - Command Help",
+                config.COMMAND_PREFIX,
+                registry,
+                footer=f"**📱 Created by @nexustech_dev**\n"
+                       f"Use `{config.COMMAND_PREFIX}help <command>` for detailed help."
+            )
+        
+        def nexus_template(config):
+            return f"""
+**🌟 Nexus Userbot v{config.BOT_VERSION}**
 
 **🛡️ Protected & Unique Features:**
 • Advanced code protection system
@@ -413,7 +448,7 @@ Use `{self.config.COMMAND_PREFIX}help <command>` for detailed help.
 
 **💎 This is a unique, protected userbot with distinctive features.**
 *Unauthorized modifications are tracked and reported.*
-        """.strip()
+            """
         
-        await message.edit_text(nexus_text)
-
+        self.templates.register('help', help_template)
+        self.templates.register('nexus', nexus_template)
@@ -0,0 +1,218 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS USAGE COUNTERS                                ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCOPES = ('command', 'user', 'chat')
+
+# Bucket sizes for windowed queries: minutes for the last hour, hours for the last day
+_MINUTE = 60
+_HOUR = 3600
+# Hour buckets older than this are deleted from storage
+HOURLY_RETENTION_DAYS = 7
+
+
+class TopK:
+    """
+    The k largest counts, maintained on every increment
+
+    Counts only grow, so a key outside the top can enter only by passing the
+    current minimum; that is the only time the O(k) minimum scan runs.
+    """
+
+    __slots__ = ('k', 'items', '_min')
+
+    def __init__(self, k: int):
+        self.k = k
+        self.items: Dict[str, int] = {}
+        self._min: Optional[str] = None
+
+    def update(self, key: str, count: int):
+        items = self.items
+        if key in items:
+            items[key] = count
+            if key == self._min:
+                self._min = min(items, key=items.get)
+        elif len(items) < self.k:
+            items[key] = count
+            if self._min is None or count < items[self._min]:
+                self._min = key
+        elif count > items[self._min]:
+            del items[self._min]
+            items[key] = count
+            self._min = min(items, key=items.get)
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        return sorted(self.items.items(), key=lambda item: item[1], reverse=True)[:n or self.k]
+
+
+class CounterService:
+    """
+    Per-command, per-user and per-chat usage counts
+
+    Totals, a top-k per scope and minute/hour buckets for windowed queries
+    are kept in memory and updated in O(1) per event. Deltas since the last
+    flush are written to storage every ``flush_interval`` seconds (totals in
+    bucket 0, hourly counts in hour buckets) and loaded back on start, so
+    counts survive restarts. Shared by the userbot commands, CommandManager
+    and AssistantBot.
+    """
+
+    def __init__(self, storage=None, top_k: int = 10, flush_interval: float = 30.0):
+        self.storage = storage
+        self.flush_interval = flush_interval
+        self.totals: Dict[str, Dict[str, int]] = {scope: {} for scope in SCOPES}
+        self.tops: Dict[str, TopK] = {scope: TopK(top_k) for scope in SCOPES}
+        self.grand_total = 0
+        self._minutes: Deque[Tuple[int, Counter]] = deque(maxlen=_HOUR // _MINUTE)
+        self._hours: Deque[Tuple[int, Counter]] = deque(maxlen=24)
+        self._deltas: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _bucket(buckets: Deque[Tuple[int, Counter]], number: int) -> Counter:
+        if not buckets or buckets[-1][0] != number:
+            buckets.append((number, Counter()))
+        return buckets[-1][1]
+
+    def _add(self, scope: str, key: str, now: float, amount: int = 1):
+        totals = self.totals[scope]
+        count = totals.get(key, 0) + amount
+        totals[key] = count
+        self.tops[scope].update(key, count)
+
+        hour = int(now // _HOUR)
+        self._bucket(self._minutes, int(now // _MINUTE))[(scope, key)] += amount
+        self._bucket(self._hours, hour)[(scope, key)] += amount
+        if self.storage:
+            self._deltas[(scope, key, 0)] += amount
+            self._deltas[(scope, key, hour)] += amount
+
+    def record(self, command: str, user_id: Optional[int] = None, chat_id: Optional[int] = None):
+        """Count one use of a command"""
+        now = time.time()
+        self.grand_total += 1
+        self._add('command', command, now)
+        if user_id is not None:
+            self._add('user', str(user_id), now)
+        if chat_id is not None:
+            self._add('chat', str(chat_id), now)
+
+    def count(self, scope: str, key) -> int:
+        """All-time count of one key"""
+        return self.totals[scope].get(str(key), 0)
+
+    def distinct(self, scope: str) -> int:
+        return len(self.totals[scope])
+
+    def top(self, scope: str = 'command', n: int = 5, window: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Most used keys of a scope
+
+        Args:
+            scope: 'command', 'user' or 'chat'
+            n: Number of keys (all-time queries are O(k))
+            window: Only count the last hour (<= 3600) or day (<= 86400) seconds
+        """
+        if window is None:
+            return self.tops[scope].top(n)
+
+        now = time.time()
+        if window <= _HOUR:
+            buckets, size = self._minutes, _MINUTE
+        else:
+            buckets, size = self._hours, _HOUR
+        oldest = int((now - window) // size)
+
+        counts: Counter = Counter()
+        for number, bucket in buckets:
+            if number > oldest:
+                for (bucket_scope, key), count in bucket.items():
+                    if bucket_scope == scope:
+                        counts[key] += count
+        return heapq.nlargest(n, counts.items(), key=lambda item: item[1])
+
+    # Persistence ------------------------------------------------------------
+
+    async def load(self):
+        """Read totals and the last day of hourly counts from storage"""
+        if not self.storage:
+            return
+        now = time.time()
+        current_hour = int(now // _HOUR)
+
+        for scope, key, count in await self.storage.fetch(
+                "SELECT scope, key, count FROM counters WHERE bucket = 0"):
+            if scope in self.totals:
+                self.totals[scope][key] = count
+                self.tops[scope].update(key, count)
+                if scope == 'command':
+                    self.grand_total += count
+
+        hourly: Dict[int, Counter] = {}
+        for scope, key, bucket, count in await self.storage.fetch(
+                "SELECT scope, key, bucket, count FROM counters WHERE bucket > ?", (current_hour - 24,)):
+            hourly.setdefault(bucket, Counter())[(scope, key)] += count
+        for hour in sorted(hourly):
+            self._hours.append((hour, hourly[hour]))
+
+        self.storage.write("DELETE FROM counters WHERE bucket > 0 AND bucket < ?",
+                           (current_hour - HOURLY_RETENTION_DAYS * 24,))
+        logger.info(f"Loaded usage counters: {self.grand_total} commands")
+
+    def flush(self):
+        """Queue the deltas since the last flush as storage writes"""
+        if not self.storage or not self._deltas:
+            return
+        deltas, self._deltas = self._deltas, Counter()
+        for (scope, key, bucket), amount in deltas.items():
+            self.storage.write(
+                "INSERT INTO counters (scope, key, bucket, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (scope, key, bucket) DO UPDATE SET count = counters.count + excluded.count",
+                (scope, key, bucket, amount)
+            )
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    async def start(self):
+        """Load stored counts and start flushing"""
+        await self.load()
+        if self.storage and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+    async def stop(self):
+        """Stop the flush task and write the remaining deltas"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.flush()
+
+    def get_stats(self) -> dict:
+        """Counter sizes"""
+        return {
+            'total': self.grand_total,
+            'commands': len(self.totals['command']),
+            'users': len(self.totals['user']),
+            'chats': len(self.totals['chat']),
+            'pending_deltas': len(self._deltas)
+        }
@@ -0,0 +1,288 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS CUSTOM COMMANDS                               ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Optional, Union
+
+from pyrogram import filters
+from pyrogram.handlers import MessageHandler
+
+from .counters import CounterService
+from .templates import CommandRegistry, CompiledTemplate
+
+logger = logging.getLogger(__name__)
+
+SECTION = "🧩 Custom Commands"
+# Storage kv namespaces: runtime definitions, and file_ids of uploaded media
+NAMESPACE = 'custom_commands'
+MEDIA_NAMESPACE = 'custom_command_media'
+
+# Media kinds a response can carry, with whether they take a caption
+MEDIA_TYPES = {
+    'photo': True,
+    'video': True,
+    'animation': True,
+    'document': True,
+    'audio': True,
+    'voice': True,
+    'sticker': False,
+}
+
+
+def _sender_name(message) -> str:
+    user = message.from_user
+    return f"{user.first_name} {user.last_name or ''}".strip() if user else ''
+
+
+def _chat_name(message) -> str:
+    chat = message.chat
+    return chat.title or f"{chat.first_name or ''} {chat.last_name or ''}".strip()
+
+
+# Template placeholder -> value for (message, args); {{arg1}}..{{arg9}} are positional
+FIELDS: Dict[str, Callable] = {
+    'args': lambda message, args: ' '.join(args),
+    'sender': lambda message, args: _sender_name(message),
+    'sender_id': lambda message, args: message.from_user.id if message.from_user else '',
+    'sender_username': lambda message, args: (
+        f"@{message.from_user.username}" if message.from_user and message.from_user.username else ''
+    ),
+    'sender_mention': lambda message, args: (
+        f"[{_sender_name(message)}](tg://user?id={message.from_user.id})" if message.from_user else ''
+    ),
+    'chat': lambda message, args: _chat_name(message),
+    'chat_id': lambda message, args: message.chat.id,
+    'time': lambda message, args: datetime.now().strftime('%H:%M:%S'),
+    'date': lambda message, args: datetime.now().strftime('%Y-%m-%d'),
+}
+
+
+class CustomCommand:
+    """One custom command: a compiled reply template and optional media"""
+
+    __slots__ = ('name', 'template', 'media_type', 'media', 'source')
+
+    def __init__(self, name: str, text: str = '', media_type: Optional[str] = None,
+                 media: Optional[str] = None, source: str = 'runtime'):
+        if media_type is not None and media_type not in MEDIA_TYPES:
+            raise ValueError(f"Unsupported media type: {media_type}")
+        if not text and not media:
+            raise ValueError(f"Custom command {name} has no response")
+        self.name = name
+        self.template = CompiledTemplate(text)
+        self.media_type = media_type
+        self.media = media
+        self.source = source
+
+    @classmethod
+    def from_definition(cls, name: str, definition: Union[str, dict], source: str) -> 'CustomCommand':
+        """
+        Build from a definition: a reply text, or a dict with ``text`` and at
+        most one media key (``photo``, ``video``, ...) holding a file_id,
+        path or URL
+        """
+        if isinstance(definition, str):
+            return cls(name, definition, source=source)
+        if not isinstance(definition, dict):
+            raise ValueError(f"Custom command {name} must be a string or an object")
+
+        media_keys = [key for key in MEDIA_TYPES if key in definition]
+        if len(media_keys) > 1:
+            raise ValueError(f"Custom command {name} has more than one media key")
+        media_type = media_keys[0] if media_keys else None
+        return cls(name, str(definition.get('text', '')), media_type,
+                   definition[media_type] if media_type else None, source)
+
+    def to_definition(self) -> dict:
+        definition = {'text': self.template.text}
+        if self.media_type:
+            definition[self.media_type] = self.media
+        return definition
+
+    def render(self, message, args) -> str:
+        """Fill the placeholders the template uses"""
+        if not self.template.fields:
+            return self.template.text
+        values = {}
+        for field in self.template.fields:
+            if field in FIELDS:
+                values[field] = FIELDS[field](message, args)
+            elif field.startswith('arg') and field[3:].isdigit():
+                index = int(field[3:]) - 1
+                values[field] = args[index] if 0 <= index < len(args) else ''
+        return self.template.render(values)
+
+
+class CustomCommands:
+    """
+    Owner-defined reply commands from CUSTOM_COMMANDS and added at runtime
+
+    All custom commands share one handler: the filter splits the command
+    word off the message and looks it up in a dict, so adding commands does
+    not add handlers. Runtime definitions are stored in the kv table and
+    take precedence over CUSTOM_COMMANDS; the config ones are rebuilt when
+    the setting changes. Media given as a path or URL is uploaded once and
+    its file_id reused afterwards.
+    """
+
+    def __init__(self, config, storage=None, registry: Optional[CommandRegistry] = None,
+                 counters: Optional[CounterService] = None):
+        self.config = config
+        self.storage = storage
+        self.registry = registry
+        self.counters = counters
+        self.commands: Dict[str, CustomCommand] = {}
+        self._configured: Dict[str, CustomCommand] = {}
+        self._runtime: Dict[str, CustomCommand] = {}
+        self._file_ids: Dict[str, str] = {}
+        self.used = 0
+        self.reload()
+        config.subscribe(lambda old, new, changed: self.reload(), keys=('CUSTOM_COMMANDS',))
+
+    def _build(self, definitions: dict, source: str) -> Dict[str, CustomCommand]:
+        commands = {}
+        for name, definition in definitions.items():
+            try:
+                commands[name.lower()] = CustomCommand.from_definition(name.lower(), definition, source)
+            except ValueError as e:
+                logger.warning(f"Skipping custom command: {e}")
+        return commands
+
+    def _rebuild(self):
+        commands = dict(self._configured)
+        for name, command in self._runtime.items():
+            commands[name] = command
+        for name in [name for name in commands if self.is_builtin(name)]:
+            logger.warning(f"Custom command {name} is shadowed by a built-in command")
+            del commands[name]
+        if self.registry is not None:
+            for name in self.commands.keys() - commands.keys():
+                self.registry.remove(name)
+            for name in commands:
+                self.registry.add(name, "", "Custom reply", SECTION)
+        self.commands = commands
+
+    def reload(self):
+        """Rebuild the CUSTOM_COMMANDS part of the table"""
+        self._configured = self._build(dict(self.config.CUSTOM_COMMANDS), 'config')
+        self._rebuild()
+        logger.info(f"Custom commands loaded: {len(self.commands)}")
+
+    async def load(self):
+        """Read runtime definitions and cached media file_ids from storage"""
+        if not self.storage:
+            return
+        self._runtime = self._build(await self.storage.kv_items(NAMESPACE), 'runtime')
+        self._file_ids = await self.storage.kv_items(MEDIA_NAMESPACE)
+        self._rebuild()
+
+    def is_builtin(self, name: str) -> bool:
+        """Whether the name belongs to a regular command"""
+        entry = self.registry.entries.get(name) if self.registry is not None else None
+        return entry is not None and entry.section != SECTION
+
+    def add(self, name: str, text: str = '', media_type: Optional[str] = None,
+            media: Optional[str] = None) -> CustomCommand:
+        """
+        Define or replace a runtime command
+
+        Raises:
+            ValueError: Reserved name or empty response
+        """
+        name = name.lower().lstrip(self.config.COMMAND_PREFIX)
+        if not name or not name.replace('_', '').isalnum():
+            raise ValueError("Command names may only contain letters, digits and underscores")
+        if self.is_builtin(name):
+            raise ValueError(f"{name} is a built-in command")
+
+        command = CustomCommand(name, text, media_type, media)
+        self._runtime[name] = command
+        if self.storage:
+            self.storage.kv_set(NAMESPACE, name, command.to_definition())
+        else:
+            logger.warning(f"No storage, custom command {name} will not survive a restart")
+        self._rebuild()
+        return command
+
+    def remove(self, name: str) -> bool:
+        """Delete a runtime command; CUSTOM_COMMANDS ones stay until the setting changes"""
+        name = name.lower()
+        if self._runtime.pop(name, None) is None:
+            return False
+        if self.storage:
+            self.storage.kv_delete(NAMESPACE, name)
+        self._rebuild()
+        return True
+
+    # Dispatch -------------------------------------------------------------
+
+    def _match(self, message) -> bool:
+        text = message.text
+        prefix = self.config.COMMAND_PREFIX
+        if not text or not text.startswith(prefix):
+            return False
+        parts = text[len(prefix):].split()
+        if not parts or parts[0].lower() not in self.commands:
+            return False
+        message.command = [parts[0].lower()] + parts[1:]
+        return True
+
+    def register(self, client, group: int = 0):
+        """Add the single handler serving every custom command"""
+        client.add_handler(
+            MessageHandler(self.handle, filters.outgoing & filters.text & filters.create(lambda flt, client, message: self._match(message))),
+            group
+        )
+
+    async def handle(self, client, message):
+        name, args = message.command[0], message.command[1:]
+        command = self.commands.get(name)
+        if command is None:
+            return
+        self.used += 1
+        if self.counters is not None and self.config.ENABLE_COMMAND_LOGGING:
+            self.counters.record(name, message.from_user.id if message.from_user else None, message.chat.id)
+        try:
+            text = command.render(message, args)
+            if not command.media_type:
+                await message.edit(text)
+                return
+            await self._send_media(client, message, command, text)
+        except Exception as e:
+            logger.error(f"Custom command {name} failed: {e}")
+            try:
+                await message.edit(f"❌ Custom command `{name}` failed: `{e}`")
+            except Exception:
+                pass
+
+    async def _send_media(self, client, message, command: CustomCommand, text: str):
+        media = self._file_ids.get(command.media, command.media)
+        kwargs = {'reply_to_message_id': message.reply_to_message_id}
+        if MEDIA_TYPES[command.media_type] and text:
+            kwargs['caption'] = text
+
+        sent = await getattr(client, f"send_{command.media_type}")(message.chat.id, media, **kwargs)
+        await message.delete()
+
+        # Later sends reuse the uploaded file instead of the path or URL
+        uploaded = getattr(sent, command.media_type, None) if sent else None
+        file_id = getattr(uploaded, 'file_id', None)
+        if file_id and file_id != media:
+            self._file_ids[command.media] = file_id
+            if self.storage:
+                self.storage.kv_set(MEDIA_NAMESPACE, command.media, file_id)
+
+    def get_stats(self) -> dict:
+        return {
+            'commands': len(self.commands),
+            'runtime': len(self._runtime),
+            'cached_media': len(self._file_ids),
+            'used': self.used
+        }
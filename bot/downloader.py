@@ -0,0 +1,411 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS MEDIA DOWNLOADER                              ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import time
+from typing import AsyncIterator, BinaryIO, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from pyrogram.errors import FloodWait, MessageNotModified, RPCError
+
+from .utils import BotUtils, ValidationUtils
+
+logger = logging.getLogger(__name__)
+
+# Size of the chunks stream_media yields; resume offsets are counted in chunks
+CHUNK_SIZE = 1024 * 1024
+# Storage kv namespaces: file_unique_id -> finished file, and sha256 -> path
+NAMESPACE = 'downloads'
+HASH_NAMESPACE = 'download_hashes'
+# Message ids fetched per get_messages call, and the largest range one job may cover
+FETCH_BATCH = 200
+MAX_RANGE = 10000
+# Times one file is tried again after a FloodWait before it counts as failed
+FLOOD_RETRIES = 3
+
+MEDIA_KINDS = ('document', 'video', 'audio', 'photo', 'animation', 'voice', 'video_note', 'sticker')
+_EXTENSIONS = {
+    'photo': '.jpg',
+    'video': '.mp4',
+    'animation': '.mp4',
+    'video_note': '.mp4',
+    'audio': '.mp3',
+    'voice': '.ogg',
+    'sticker': '.webp',
+}
+
+
+class DownloadResult(NamedTuple):
+    path: str
+    size: int
+    # 'downloaded', 'resumed', 'cached' (same file_unique_id) or 'duplicate' (same content)
+    status: str
+
+
+def media_of(message) -> Optional[Tuple[str, object]]:
+    """(kind, media object) of a message, or None"""
+    for kind in MEDIA_KINDS:
+        media = getattr(message, kind, None)
+        if media is not None:
+            return kind, media
+    return None
+
+
+class DownloadJob:
+    """Progress of one .dl request"""
+
+    def __init__(self, chat_id: int):
+        self.chat_id = chat_id
+        self.started = time.monotonic()
+        self.files = 0
+        self.done = 0
+        self.failed = 0
+        self.total_bytes = 0
+        self.done_bytes = 0
+        self.scanning = True
+        self.results: List[DownloadResult] = []
+
+    def add(self, size: int):
+        self.files += 1
+        self.total_bytes += size
+
+    def render(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 0.001)
+        speed = self.done_bytes / elapsed
+        lines = [
+            "**📥 Downloading**" + (" (scanning...)" if self.scanning else ""),
+            BotUtils.create_progress_bar(self.done_bytes, self.total_bytes),
+            f"{self.done}/{self.files} files · {BotUtils.format_bytes(self.done_bytes)}"
+            f" of {BotUtils.format_bytes(self.total_bytes)} · {BotUtils.format_bytes(speed)}/s",
+        ]
+        if self.failed:
+            lines.append(f"❌ {self.failed} failed")
+        return "\n".join(lines)
+
+
+class Downloader:
+    """
+    Concurrent, resumable media downloads for .dl
+
+    Media is streamed chunk by chunk from Telegram straight into a
+    ``.part`` file named after its file_unique_id, so a download holds one
+    chunk in memory at a time and an interrupted one continues from the last
+    complete chunk. Writes and hashing run in a thread. At most
+    DOWNLOAD_CONCURRENCY files are transferred at once across all jobs.
+    Finished files are remembered by file_unique_id, which makes repeats
+    free, and by sha256, so the same content sent as different files is
+    kept once.
+    """
+
+    def __init__(self, config, storage=None):
+        self.config = config
+        self.storage = storage
+        self._slots = asyncio.Semaphore(config.DOWNLOAD_CONCURRENCY)
+        self._files: Dict[str, dict] = {}
+        self._hashes: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Final paths of running transfers, so two files with one name never share a path
+        self._reserved: Set[str] = set()
+        self._jobs: Set[asyncio.Task] = set()
+
+        self.downloaded = 0
+        self.resumed = 0
+        self.reused = 0
+        self.bytes = 0
+        config.subscribe(lambda old, new, changed: self.configure(new), keys=('DOWNLOAD_CONCURRENCY',))
+
+    def configure(self, config):
+        """New transfers use the new concurrency; running ones keep their slot"""
+        self._slots = asyncio.Semaphore(config.DOWNLOAD_CONCURRENCY)
+
+    async def load(self):
+        """Read the index of finished downloads from storage"""
+        if not self.storage:
+            return
+        self._files = await self.storage.kv_items(NAMESPACE)
+        self._hashes = await self.storage.kv_items(HASH_NAMESPACE)
+
+    # Single files -----------------------------------------------------------
+
+    def _target(self, message, kind: str, media) -> str:
+        directory = os.path.join(self.config.DOWNLOAD_DIR, str(message.chat.id))
+        name = getattr(media, 'file_name', None)
+        if name:
+            name = ValidationUtils.sanitize_filename(os.path.basename(name))
+        if not name:
+            extension = _EXTENSIONS.get(kind) or mimetypes.guess_extension(getattr(media, 'mime_type', None) or '') or ''
+            name = f"{kind}_{message.id}{extension}"
+        path = os.path.join(directory, name)
+        if os.path.exists(path) or path in self._reserved:
+            stem, extension = os.path.splitext(name)
+            path = os.path.join(directory, f"{stem}_{media.file_unique_id}{extension}")
+        return path
+
+    def _known(self, unique_id: str) -> Optional[DownloadResult]:
+        record = self._files.get(unique_id)
+        if record and BotUtils.get_file_size(record['path']) == record['size']:
+            return DownloadResult(record['path'], record['size'], 'cached')
+        return None
+
+    @staticmethod
+    def _open_part(path: str) -> Tuple[BinaryIO, 'hashlib._Hash', int]:
+        """Open a partial file at its last complete chunk, with the hash of what is kept"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        handle = open(path, 'a+b')
+        size = os.fstat(handle.fileno()).st_size
+        offset = size - size % CHUNK_SIZE
+        handle.truncate(offset)
+        digest = hashlib.sha256()
+        handle.seek(0)
+        for block in iter(lambda: handle.read(CHUNK_SIZE), b''):
+            digest.update(block)
+        return handle, digest, offset
+
+    @staticmethod
+    def _write(handle: BinaryIO, digest, chunk: bytes):
+        handle.write(chunk)
+        digest.update(chunk)
+
+    async def download(self, client, message, job: Optional[DownloadJob] = None) -> DownloadResult:
+        """
+        Download the media of one message
+
+        Raises:
+            ValueError: The message has no media
+        """
+        found = media_of(message)
+        if found is None:
+            raise ValueError("This message has no downloadable media")
+        kind, media = found
+        unique_id = media.file_unique_id
+
+        known = self._known(unique_id)
+        if known is None and unique_id in self._inflight:
+            # The same file twice at once: wait for the first copy
+            first = self._inflight[unique_id]
+            try:
+                known = (await asyncio.shield(first))._replace(status='cached')
+            except asyncio.CancelledError:
+                if not first.cancelled():
+                    raise
+                # Its job was stopped; carry on from the partial file
+                return await self.download(client, message, job)
+        if known is not None:
+            self.reused += 1
+            if job:
+                job.done_bytes += known.size
+            return known
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[unique_id] = future
+        try:
+            async with self._slots:
+                result = await self._transfer(client, message, kind, media, job)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody else may be waiting; do not log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            del self._inflight[unique_id]
+
+    async def _transfer(self, client, message, kind: str, media, job: Optional[DownloadJob]) -> DownloadResult:
+        unique_id = media.file_unique_id
+        path = self._target(message, kind, media)
+        self._reserved.add(path)
+        try:
+            return await self._stream(client, message, unique_id, path, job)
+        finally:
+            self._reserved.discard(path)
+
+    async def _stream(self, client, message, unique_id: str, path: str,
+                      job: Optional[DownloadJob]) -> DownloadResult:
+        loop = asyncio.get_running_loop()
+        part = os.path.join(os.path.dirname(path), f".{unique_id}.part")
+
+        handle, digest, offset = await loop.run_in_executor(None, self._open_part, part)
+        size = offset
+        if job:
+            job.done_bytes += offset
+        try:
+            async for chunk in client.stream_media(message, offset=offset // CHUNK_SIZE):
+                await loop.run_in_executor(None, self._write, handle, digest, chunk)
+                size += len(chunk)
+                self.bytes += len(chunk)
+                if job:
+                    job.done_bytes += len(chunk)
+        except BaseException:
+            # A retry counts the kept part again
+            if job:
+                job.done_bytes -= size
+            raise
+        finally:
+            await loop.run_in_executor(None, handle.close)
+
+        status = 'resumed' if offset else 'downloaded'
+        if offset:
+            self.resumed += 1
+        self.downloaded += 1
+
+        sha256 = digest.hexdigest()
+        existing = self._hashes.get(sha256)
+        if existing and existing != path and BotUtils.get_file_size(existing) == size:
+            # Same bytes under another file_unique_id
+            os.remove(part)
+            path, status = existing, 'duplicate'
+        else:
+            os.replace(part, path)
+            self._hashes[sha256] = path
+            if self.storage:
+                self.storage.kv_set(HASH_NAMESPACE, sha256, path)
+
+        record = {'path': path, 'size': size, 'sha256': sha256}
+        self._files[unique_id] = record
+        if self.storage:
+            self.storage.kv_set(NAMESPACE, unique_id, record)
+        return DownloadResult(path, size, status)
+
+    # Batches ----------------------------------------------------------------
+
+    @staticmethod
+    async def messages_in_range(client, chat_id: int, first: int, last: int) -> AsyncIterator:
+        """Messages with media among ids first..last, fetched in batches"""
+        for start in range(first, last + 1, FETCH_BATCH):
+            ids = list(range(start, min(start + FETCH_BATCH, last + 1)))
+            for message in await client.get_messages(chat_id, ids):
+                if message and not message.empty and media_of(message):
+                    yield message
+
+    async def download_all(self, client, messages, job: DownloadJob) -> List[DownloadResult]:
+        """
+        Download the media of an iterable or async iterator of messages
+
+        A bounded queue sits between the producer and the workers, so a long
+        range is never fetched far ahead of the downloads.
+        """
+        workers = self.config.DOWNLOAD_CONCURRENCY
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+
+        async def produce():
+            try:
+                if hasattr(messages, '__aiter__'):
+                    async for message in messages:
+                        job.add(getattr(media_of(message)[1], 'file_size', 0) or 0)
+                        await queue.put(message)
+                else:
+                    for message in messages:
+                        job.add(getattr(media_of(message)[1], 'file_size', 0) or 0)
+                        await queue.put(message)
+            finally:
+                job.scanning = False
+                for _ in range(workers):
+                    await queue.put(None)
+
+        async def work():
+            while (message := await queue.get()) is not None:
+                for attempt in range(FLOOD_RETRIES + 1):
+                    try:
+                        job.results.append(await self.download(client, message, job))
+                        break
+                    except FloodWait as e:
+                        if attempt == FLOOD_RETRIES:
+                            logger.error(f"Download of {message.chat.id}/{message.id} failed: FloodWait {e.value}s")
+                            job.failed += 1
+                            break
+                        # The retry resumes from the partial file
+                        logger.warning(f"FloodWait {e.value}s while downloading, retrying")
+                        await asyncio.sleep(e.value)
+                    except Exception as e:
+                        logger.error(f"Download of {message.chat.id}/{message.id} failed: {e}")
+                        job.failed += 1
+                        break
+                job.done += 1
+
+        await asyncio.gather(produce(), *(work() for _ in range(workers)))
+        return job.results
+
+    # Progress ---------------------------------------------------------------
+
+    async def _report(self, status, job: DownloadJob):
+        """Edit the status message at most every DOWNLOAD_PROGRESS_INTERVAL seconds"""
+        shown = None
+        while True:
+            await asyncio.sleep(self.config.DOWNLOAD_PROGRESS_INTERVAL)
+            text = job.render()
+            if text == shown:
+                continue
+            try:
+                await status.edit(text)
+                shown = text
+            except FloodWait as e:
+                await asyncio.sleep(e.value)
+            except MessageNotModified:
+                pass
+            except RPCError as e:
+                logger.debug(f"Progress update failed: {e}")
+
+    async def run(self, client, status, messages, job: DownloadJob) -> List[DownloadResult]:
+        """Download a batch while reporting progress on the status message"""
+        reporter = asyncio.get_running_loop().create_task(self._report(status, job))
+        try:
+            return await self.download_all(client, messages, job)
+        finally:
+            reporter.cancel()
+            try:
+                await reporter
+            except asyncio.CancelledError:
+                pass
+
+    def start(self, client, status, messages, chat_id: int, on_done) -> asyncio.Task:
+        """
+        Run a batch in its own task, so the handler returns at once
+
+        ``on_done(job)`` is awaited when the batch finishes.
+        """
+        job = DownloadJob(chat_id)
+
+        async def runner():
+            try:
+                await self.run(client, status, messages, job)
+            except Exception as e:
+                logger.error(f"Download job in {chat_id} failed: {e}")
+            finally:
+                await on_done(job)
+
+        task = asyncio.get_running_loop().create_task(runner())
+        self._jobs.add(task)
+        task.add_done_callback(self._jobs.discard)
+        return task
+
+    async def stop(self) -> int:
+        """Cancel running batches; partial files stay for the next attempt"""
+        tasks = [task for task in self._jobs if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return len(tasks)
+
+    def get_stats(self) -> dict:
+        return {
+            'jobs': sum(1 for task in self._jobs if not task.done()),
+            'active': len(self._inflight),
+            'downloaded': self.downloaded,
+            'resumed': self.resumed,
+            'reused': self.reused,
+            'bytes': self.bytes,
+            'known_files': len(self._files)
+        }
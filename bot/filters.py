@@ -0,0 +1,36 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS COMMAND FILTERS                               ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import logging
+from typing import List, Union
+
+from pyrogram import filters
+
+logger = logging.getLogger(__name__)
+
+
+def _prefixes(prefix: str) -> set:
+    # Same normalisation as filters.command()
+    return {prefix} if prefix else {""}
+
+
+def command(commands: Union[str, List[str]], config, case_sensitive: bool = False):
+    """
+    filters.command() that follows COMMAND_PREFIX
+
+    The prefix set is updated in place when the configuration changes, so
+    handlers keep working after a reload without being re-registered.
+    """
+    flt = filters.command(commands, prefixes=config.COMMAND_PREFIX, case_sensitive=case_sensitive)
+
+    def update(old, new, changed):
+        flt.prefixes = _prefixes(new.COMMAND_PREFIX)
+
+    config.subscribe(update, keys=('COMMAND_PREFIX',))
+    return flt
@@ -11,129 +11,151 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Set
-from pyrogram.types import Message, User
+import json
+import os
+from collections import deque
+from datetime import datetime
+from typing import Optional
+from pyrogram import filters
+from pyrogram.types import Message
+
+from .access import AccessControl
+from .log_sampling import get_sampled_logger
+from .outbound import OutboundQueue
+from .ttl_map import TTLMap
 
 logger = logging.getLogger(__name__)
+sampled_logger = get_sampled_logger(__name__)
+
+# Runs beside the command handlers instead of competing with them
+AUTO_RESPONSE_GROUP = 10
+
+# How long per-user state is kept, in seconds
+RESPONSE_WINDOW = 24 * 3600
+FLOOD_WINDOW = 60
+USER_OVERRIDE_TTL = 30 * 24 * 3600
 
 class MessageHandler:
     """
     Handles incoming messages and auto-responses
     """
     
-    def __init__(self, client, config):
+    def __init__(self, client, config, access: AccessControl = None, outbound: OutboundQueue = None):
         self.client = client
         self.config = config
-        self.last_responses: Dict[int, datetime] = {}
-        self.flood_protection: Dict[int, list] = {}
-        self.auto_response_users: Set[int] = set()
+        self.access = access or AccessControl(config)
+        self.outbound = outbound or OutboundQueue(config.RATE_LIMIT_DELAY)
+        # User id -> True for everyone answered within the window (24 hours or the delay, if longer)
+        self.last_responses = TTLMap(self._response_window(config))
+        # User id -> monotonic ticks of their recent messages
+        self.flood_protection = TTLMap(FLOOD_WINDOW)
+        self.auto_response_users = TTLMap(USER_OVERRIDE_TTL)
+        self.responses_sent = 0
+        self._maintenance: Optional[asyncio.Task] = None
+        self._saving = asyncio.Lock()
+        config.subscribe(self._configure_window, keys=('AUTO_RESPONSE_DELAY',))
+    
+    @staticmethod
+    def _response_window(config) -> int:
+        # A cooldown longer than the window would expire early
+        return max(RESPONSE_WINDOW, config.AUTO_RESPONSE_DELAY)
+    
+    def _configure_window(self, old, new, changed):
+        self.last_responses.ttl = self._response_window(new)
+    
+    def register(self, client=None, group: int = AUTO_RESPONSE_GROUP):
+        """Attach the auto-responder to the client for incoming private messages"""
+        client = client or self.client
+        enabled = filters.create(lambda flt, _, __: self.config.ENABLE_AUTO_RESPONSE, "AutoResponseEnabled")
+        client.on_message(enabled & filters.private & filters.incoming, group=group)(self.handle_message)
+        
+    async def handle_message(self, client, message: Message):
+        """
+        Handle an incoming private message
         
-    async def handle_message(self, event):
-        """Handle incoming messages"""
+        Every check uses data already on the Message and in memory; the
+        network is only touched for messages that get a response, and those
+        go through the outbound queue.
+        """
         try:
             # Skip if auto-response is disabled
             if not self.config.ENABLE_AUTO_RESPONSE:
                 return
             
-            # Skip if message is from self
-            if event.is_outgoing:
+            sender = message.from_user
+            if sender is None or sender.is_self or sender.is_bot:
                 return
             
-            # Get sender info
-            sender = await event.get_sender()
-            if not isinstance(sender, User):
+            # Blacklist and authorization
+            if not self.access.is_allowed(sender.id):
                 return
             
-            # Skip if sender is in blacklist
-            if str(sender.id) in self.config.BLACKLISTED_USERS:
+            # Apply flood protection; every message counts, including ones in the cooldown
+            if self.config.FLOOD_PROTECTION and self._is_flooding(sender.id):
+                sampled_logger.warning(sender.id, "Flood protection triggered for user %s", sender.id)
                 return
             
-            # Check if sender is authorized (if authorization is enabled)
-            if self.config.AUTHORIZED_USERS and str(sender.id) not in self.config.AUTHORIZED_USERS:
+            # Check if we already responded to this user recently
+            if not self._should_send_auto_response(sender.id):
                 return
             
-            # Apply flood protection
-            if self.config.FLOOD_PROTECTION and self._is_flooding(sender.id):
-                logger.warning(f"Flood protection triggered for user {sender.id}")
-                return
-            
-            # Check if we should send auto-response
-            if await self._should_send_auto_response(event, sender):
-                await self._send_auto_response(event, sender)
+            self._send_auto_response(client, message.chat.id, sender)
                 
         except Exception as e:
             logger.error(f"Error handling message: {e}")
     
     def _is_flooding(self, user_id: int) -> bool:
         """Check if user is flooding messages"""
-        now = datetime.now()
-        
-        if user_id not in self.flood_protection:
-            self.flood_protection[user_id] = []
-        
-        # Clean old messages (older than 1 minute)
-        self.flood_protection[user_id] = [
-            msg_time for msg_time in self.flood_protection[user_id]
-            if now - msg_time < timedelta(minutes=1)
-        ]
+        now = self.flood_protection.clock()
         
-        # Add current message
-        self.flood_protection[user_id].append(now)
+        # Messages from the last minute, plus the current one
+        recent = [tick for tick in self.flood_protection.get(user_id, ()) if now - tick < FLOOD_WINDOW]
+        recent.append(now)
+        self.flood_protection.set(user_id, recent)
         
         # Check if user sent more than 5 messages in the last minute
-        return len(self.flood_protection[user_id]) > 5
+        return len(recent) > 5
     
-    async def _should_send_auto_response(self, event, sender) -> bool:
+    def _should_send_auto_response(self, user_id: int) -> bool:
         """Determine if auto-response should be sent"""
         # Check if we already responded to this user recently
-        now = datetime.now()
-        last_response = self.last_responses.get(sender.id)
+        age = self.last_responses.age(user_id)
+        return age is None or age >= self.config.AUTO_RESPONSE_DELAY
+    
+    def _build_response(self, sender) -> str:
+        """Auto-response text for a user"""
+        # Customize response message
+        response = self.config.AUTO_RESPONSE_MESSAGE
         
-        if last_response:
-            time_diff = now - last_response
-            if time_diff.total_seconds() < self.config.AUTO_RESPONSE_DELAY:
-                return False
+        # Add some personalization
+        if sender.first_name:
+            response = f"Hi {sender.first_name}! {response}"
         
-        # Check if this is a private message
-        if not event.is_private:
-            return False
+        # Add assistant bot reference
+        if self.config.BOT_USERNAME:
+            response += f"\n\n💬 **For quick assistance, chat with me at @{self.config.BOT_USERNAME}**"
         
-        # Check if message mentions the bot or is a direct message
-        return True
+        # Add Nexus branding
+        response += "\n\n🤖 Powered by Nexus Userbot v2.0"
+        response += "\n📧 Created by @nexustech_dev"
+        return response
     
-    async def _send_auto_response(self, event, sender):
-        """Send auto-response message"""
-        try:
-            # Mark that we responded to this user
-            self.last_responses[sender.id] = datetime.now()
-            
-            # Customize response message
-            response = self.config.AUTO_RESPONSE_MESSAGE
-            
-            # Add some personalization
-            if sender.first_name:
-                response = f"Hi {sender.first_name}! {response}"
-            
-            # Add assistant bot reference
-            if hasattr(self.config, 'BOT_USERNAME') and self.config.BOT_USERNAME:
-                response += f"\n\n💬 **For quick assistance, chat with me at @{self.config.BOT_USERNAME}**"
-            
-            # Add Nexus branding
-            response += "\n\n🤖 Powered by Nexus Userbot v2.0"
-            response += "\n📧 Created by @nexustech_dev"
-            
-            # Send response
-            await event.respond(response)
-            
-            logger.info(f"Auto-response sent to {sender.first_name} (@{sender.username})")
-            
-        except Exception as e:
-            logger.error(f"Failed to send auto-response: {e}")
+    def _send_auto_response(self, client, chat_id: int, sender):
+        """Queue the auto-response message"""
+        # Mark that we responded to this user
+        self.last_responses.set(sender.id)
+        self.responses_sent += 1
+        response = self._build_response(sender)
+        
+        async def send():
+            await client.send_message(chat_id, response)
+            sampled_logger.info('auto_response', "Auto-response sent to %s (@%s)", sender.first_name, sender.username)
+        
+        self.outbound.submit(chat_id, send)
     
     async def enable_auto_response_for_user(self, user_id: int):
         """Enable auto-response for specific user"""
-        self.auto_response_users.add(user_id)
+        self.auto_response_users.set(user_id)
         logger.info(f"Auto-response enabled for user {user_id}")
     
     async def disable_auto_response_for_user(self, user_id: int):
@@ -144,13 +166,10 @@ class MessageHandler:
     async def get_handler_stats(self) -> dict:
         """Get handler statistics"""
         return {
-            'total_responses_sent': len(self.last_responses),
+            'total_responses_sent': self.responses_sent,
             'flood_protection_active': len(self.flood_protection),
             'auto_response_users': len(self.auto_response_users),
-            'last_24h_responses': len([
-                timestamp for timestamp in self.last_responses.values()
-                if datetime.now() - timestamp < timedelta(hours=24)
-            ])
+            'last_24h_responses': len(self.last_responses)
         }
     
     def clear_handler_data(self):
@@ -159,15 +178,89 @@ class MessageHandler:
         self.flood_protection.clear()
         self.auto_response_users.clear()
         logger.info("Handler data cleared")
+    
+    def load_state(self):
+        """Restore cooldowns saved by save_state()"""
+        path = self.config.AUTO_RESPONSE_STATE_FILE
+        if not path or not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+            restored = self.last_responses.restore(state.get('last_responses', {}))
+            self.auto_response_users.restore(state.get('auto_response_users', {}))
+            self.responses_sent = state.get('responses_sent', 0)
+            logger.info(f"Restored {restored} auto-response cooldowns")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable auto-response state {path}: {e}")
+    
+    async def save_state(self):
+        """
+        Write cooldowns to AUTO_RESPONSE_STATE_FILE so they survive restarts
+
+        Only copying the maps happens on the event loop; building the JSON
+        and writing it run in an executor.
+        """
+        path = self.config.AUTO_RESPONSE_STATE_FILE
+        if not path:
+            return
+        last_responses = self.last_responses.snapshot()
+        auto_response_users = self.auto_response_users.snapshot()
+        responses_sent = self.responses_sent
+
+        def write():
+            state = {
+                'last_responses': last_responses(),
+                'auto_response_users': auto_response_users(),
+                'responses_sent': responses_sent
+            }
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(state, file)
+            os.replace(temp_path, path)
+
+        # One writer at a time, they share the temporary file
+        async with self._saving:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, write)
+            except OSError as e:
+                logger.error(f"Failed to save auto-response state: {e}")
+    
+    async def _maintain(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.last_responses.sweep()
+            self.flood_protection.sweep()
+            self.auto_response_users.sweep()
+            await self.save_state()
+    
+    def start(self, interval: float = 60.0):
+        """Restore saved state and sweep/save it periodically"""
+        self.load_state()
+        if self._maintenance is None or self._maintenance.done():
+            self._maintenance = asyncio.get_running_loop().create_task(self._maintain(interval))
+    
+    async def stop(self):
+        """Stop maintenance and save state"""
+        if self._maintenance and not self._maintenance.done():
+            self._maintenance.cancel()
+            try:
+                await self._maintenance
+            except asyncio.CancelledError:
+                pass
+        self._maintenance = None
+        await self.save_state()
 
 class EventLogger:
     """
     Logs various events for analytics
     """
     
-    def __init__(self, config):
+    def __init__(self, config, storage=None):
         self.config = config
-        self.events_log = []
+        self.storage = storage
+        # Last 1000 events in memory; all of them in the storage events table
+        self.events_log = deque(maxlen=1000)
         
     async def log_event(self, event_type: str, data: dict):
         """Log an event"""
@@ -181,16 +274,14 @@ class EventLogger:
         }
         
         self.events_log.append(event_data)
+        if self.storage:
+            self.storage.log_event(event_type, data)
         
-        # Keep only last 1000 events to prevent memory issues
-        if len(self.events_log) > 1000:
-            self.events_log = self.events_log[-1000:]
-        
-        logger.debug(f"Event logged: {event_type}")
+        sampled_logger.debug(event_type, "Event logged: %s", event_type)
     
     def get_events(self, event_type: str = None, limit: int = 100) -> list:
         """Get logged events"""
-        events = self.events_log
+        events = list(self.events_log)
         
         if event_type:
             events = [e for e in events if e['type'] == event_type]
@@ -0,0 +1,52 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS SHARED HTTP POOL                              ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import logging
+from typing import Optional
+
+from .lazy import lazy_import
+
+# aiohttp is only imported when the first request creates the session
+aiohttp = lazy_import('aiohttp')
+
+logger = logging.getLogger(__name__)
+
+_session: Optional['aiohttp.ClientSession'] = None
+_pool_size = 100
+
+
+def configure_http_pool(pool_size: int):
+    """Set the connection limit used when the shared session is created"""
+    global _pool_size
+    if pool_size > 0:
+        _pool_size = pool_size
+
+
+def get_http_session() -> 'aiohttp.ClientSession':
+    """
+    Get the process-wide aiohttp session
+
+    Plugins and managers share one connection pool instead of opening a
+    new ClientSession (and TCP/TLS handshake) per request. The session is
+    shared by every account running in the process.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=_pool_size, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(connector=connector)
+        logger.debug(f"Shared HTTP session created (pool size: {_pool_size})")
+    return _session
+
+
+async def close_http_session():
+    """Close the shared session on shutdown"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
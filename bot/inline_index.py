@@ -0,0 +1,180 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS INLINE QUERY INDEX                            ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pyrogram.types import InlineQueryResultArticle, InputTextMessageContent
+
+logger = logging.getLogger(__name__)
+
+
+class InlineAction:
+    """
+    An inline mode action such as ``webshot:<url>`` or ``ping``
+
+    Args:
+        keyword: Word typed after the bot username (matched case-insensitively)
+        title: Title of the suggestion shown before an argument is typed
+        description: Suggestion description, e.g. "Type: webshot:url"
+        example: Message sent when the suggestion itself is picked
+        build: Callable taking the argument text and returning a list of results
+        takes_argument: True for ``keyword:argument`` actions, False for bare words
+        personal: Results depend on the querying user and must not be shared
+    """
+
+    __slots__ = ('keyword', 'title', 'description', 'example', 'build',
+                 'takes_argument', 'personal', 'hint')
+
+    def __init__(self, keyword: str, title: str, description: str, example: str,
+                 build: Callable[[str], List], takes_argument: bool = True,
+                 personal: bool = False):
+        self.keyword = keyword.lower()
+        self.title = title
+        self.description = description
+        self.example = example
+        self.build = build
+        self.takes_argument = takes_argument
+        self.personal = personal
+        # Suggestion article is built once and reused for every query
+        self.hint = InlineQueryResultArticle(
+            id=f"hint-{self.keyword}",
+            title=title,
+            description=description,
+            input_message_content=InputTextMessageContent(example)
+        )
+
+
+# Actions contributed by plugins, merged into every AssistantBot index
+_registered_actions: Dict[str, InlineAction] = {}
+_registry_version = 0
+
+
+def register_inline_action(action: InlineAction):
+    """Register a plugin inline action (replaces one with the same keyword)"""
+    global _registry_version
+    _registered_actions[action.keyword] = action
+    _registry_version += 1
+    logger.info(f"Inline action registered: {action.keyword}")
+
+
+def registered_inline_actions() -> Tuple[int, List[InlineAction]]:
+    """Get the registry version and the plugin-contributed actions"""
+    return _registry_version, list(_registered_actions.values())
+
+
+class _TrieNode:
+    __slots__ = ('children', 'action', 'hints')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.action: Optional[InlineAction] = None
+        self.hints: Tuple = ()
+
+
+class InlineIndex:
+    """
+    Prefix index over inline actions with a per-query result cache
+
+    Keywords live in a character trie whose nodes carry the prebuilt hint
+    articles of every action below them, so a partially typed keyword
+    resolves to its suggestions in O(len(keyword)) without building objects.
+    Full result lists are cached per normalized query (LRU).
+    """
+
+    def __init__(self, actions: List[InlineAction], page_size: int = 20, cache_size: int = 1024):
+        self.page_size = max(1, min(page_size, 50))  # Telegram allows 50 per page
+        self.cache_size = cache_size
+        self.root = _TrieNode()
+        self.cache: 'OrderedDict[str, Tuple]' = OrderedDict()
+
+        for action in actions:
+            self._insert(action)
+        self._fill_hints(self.root)
+
+        # Empty or unknown queries list every action in registration order
+        self.defaults: Tuple = tuple(action.hint for action in actions)
+
+    def _insert(self, action: InlineAction):
+        node = self.root
+        for char in action.keyword:
+            node = node.children.setdefault(char, _TrieNode())
+        node.action = action
+
+    def _fill_hints(self, node: _TrieNode) -> Tuple:
+        hints = (node.action.hint,) if node.action else ()
+        for child in node.children.values():
+            hints += self._fill_hints(child)
+        node.hints = hints
+        return hints
+
+    def _find(self, keyword: str) -> Optional[_TrieNode]:
+        node = self.root
+        for char in keyword:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def resolve(self, query: str) -> Tuple[Tuple, bool]:
+        """
+        Resolve a raw query to its full result list
+
+        Returns:
+            Tuple of (results, is_personal)
+        """
+        text = query.strip()
+        keyword, separator, argument = text.partition(':')
+        keyword = keyword.strip().lower()
+        argument = argument.strip()
+
+        node = self._find(keyword)
+        if node is None:
+            return self.defaults, False
+
+        action = node.action
+        if action:
+            if separator and action.takes_argument and argument:
+                return tuple(action.build(argument)), action.personal
+            if not action.takes_argument and not separator:
+                return tuple(action.build('')), action.personal
+
+        # Partial keyword: suggest every action below this prefix
+        return (node.hints or self.defaults), False
+
+    def lookup(self, query: str, offset: str = "") -> Tuple[List, str, bool]:
+        """
+        Get one page of results for a query
+
+        Returns:
+            Tuple of (page results, next_offset, is_personal)
+        """
+        key = query.strip()
+        results = self.cache.get(key)
+        personal = False
+
+        if results is None:
+            results, personal = self.resolve(query)
+            # Personal results depend on the user and are never shared
+            if not personal:
+                self.cache[key] = results
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+
+        try:
+            start = max(0, int(offset)) if offset else 0
+        except ValueError:
+            start = 0
+        end = start + self.page_size
+
+        next_offset = str(end) if end < len(results) else ""
+        return list(results[start:end]), next_offset, personal
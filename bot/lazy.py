@@ -0,0 +1,77 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS LAZY IMPORTS                                  ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+from typing import Dict, List
+
+_lazy_modules: Dict[str, '_LazyModule'] = {}
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Placeholder that imports the real module on first attribute access
+
+    Loading is serialized with a lock, so the first use may happen on any
+    thread (executor workers included).
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_lock'] = threading.Lock()
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                module = importlib.import_module(self.__name__)
+                self.__dict__.update(module.__dict__)
+                self.__dict__['_lazy_module'] = module
+        return self._lazy_module
+
+    def __getattr__(self, attribute):
+        # Only called for names not copied from the loaded module yet
+        return getattr(self._load(), attribute)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Import a module on first attribute access
+
+    Returns the module itself if it is already imported, otherwise a
+    placeholder. Raises ImportError if the module does not exist.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    if name in _lazy_modules:
+        return _lazy_modules[name]
+
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+
+    module = _lazy_modules[name] = _LazyModule(name)
+    return module
+
+
+def optional_import(name: str):
+    """lazy_import() for optional dependencies: None when not installed"""
+    try:
+        return lazy_import(name)
+    except ImportError:
+        return None
+
+
+def deferred_imports() -> List[str]:
+    """Names of lazily imported modules that have not been loaded yet"""
+    return sorted(name for name, module in _lazy_modules.items() if module._lazy_module is None)
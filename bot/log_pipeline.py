@@ -0,0 +1,185 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS LOGGING PIPELINE                              ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import atexit
+import copy
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from .log_sampling import configure_log_sampling, flush_sampled_loggers
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed with extra=
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra`` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _LoopQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that only merges the message arguments on the caller's
+    thread; formatting and I/O happen in the listener thread
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class RotatingLogFile(logging.handlers.RotatingFileHandler):
+    """
+    Log file rotated when it exceeds max_bytes or is older than interval
+    seconds, whichever comes first, with optional gzip compression of the
+    rotated files (nexus_userbot.log.1.gz, ...)
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 5,
+                 interval: float = 0, compress: bool = True):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding='utf-8', delay=True)
+        self.interval = interval
+        self.rollover_at = time.time() + interval if interval else None
+        if compress:
+            self.namer = lambda name: name + '.gz'
+            self.rotator = _gzip_rotator
+
+    def shouldRollover(self, record) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        super().doRollover()
+        if self.interval:
+            self.rollover_at = time.time() + self.interval
+
+
+def _level(name: str) -> int:
+    level = logging.getLevelName(str(name).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _file_handler(config, suffix: str = "") -> Optional[logging.Handler]:
+    if not config.LOG_FILE:
+        return None
+
+    path = config.LOG_FILE
+    if suffix:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{suffix}{ext or '.log'}"
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    handler = RotatingLogFile(
+        path,
+        max_bytes=config.LOG_MAX_BYTES,
+        backup_count=config.LOG_BACKUP_COUNT,
+        interval=config.LOG_ROTATE_HOURS * 3600,
+        compress=config.LOG_COMPRESS
+    )
+    handler.setFormatter(JsonFormatter() if config.LOG_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT))
+    return handler
+
+
+def setup_logging(config, file_suffix: str = "") -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue drained by a background thread
+
+    The root logger gets a single QueueHandler; the console and rotating file
+    handlers run in the listener thread so no disk write happens on the
+    event loop. Calling it again replaces the previous pipeline.
+
+    Args:
+        config: Config with LOG_* settings
+        file_suffix: Inserted into the log file name (used by worker processes)
+    """
+    global _listener
+    shutdown_logging()
+
+    handlers = []
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(TEXT_FORMAT))
+    handlers.append(console)
+
+    file_handler = _file_handler(config, file_suffix)
+    if file_handler:
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_LoopQueueHandler(log_queue))
+    root.setLevel(_level(config.LOG_LEVEL))
+
+    for name, level in config.LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(_level(level))
+
+    logging.captureWarnings(True)
+    configure_log_sampling(config)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    flush_sampled_loggers()
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
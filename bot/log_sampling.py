@@ -0,0 +1,147 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS LOG SAMPLING                                  ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import logging
+import time
+from typing import Dict, List
+
+_defaults = {
+    'rate': 1.0,
+    'burst': 5,
+    'sample_every': 1,
+    'summary_interval': 60.0
+}
+
+_loggers: List['SampledLogger'] = []
+
+
+def configure_log_sampling(config):
+    """Set sampling limits for every sampled logger from Config"""
+    _defaults['rate'] = config.LOG_SAMPLE_RATE
+    _defaults['burst'] = config.LOG_SAMPLE_BURST
+    _defaults['sample_every'] = max(1, config.LOG_SAMPLE_EVERY)
+    _defaults['summary_interval'] = config.LOG_SUMMARY_INTERVAL
+    for sampled in _loggers:
+        sampled.reset()
+
+
+class SampledLogger:
+    """
+    Logger wrapper for per-event log lines on hot paths
+
+    Every call carries a key (a command name, a user id, ...). Per key, lines
+    are sampled 1-in-``sample_every`` and then pass a token bucket of
+    ``rate`` lines/second with ``burst`` capacity. Arguments use lazy %-formatting, so
+    a line that is filtered by level, rate or sampling is never formatted.
+    Dropped lines are counted and reported in a periodic "suppressed"
+    summary.
+    """
+
+    def __init__(self, logger: logging.Logger, max_keys: int = 10000):
+        self.logger = logger
+        self.max_keys = max_keys
+        self.reset()
+
+    def reset(self):
+        """Clear all per-key state (used when limits change)"""
+        self.rate = _defaults['rate']
+        self.burst = _defaults['burst']
+        self.sample_every = _defaults['sample_every']
+        self.summary_interval = _defaults['summary_interval']
+        self.buckets: Dict[str, List[float]] = {}
+        self.seen: Dict[str, int] = {}
+        self.suppressed: Dict[str, int] = {}
+        self.last_summary = time.monotonic()
+
+    def _allow(self, key: str, now: float) -> bool:
+        if self.sample_every > 1:
+            seen = self.seen.get(key)
+            if seen is None:
+                seen = 0
+                # Each table is bounded on its own: with rate 0 no buckets are made
+                if len(self.seen) >= self.max_keys:
+                    self.seen.clear()
+            self.seen[key] = seen = seen + 1
+            if seen % self.sample_every:
+                return False
+
+        if self.rate <= 0:
+            return True
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= self.max_keys:
+                self.buckets.clear()
+            bucket = self.buckets[key] = [float(self.burst), now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+    def log(self, level: int, key, msg: str, *args, **kwargs):
+        """Log msg % args under key unless it is filtered or sampled out"""
+        if not self.logger.isEnabledFor(level):
+            return
+
+        now = time.monotonic()
+        key = str(key)
+        if self._allow(key, now):
+            kwargs.setdefault('stacklevel', 3)
+            self.logger.log(level, msg, *args, **kwargs)
+        else:
+            if not self.suppressed:
+                self.last_summary = now  # Summary window starts at the first drop
+            if key not in self.suppressed and len(self.suppressed) >= self.max_keys:
+                key = 'other'
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+
+        if self.suppressed and now - self.last_summary >= self.summary_interval:
+            self.flush(now)
+
+    def flush(self, now: float = None):
+        """Emit the suppressed-messages summary and reset the counters"""
+        now = time.monotonic() if now is None else now
+        if self.suppressed:
+            total = sum(self.suppressed.values())
+            top = sorted(self.suppressed.items(), key=lambda item: item[1], reverse=True)[:10]
+            self.logger.info(
+                "Suppressed %d messages in the last %.0fs (%s)",
+                total, now - self.last_summary,
+                ", ".join(f"{key}={count}" for key, count in top)
+            )
+            self.suppressed = {}
+        self.last_summary = now
+
+    def debug(self, key, msg: str, *args, **kwargs):
+        self.log(logging.DEBUG, key, msg, *args, **kwargs)
+
+    def info(self, key, msg: str, *args, **kwargs):
+        self.log(logging.INFO, key, msg, *args, **kwargs)
+
+    def warning(self, key, msg: str, *args, **kwargs):
+        self.log(logging.WARNING, key, msg, *args, **kwargs)
+
+    def error(self, key, msg: str, *args, **kwargs):
+        self.log(logging.ERROR, key, msg, *args, **kwargs)
+
+
+def get_sampled_logger(name: str) -> SampledLogger:
+    """Get a sampled wrapper around logging.getLogger(name)"""
+    sampled = SampledLogger(logging.getLogger(name))
+    _loggers.append(sampled)
+    return sampled
+
+
+def flush_sampled_loggers():
+    """Emit pending summaries of every sampled logger"""
+    for sampled in _loggers:
+        sampled.flush()
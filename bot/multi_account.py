@@ -0,0 +1,220 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      NEXUS MULTI-ACCOUNT RUNTIME                            ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Callable, Dict, List
+
+from dotenv import dotenv_values
+from pyrogram import idle
+
+from config import SCHEMA, Config
+from .http import configure_http_pool, close_http_session
+from .log_pipeline import setup_logging
+from .storage import DEFAULT_SQLITE_PATH
+from .streaming import configure_streaming
+from .uploads import configure_uploads
+
+logger = logging.getLogger(__name__)
+
+# Pyrogram defaults to min(32, cpu + 4) update workers per client; with many
+# accounts in one process that is the bulk of the idle task count
+DEFAULT_ACCOUNT_WORKERS = '4'
+
+
+def _suffixed(path: str, name: str) -> str:
+    """``data/x.db`` -> ``data/x_<name>.db``"""
+    stem, extension = os.path.splitext(path)
+    return f"{stem}_{name}{extension}"
+
+
+def account_defaults(name: str) -> Dict[str, str]:
+    """
+    Per-account files derived from the shared settings, so accounts never
+    share a database, archive, download folder or cooldown state. An
+    account's own settings still take precedence.
+    """
+    def shared(key: str) -> str:
+        return os.getenv(key, SCHEMA[key].default)
+
+    defaults = {
+        'ARCHIVE_PATH': _suffixed(shared('ARCHIVE_PATH'), name),
+        'DOWNLOAD_DIR': os.path.join(shared('DOWNLOAD_DIR'), name),
+        'ASSISTANT_STATE_DB': _suffixed(shared('ASSISTANT_STATE_DB'), name),
+    }
+
+    url = shared('DATABASE_URL')
+    if not url:
+        defaults['DATABASE_URL'] = f"sqlite:///{_suffixed(DEFAULT_SQLITE_PATH, name)}"
+    elif url.startswith('sqlite:///'):
+        defaults['DATABASE_URL'] = f"sqlite:///{_suffixed(url[len('sqlite:///'):], name)}"
+    else:
+        # A server database cannot be split here; it is shared unless the account sets its own
+        logger.warning(f"Account {name} shares DATABASE_URL with the other accounts")
+
+    state_file = shared('AUTO_RESPONSE_STATE_FILE')
+    if state_file:
+        defaults['AUTO_RESPONSE_STATE_FILE'] = _suffixed(state_file, name)
+    return defaults
+
+
+def load_account_envs(accounts_dir: str = "", accounts_file: str = "") -> Dict[str, Dict[str, str]]:
+    """
+    Load per-account settings
+
+    Args:
+        accounts_dir: Directory with one ``<name>.env`` file per account
+        accounts_file: JSON file with either a list of objects (each with a
+            ``name`` key) or an object mapping account name to settings
+
+    Returns:
+        Mapping of account name to its environment overrides
+    """
+    accounts: Dict[str, Dict[str, str]] = {}
+
+    if accounts_dir and os.path.isdir(accounts_dir):
+        for file in sorted(os.listdir(accounts_dir)):
+            if not file.endswith('.env'):
+                continue
+            name = file[:-4]
+            values = dotenv_values(os.path.join(accounts_dir, file))
+            accounts[name] = {k: v for k, v in values.items() if v is not None}
+
+    if accounts_file and os.path.isfile(accounts_file):
+        with open(accounts_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if isinstance(data, dict):
+            entries = [dict(settings, name=name) for name, settings in data.items()]
+        else:
+            entries = data
+
+        for index, entry in enumerate(entries):
+            name = str(entry.get('name') or f"account{index + 1}")
+            accounts[name] = {k: str(v) for k, v in entry.items() if k != 'name'}
+
+    return accounts
+
+
+class MultiAccountRuntime:
+    """
+    Runs several userbot accounts on one event loop
+
+    Plugin modules, the HTTP connection pool and module-level caches are
+    shared by all accounts; each account gets its own Config, Client and
+    NexusUserbot instance, and its own database, archive, download folder
+    and cooldown state file, so state and rate limits stay per account.
+    """
+
+    def __init__(self, accounts_dir: str = "", accounts_file: str = "",
+                 userbot_factory: Callable = None, start_concurrency: int = 5,
+                 runtime_setup: Callable = None):
+        self.accounts_dir = accounts_dir
+        self.accounts_file = accounts_file
+        self.userbot_factory = userbot_factory
+        self.start_concurrency = max(1, start_concurrency)
+        # Called with the first account's Config to keep process-wide settings in step with it
+        self.runtime_setup = runtime_setup
+        self.userbots: Dict[str, object] = {}
+        self._watchers: List[asyncio.Task] = []
+
+    def build_configs(self) -> Dict[str, Config]:
+        """Create one Config per account, skipping invalid ones"""
+        configs = {}
+
+        for name, env in load_account_envs(self.accounts_dir, self.accounts_file).items():
+            overrides = {
+                'SESSION_NAME': name,
+                'ASSISTANT_SESSION_NAME': f"{name}_assistant",
+                'INSTANCE_NAME': name,
+                'CLIENT_WORKERS': os.getenv('CLIENT_WORKERS', DEFAULT_ACCOUNT_WORKERS),
+                **account_defaults(name),
+            }
+            overrides.update(env)
+
+            try:
+                configs[name] = Config(overrides)
+            except ValueError as e:
+                logger.error(f"Skipping account {name}: {e}")
+
+        return configs
+
+    async def start(self) -> List[str]:
+        """Start every configured account, returning the names that came up"""
+        configs = self.build_configs()
+        if not configs:
+            logger.error("No accounts configured for multi-account mode")
+            return []
+
+        pool_size = max(config.HTTP_POOL_SIZE for config in configs.values())
+        configure_http_pool(pool_size)
+
+        # Process-wide settings come from the first account
+        first = next(iter(configs.values()))
+        setup_logging(first)
+        configure_streaming(first)
+        configure_uploads(first.UPLOAD_CONCURRENCY)
+        if self.runtime_setup:
+            self.runtime_setup(first)
+
+        # Every account reloads its own settings when .env changes
+        loop = asyncio.get_running_loop()
+        self._watchers = [
+            loop.create_task(config.watch(interval=config.CONFIG_WATCH_INTERVAL))
+            for config in configs.values() if config.CONFIG_WATCH_INTERVAL > 0
+        ]
+
+        # Bound concurrent logins so a large fleet does not hit auth flood limits
+        semaphore = asyncio.Semaphore(self.start_concurrency)
+
+        async def start_account(index: int, name: str, config: Config):
+            async with semaphore:
+                userbot = self.userbot_factory(config, show_banner=(index == 0))
+                if await userbot.start():
+                    self.userbots[name] = userbot
+                    logger.info(f"Account started: {name}")
+                else:
+                    logger.error(f"Account failed to start: {name}")
+                    await userbot.stop()
+
+        await asyncio.gather(*[
+            start_account(index, name, config)
+            for index, (name, config) in enumerate(configs.items())
+        ])
+
+        logger.info(f"Multi-account runtime started {len(self.userbots)}/{len(configs)} accounts")
+        return list(self.userbots)
+
+    async def stop(self):
+        """Stop all running accounts"""
+        for watcher in self._watchers:
+            watcher.cancel()
+        self._watchers = []
+        await asyncio.gather(
+            *[userbot.stop() for userbot in self.userbots.values()],
+            return_exceptions=True
+        )
+        self.userbots.clear()
+        await close_http_session()
+
+    async def run(self):
+        """Start all accounts and keep running until interrupted"""
+        try:
+            if not await self.start():
+                return
+
+            logger.info("🎉 Nexus multi-account runtime is now running!")
+            await idle()
+
+        except KeyboardInterrupt:
+            logger.info("Multi-account runtime stopped by user")
+        finally:
+            await self.stop()
@@ -0,0 +1,122 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS OUTBOUND QUEUE                                ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Hashable, Optional, Set
+
+from pyrogram.errors import FloodWait
+
+logger = logging.getLogger(__name__)
+
+
+class OutboundQueue:
+    """
+    Paced sender for messages the bot starts on its own (auto-responses)
+
+    Sends run one at a time from a background task, at most one every
+    ``interval`` seconds. A FloodWait pauses the whole queue for the
+    requested time and the send is retried. A send whose key is already
+    queued is dropped, so a burst for one chat becomes a single message,
+    and the queue is bounded so a spam wave cannot grow it without limit.
+    """
+
+    def __init__(self, interval: float = 1.0, max_pending: int = 1000, max_retries: int = 3):
+        self.interval = interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self._queue: Optional[asyncio.Queue] = None
+        self._keys: Set[Hashable] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._next_send = 0.0
+
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flood_waits = 0
+
+    def submit(self, key: Hashable, send: Callable[[], Awaitable]) -> bool:
+        """
+        Queue a send
+
+        Args:
+            key: Identifies the target (usually the chat id)
+            send: Zero-argument coroutine function doing the RPC
+
+        Returns:
+            Whether the send was queued
+        """
+        if key in self._keys:
+            self.coalesced += 1
+            return False
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._queue.qsize() >= self.max_pending:
+            self.dropped += 1
+            return False
+
+        self._keys.add(key)
+        self._queue.put_nowait((key, send))
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return True
+
+    async def _run(self):
+        while True:
+            key, send = await self._queue.get()
+            self._keys.discard(key)
+
+            delay = self._next_send - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            await self._deliver(key, send)
+            self._next_send = time.monotonic() + self.interval
+
+    async def _deliver(self, key: Hashable, send: Callable[[], Awaitable]):
+        for attempt in range(self.max_retries + 1):
+            try:
+                await send()
+                self.sent += 1
+                return
+            except FloodWait as e:
+                self.flood_waits += 1
+                if attempt == self.max_retries:
+                    break
+                logger.warning(f"FloodWait {e.value}s, outbound queue paused ({self._queue.qsize()} pending)")
+                await asyncio.sleep(e.value)
+            except Exception as e:
+                logger.error(f"Outbound message to {key} failed: {e}")
+                break
+        self.failed += 1
+
+    async def stop(self):
+        """Stop sending; queued messages are discarded"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._queue = None
+        self._keys.clear()
+
+    def get_stats(self) -> dict:
+        """Queue counters"""
+        return {
+            'pending': self._queue.qsize() if self._queue else 0,
+            'sent': self.sent,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'flood_waits': self.flood_waits
+        }
@@ -0,0 +1,148 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          NEXUS PEER CACHE                                   ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from pyrogram.raw import types as raw_types
+
+logger = logging.getLogger(__name__)
+
+
+def _raw_types(*names) -> tuple:
+    """Resolve raw update classes that exist in the installed layer"""
+    return tuple(t for t in (getattr(raw_types, name, None) for name in names) if t)
+
+
+# Raw updates that change our own profile or a chat's metadata
+_USER_UPDATES = _raw_types('UpdateUser', 'UpdateUserName', 'UpdateUserPhoto',
+                           'UpdateUserPhone', 'UpdateUserEmojiStatus')
+_CHAT_UPDATES = _raw_types('UpdateChat', 'UpdateChannel', 'UpdateChatParticipants',
+                           'UpdateChatDefaultBannedRights')
+
+
+class PeerCache:
+    """
+    TTL cache for get_me / get_chat with request coalescing
+
+    Concurrent callers asking for the same key share one in-flight RPC
+    (single-flight) instead of each hitting Telegram. Entries are keyed per
+    client, so one cache serves every account and the assistant bot. Past
+    ``max_entries`` the least recently used entries are evicted.
+    """
+
+    def __init__(self, me_ttl: float = 300.0, chat_ttl: float = 600.0, max_entries: int = 10000):
+        self.me_ttl = me_ttl
+        self.chat_ttl = chat_ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def _get(self, key: Tuple, ttl: float, fetch: Callable[[], Awaitable]):
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.hits += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        else:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def get_me(self, client):
+        """Cached client.get_me()"""
+        return await self._get((client, 'me'), self.me_ttl, client.get_me)
+
+    async def get_chat(self, client, chat_id):
+        """Cached client.get_chat(chat_id)"""
+        return await self._get((client, 'chat', chat_id), self.chat_ttl,
+                               lambda: client.get_chat(chat_id))
+
+    def invalidate_me(self, client):
+        """Forget the cached profile of a client"""
+        self._entries.pop((client, 'me'), None)
+
+    def invalidate_chat(self, client, chat_id):
+        """Forget a cached chat"""
+        self._entries.pop((client, 'chat', chat_id), None)
+
+    def invalidate(self, client=None):
+        """Forget everything cached for a client, or the whole cache"""
+        if client is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] is client]:
+            del self._entries[key]
+
+    def purge_expired(self) -> int:
+        """Drop expired entries, returning how many were removed"""
+        now = time.monotonic()
+        expired = [key for key, (expires, _) in self._entries.items() if expires <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def handle_raw_update(self, client, update):
+        """Invalidate entries affected by a raw Telegram update"""
+        if _USER_UPDATES and isinstance(update, _USER_UPDATES):
+            entry = self._entries.get((client, 'me'))
+            if entry and getattr(entry[1], 'id', None) == update.user_id:
+                self.invalidate_me(client)
+
+        elif _CHAT_UPDATES and isinstance(update, _CHAT_UPDATES):
+            raw_id = getattr(update, 'channel_id', None)
+            if raw_id is not None:
+                self.invalidate_chat(client, int(f"-100{raw_id}"))
+                return
+            raw_id = getattr(update, 'chat_id', None)
+            if raw_id is None and hasattr(update, 'participants'):
+                raw_id = getattr(update.participants, 'chat_id', None)
+            if raw_id is not None:
+                self.invalidate_chat(client, -raw_id)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {
+            'entries': len(self._entries),
+            'inflight': len(self._inflight),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+# Process-wide cache shared by all clients
+peer_cache = PeerCache()
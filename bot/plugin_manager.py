@@ -11,18 +11,29 @@ import os
 import sys
 import importlib.util
 import inspect
+import logging
 from typing import Dict, List, Optional
-import aiohttp
+from .http import get_http_session
+from .inline_index import register_inline_action
+from .scheduler import register_action
 import asyncio
 
+logger = logging.getLogger(__name__)
+
 class PluginManager:
     """
     Manages plugin installation, loading, and execution for Nexus Userbot
     """
     
-    def __init__(self, client, config):
+    # Plugin modules are shared by every PluginManager in the process, so
+    # running several accounts executes each plugin file only once
+    _module_cache: Dict[str, tuple] = {}
+    
+    def __init__(self, client, config, storage=None):
         self.client = client
         self.config = config
+        # Handed to plugins whose setup_plugin takes a third argument
+        self.storage = storage
         self.plugins_dir = "plugins"
         self.loaded_plugins = {}
         self.available_plugins = {
@@ -91,21 +102,21 @@ class PluginManager:
             plugin_info = self.available_plugins[plugin_name]
             plugin_url = plugin_info["url"]
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(plugin_url) as response:
-                    if response.status == 200:
-                        plugin_code = await response.text()
-                        
-                        # Save plugin file
-                        plugin_path = os.path.join(self.plugins_dir, f"{plugin_name}.py")
-                        with open(plugin_path, 'w', encoding='utf-8') as f:
-                            f.write(plugin_code)
-                        
-                        return True
+            session = get_http_session()
+            async with session.get(plugin_url) as response:
+                if response.status == 200:
+                    plugin_code = await response.text()
+                    
+                    # Save plugin file
+                    plugin_path = os.path.join(self.plugins_dir, f"{plugin_name}.py")
+                    with open(plugin_path, 'w', encoding='utf-8') as f:
+                        f.write(plugin_code)
+                    
+                    return True
             return False
             
         except Exception as e:
-            print(f"Error installing plugin {plugin_name}: {e}")
+            logger.error(f"Error installing plugin {plugin_name}: {e}")
             return False
     
     async def install_plugin_from_file(self, file_path: str, plugin_name: str) -> bool:
@@ -130,7 +141,7 @@ class PluginManager:
             return True
             
         except Exception as e:
-            print(f"Error installing plugin from file: {e}")
+            logger.error(f"Error installing plugin from file: {e}")
             return False
     
     def _validate_plugin_code(self, code: str) -> bool:
@@ -158,10 +169,15 @@ class PluginManager:
             if not os.path.exists(plugin_path):
                 return False
             
-            # Import plugin module
-            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = self._import_plugin_module(plugin_name, plugin_path)
+            
+            # Inline actions contributed to the assistant bot
+            for action in getattr(module, 'INLINE_ACTIONS', []):
+                register_inline_action(action)
+            
+            # Actions scheduled jobs can run
+            for name, action in getattr(module, 'SCHEDULED_ACTIONS', {}).items():
+                register_action(name, action)
             
             # Register plugin with client
             if hasattr(module, 'register_plugin'):
@@ -169,12 +185,37 @@ class PluginManager:
                 self.loaded_plugins[plugin_name] = module
                 return True
             
+            if hasattr(module, 'setup_plugin'):
+                # setup_plugin(client, config[, storage]); plugin state goes in the storage kv table
+                if len(inspect.signature(module.setup_plugin).parameters) > 2:
+                    module.setup_plugin(self.client, self.config, self.storage)
+                else:
+                    module.setup_plugin(self.client, self.config)
+                self.loaded_plugins[plugin_name] = module
+                return True
+            
             return False
             
         except Exception as e:
-            print(f"Error loading plugin {plugin_name}: {e}")
+            logger.error(f"Error loading plugin {plugin_name}: {e}")
             return False
     
+    def _import_plugin_module(self, plugin_name: str, plugin_path: str):
+        """Import a plugin file, reusing the cached module while it is unchanged"""
+        cache_key = os.path.abspath(plugin_path)
+        mtime = os.path.getmtime(plugin_path)
+        
+        cached = self._module_cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        self._module_cache[cache_key] = (mtime, module)
+        return module
+    
     async def unload_plugin(self, plugin_name: str) -> bool:
         """Unload a plugin"""
         try:
@@ -183,7 +224,7 @@ class PluginManager:
                 return True
             return False
         except Exception as e:
-            print(f"Error unloading plugin {plugin_name}: {e}")
+            logger.error(f"Error unloading plugin {plugin_name}: {e}")
             return False
     
     async def remove_plugin(self, plugin_name: str) -> bool:
@@ -197,7 +238,7 @@ class PluginManager:
                 return True
             return False
         except Exception as e:
-            print(f"Error removing plugin {plugin_name}: {e}")
+            logger.error(f"Error removing plugin {plugin_name}: {e}")
             return False
     
     async def load_all_plugins(self):
@@ -211,6 +252,19 @@ class PluginManager:
         
         return loaded_count
     
+    def get_plugin_manifests(self) -> List[Dict]:
+        """Get name, description and commands of every loaded plugin"""
+        manifests = []
+        for plugin_name, module in self.loaded_plugins.items():
+            info = getattr(module, 'PLUGIN_INFO', None) or {}
+            catalog = self.available_plugins.get(plugin_name, {})
+            manifests.append({
+                'name': info.get('name', plugin_name),
+                'description': info.get('description', catalog.get('description', '')),
+                'commands': info.get('commands', catalog.get('commands', []))
+            })
+        return manifests
+    
     def get_plugin_info(self, plugin_name: str) -> Optional[Dict]:
         """Get information about a plugin"""
         if plugin_name in self.available_plugins:
@@ -0,0 +1,507 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS JOB SCHEDULER                                 ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import bisect
+import heapq
+import itertools
+import logging
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Storage kv namespace holding persistent jobs
+NAMESPACE = 'scheduler'
+
+MISFIRE_POLICIES = ('run_once', 'skip')
+
+# Plugin-contributed actions: name -> async def action(client, **params)
+_registered_actions: Dict[str, Callable[..., Awaitable]] = {}
+
+
+def register_action(name: str, action: Callable[..., Awaitable]):
+    """
+    Register an action jobs can run (replaces one with the same name)
+
+    Actions are called as ``await action(client, **params)``; ones scheduled
+    with the .schedule command get the ``chat_id`` they were scheduled in.
+    """
+    _registered_actions[name] = action
+    logger.info(f"Scheduled action registered: {name}")
+
+
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)([smhdw])')
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_duration(text: str) -> float:
+    """
+    Seconds in a duration such as ``90s``, ``10m`` or ``1h30m``
+
+    Raises:
+        ValueError: Not a duration
+    """
+    text = text.strip().lower()
+    if not text or _DURATION.sub('', text):
+        raise ValueError(f"Invalid duration: {text}")
+    return sum(float(amount) * _UNITS[unit] for amount, unit in _DURATION.findall(text))
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    parts = []
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60), ('s', 1)):
+        if seconds >= size:
+            parts.append(f"{seconds // size}{unit}")
+            seconds %= size
+    return ''.join(parts) or '0s'
+
+
+# Triggers -----------------------------------------------------------------
+
+class Once:
+    """Run once at a wall-clock time"""
+
+    def __init__(self, at: float):
+        self.at = at
+
+    def next_after(self, ts: float) -> Optional[float]:
+        return self.at if self.at > ts else None
+
+    def first(self, now: float) -> float:
+        return self.at
+
+    def spec(self) -> str:
+        return f"at:{self.at}"
+
+    def __str__(self) -> str:
+        return f"once at {datetime.fromtimestamp(self.at):%Y-%m-%d %H:%M:%S}"
+
+
+class Every:
+    """Run every ``seconds``"""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, ts: float) -> Optional[float]:
+        return ts + self.seconds
+
+    def first(self, now: float) -> float:
+        return now + self.seconds
+
+    def spec(self) -> str:
+        return f"every:{self.seconds}"
+
+    def __str__(self) -> str:
+        return f"every {format_duration(self.seconds)}"
+
+
+class Cron:
+    """
+    Standard five-field cron expression (minute hour day month weekday) in
+    local time, with ``*``, ranges, lists, ``/step``, month and weekday
+    names and the ``@hourly``-style aliases. Day of month and weekday match
+    either one when both are restricted, as in cron.
+    """
+
+    ALIASES = {
+        '@hourly': '0 * * * *',
+        '@daily': '0 0 * * *',
+        '@midnight': '0 0 * * *',
+        '@weekly': '0 0 * * 0',
+        '@monthly': '0 0 1 * *',
+        '@yearly': '0 0 1 1 *',
+        '@annually': '0 0 1 1 *',
+    }
+    RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+    NAMES = (
+        {},
+        {},
+        {},
+        {name: i for i, name in enumerate(
+            ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)},
+        {name: i for i, name in enumerate(('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'))},
+    )
+    # Give up looking for a matching minute after this many years (e.g. 30 Feb)
+    _SEARCH_YEARS = 5
+
+    def __init__(self, expr: str):
+        self.expr = expr.strip()
+        fields = self.ALIASES.get(self.expr.lower(), self.expr).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expr}")
+
+        parsed = [self._parse_field(field, i) for i, field in enumerate(fields)]
+        self.minutes: List[int] = sorted(parsed[0])
+        self.hours: FrozenSet[int] = parsed[1]
+        self.days: FrozenSet[int] = parsed[2]
+        self.months: FrozenSet[int] = parsed[3]
+        self.weekdays: FrozenSet[int] = frozenset(day % 7 for day in parsed[4])
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+
+    def _parse_field(self, field: str, index: int) -> FrozenSet[int]:
+        low, high = self.RANGES[index]
+        names = self.NAMES[index]
+        values: Set[int] = set()
+
+        def value(token: str) -> int:
+            token = token.lower()
+            number = names[token] if token in names else int(token)
+            if not low <= number <= high:
+                raise ValueError(f"Cron value {token} out of range {low}-{high}")
+            return number
+
+        try:
+            for part in field.split(','):
+                base, _, step = part.partition('/')
+                step = int(step) if step else 1
+                if step < 1:
+                    raise ValueError("Cron step must be positive")
+                if base == '*':
+                    start, end = low, high
+                elif '-' in base:
+                    start, end = (value(token) for token in base.split('-', 1))
+                else:
+                    start = value(base)
+                    end = high if step > 1 else start
+                values.update(range(start, end + 1, step))
+        except ValueError as e:
+            raise ValueError(f"Invalid cron field {field!r}: {e}") from None
+        return frozenset(values)
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day = dt.day in self.days
+        weekday = dt.isoweekday() % 7 in self.weekdays
+        if self._any_day and self._any_weekday:
+            return True
+        if self._any_day:
+            return weekday
+        if self._any_weekday:
+            return day
+        return day or weekday
+
+    def next_after(self, ts: float) -> Optional[float]:
+        dt = datetime.fromtimestamp(ts).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt.replace(year=dt.year + self._SEARCH_YEARS, day=1)
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+            elif dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+            else:
+                index = bisect.bisect_left(self.minutes, dt.minute)
+                if index == len(self.minutes):
+                    dt = dt.replace(minute=0) + timedelta(hours=1)
+                else:
+                    return dt.replace(minute=self.minutes[index]).timestamp()
+        return None
+
+    def first(self, now: float) -> Optional[float]:
+        return self.next_after(now)
+
+    def spec(self) -> str:
+        return f"cron:{self.expr}"
+
+    def __str__(self) -> str:
+        return f"cron {self.expr}"
+
+
+def parse_trigger(spec: str):
+    """Trigger from its spec() string"""
+    kind, _, value = spec.partition(':')
+    if kind == 'at':
+        return Once(float(value))
+    if kind == 'every':
+        return Every(float(value))
+    if kind == 'cron':
+        return Cron(value)
+    raise ValueError(f"Unknown trigger: {spec}")
+
+
+# Jobs ---------------------------------------------------------------------
+
+class Job:
+    """One scheduled action"""
+
+    __slots__ = ('id', 'action', 'params', 'trigger', 'next_run', 'jitter', 'misfire', 'grace',
+                 'persistent', 'description', 'runs', 'last_run')
+
+    def __init__(self, job_id: str, action, params: dict, trigger, next_run: float,
+                 jitter: float = 0.0, misfire: str = 'run_once', grace: float = 60.0,
+                 persistent: bool = True, description: str = ''):
+        if misfire not in MISFIRE_POLICIES:
+            raise ValueError(f"Unknown misfire policy: {misfire}")
+        self.id = job_id
+        self.action = action
+        self.params = params
+        self.trigger = trigger
+        self.next_run = next_run
+        self.jitter = jitter
+        self.misfire = misfire
+        self.grace = grace
+        self.persistent = persistent
+        self.description = description
+        self.runs = 0
+        self.last_run: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'action': self.action,
+            'params': self.params,
+            'trigger': self.trigger.spec(),
+            'next_run': self.next_run,
+            'jitter': self.jitter,
+            'misfire': self.misfire,
+            'grace': self.grace,
+            'description': self.description,
+            'runs': self.runs,
+            'last_run': self.last_run
+        }
+
+    @classmethod
+    def from_dict(cls, job_id: str, data: dict) -> 'Job':
+        job = cls(job_id, data['action'], data.get('params', {}), parse_trigger(data['trigger']),
+                  data['next_run'], data.get('jitter', 0.0), data.get('misfire', 'run_once'),
+                  data.get('grace', 60.0), True, data.get('description', ''))
+        job.runs = data.get('runs', 0)
+        job.last_run = data.get('last_run')
+        return job
+
+
+class Scheduler:
+    """
+    Timed and recurring jobs on one asyncio task
+
+    Jobs sit in a heap ordered by their next run time (wall clock); the
+    task sleeps until the earliest one is due, so each run costs O(log n)
+    however many jobs there are. Adding an earlier job wakes the task.
+    Jobs name their action, so persistent ones can be stored in the kv
+    table and restored on start. A job that was due while the bot was down
+    (or is late by more than its grace period) runs once or is skipped,
+    depending on its misfire policy; recurring jobs then continue from now.
+    Code can also schedule a plain coroutine function, which is not stored.
+    """
+
+    def __init__(self, client, storage=None):
+        self.client = client
+        self.storage = storage
+        self.actions: Dict[str, Callable[..., Awaitable]] = {}
+        self.min_intervals: Dict[str, float] = {}
+        self.jobs: Dict[str, Job] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}
+
+        self.runs = 0
+        self.failures = 0
+        self.missed = 0
+
+    def register_action(self, name: str, action: Callable[..., Awaitable], min_interval: float = 0.0):
+        """
+        Register an action for this scheduler only
+
+        Args:
+            min_interval: Shortest ``Every`` interval jobs of this action may use
+        """
+        self.actions[name] = action
+        if min_interval:
+            self.min_intervals[name] = min_interval
+
+    def get_action(self, name: str) -> Optional[Callable[..., Awaitable]]:
+        return self.actions.get(name) or _registered_actions.get(name)
+
+    def action_names(self) -> List[str]:
+        return sorted(set(self.actions) | set(_registered_actions))
+
+    # Jobs -------------------------------------------------------------------
+
+    def add(self, action, trigger, params: Optional[dict] = None, job_id: Optional[str] = None,
+            jitter: float = 0.0, misfire: str = 'run_once', grace: float = 60.0,
+            description: str = '') -> Job:
+        """
+        Schedule a job
+
+        Args:
+            action: Registered action name, or a coroutine function taking
+                (client, **params); a function makes the job non-persistent
+            trigger: Once, Every or Cron
+            params: JSON-serialisable keyword arguments for the action
+            job_id: Replaces the job with this id if it exists
+            jitter: Up to this many seconds are added to every run
+            misfire: 'run_once' or 'skip' for runs later than ``grace`` seconds
+            description: Shown in job listings
+
+        Raises:
+            ValueError: Unknown action, bad policy or a trigger that never fires
+        """
+        persistent = isinstance(action, str)
+        if persistent and self.get_action(action) is None:
+            raise ValueError(f"Unknown action: {action}")
+        self._check_interval(action, trigger)
+        first = trigger.first(time.time())
+        if first is None:
+            raise ValueError(f"{trigger} never fires")
+
+        job = Job(job_id or uuid.uuid4().hex[:8], action, params or {}, trigger,
+                  first + random.uniform(0, jitter) if jitter else first,
+                  jitter, misfire, grace, persistent,
+                  description or (action if persistent else getattr(action, '__name__', 'job')))
+        self.jobs[job.id] = job
+        self._persist(job)
+        self._push(job)
+        return job
+
+    def _check_interval(self, action, trigger):
+        minimum = self.min_intervals.get(action, 0) if isinstance(action, str) else 0
+        if isinstance(trigger, Every) and trigger.seconds < minimum:
+            raise ValueError(f"{action} jobs must be at least {format_duration(minimum)} apart")
+
+    def remove(self, job_id: str) -> bool:
+        """Cancel a job; its heap entry is skipped when it comes up"""
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return False
+        if job.persistent and self.storage:
+            self.storage.kv_delete(NAMESPACE, job_id)
+        return True
+
+    def _persist(self, job: Job):
+        if job.persistent and self.storage:
+            self.storage.kv_set(NAMESPACE, job.id, job.to_dict())
+
+    def _push(self, job: Job):
+        heapq.heappush(self._heap, (job.next_run, next(self._counter), job.id))
+        if self._heap[0][2] == job.id and self._wakeup is not None:
+            self._wakeup.set()
+
+    # Running ----------------------------------------------------------------
+
+    async def _run(self):
+        heap = self._heap
+        while True:
+            self._wakeup.clear()
+            if not heap:
+                await self._wakeup.wait()
+                continue
+
+            due, _, job_id = heap[0]
+            delay = due - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(heap)
+            job = self.jobs.get(job_id)
+            # Removed or rescheduled since this entry was pushed
+            if job is None or job.next_run != due:
+                continue
+            self._fire(job, due)
+
+    def _fire(self, job: Job, due: float):
+        now = time.time()
+        if now - due > job.grace and job.misfire == 'skip':
+            self.missed += 1
+            logger.info(f"Skipping missed run of job {job.id} ({job.description})")
+        elif job.id in self._running:
+            self.missed += 1
+            logger.warning(f"Job {job.id} ({job.description}) is still running, skipping this run")
+        else:
+            self._running[job.id] = asyncio.get_running_loop().create_task(self._execute(job))
+
+        next_run = job.trigger.next_after(max(now, due))
+        if next_run is None:
+            self.jobs.pop(job.id, None)
+            if job.persistent and self.storage:
+                self.storage.kv_delete(NAMESPACE, job.id)
+            return
+        job.next_run = next_run + random.uniform(0, job.jitter) if job.jitter else next_run
+        self._persist(job)
+        self._push(job)
+
+    async def _execute(self, job: Job):
+        action = self.get_action(job.action) if job.persistent else job.action
+        try:
+            if action is None:
+                raise ValueError(f"Unknown action: {job.action}")
+            await action(self.client, **job.params)
+            job.runs += 1
+            self.runs += 1
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Job {job.id} ({job.description}) failed: {e}")
+        finally:
+            job.last_run = time.time()
+            self._running.pop(job.id, None)
+            if job.id in self.jobs:
+                self._persist(job)
+
+    # Lifecycle --------------------------------------------------------------
+
+    async def load(self) -> int:
+        """Restore persistent jobs from storage"""
+        if not self.storage:
+            return 0
+        loaded = 0
+        for job_id, data in (await self.storage.kv_items(NAMESPACE)).items():
+            try:
+                job = Job.from_dict(job_id, data)
+                self._check_interval(job.action, job.trigger)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Dropping unreadable job {job_id}: {e}")
+                self.storage.kv_delete(NAMESPACE, job_id)
+                continue
+            self.jobs[job_id] = job
+            self._push(job)
+            loaded += 1
+        return loaded
+
+    async def start(self):
+        """Restore stored jobs and start running them"""
+        loaded = await self.load()
+        if loaded:
+            logger.info(f"Restored {loaded} scheduled jobs")
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the scheduler and cancel running jobs"""
+        tasks = list(self._running.values())
+        if self._task and not self._task.done():
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._running.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            'jobs': len(self.jobs),
+            'running': len(self._running),
+            'runs': self.runs,
+            'failures': self.failures,
+            'missed': self.missed
+        }
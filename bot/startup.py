@@ -0,0 +1,163 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS STARTUP PROFILE                               ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import importlib.abc
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from .lazy import deferred_imports
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a loader to time module creation and execution"""
+
+    def __init__(self, loader, timer: 'ImportTimer', name: str):
+        self.loader = loader
+        self.timer = timer
+        self.name = name
+        self.create_time = 0.0
+
+    def create_module(self, spec):
+        start = time.perf_counter()
+        try:
+            return self.loader.create_module(spec)
+        finally:
+            self.create_time = time.perf_counter() - start
+
+    def exec_module(self, module):
+        # Hand the real loader back so reloads and resource readers see it
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        self.timer._enter(self.name, self.create_time)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timer._exit()
+
+    def __getattr__(self, attribute):
+        return getattr(self.loader, attribute)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Records per-module import time, like ``python -X importtime``
+
+    Installed at the front of sys.meta_path, it resolves specs through the
+    remaining finders and wraps their loaders, keeping a stack to split each
+    module's self time from the time spent importing its dependencies.
+    Startup phases are closed with mark().
+    """
+
+    def __init__(self):
+        self.records: List[Tuple[str, int, float, float]] = []  # name, depth, self, cumulative
+        self.phases: List[Tuple[str, float]] = []
+        self._stack: List[list] = []
+        self._resolving = False
+        self._phase_start = time.perf_counter()
+
+    def install(self) -> 'ImportTimer':
+        sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        if self._resolving:
+            return None
+
+        self._resolving = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._resolving = False
+
+        if spec is not None and spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+
+    def _enter(self, name: str, already_spent: float = 0.0):
+        # [name, start, time spent importing dependencies]
+        self._stack.append([name, time.perf_counter() - already_spent, 0.0])
+
+    def _exit(self):
+        name, start, nested = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        self.records.append((name, len(self._stack), cumulative - nested, cumulative))
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    def mark(self, phase: str):
+        """Close the current startup phase under the given name"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._phase_start))
+        self._phase_start = now
+
+    @property
+    def total(self) -> float:
+        return sum(duration for _, duration in self.phases)
+
+    def report(self, top: int = 25, budget_ms: Optional[float] = None) -> str:
+        """Format phase timings, the slowest imports and deferred modules"""
+        lines = ["Startup report", "", "Phases:"]
+        for phase, duration in self.phases:
+            lines.append(f"  {phase:<12} {duration * 1000:9.1f} ms")
+        lines.append(f"  {'total':<12} {self.total * 1000:9.1f} ms")
+        if budget_ms:
+            status = "ok" if self.total * 1000 <= budget_ms else "OVER BUDGET"
+            lines.append(f"  {'budget':<12} {budget_ms:9.1f} ms  {status}")
+
+        lines += [
+            "",
+            f"Slowest imports ({len(self.records)} modules):",
+            f"  {'self [ms]':>10} | {'cumulative [ms]':>15} | module"
+        ]
+        slowest = sorted(self.records, key=lambda record: record[3], reverse=True)[:top]
+        for name, depth, self_time, cumulative in slowest:
+            lines.append(f"  {self_time * 1000:10.1f} | {cumulative * 1000:15.1f} | {'  ' * depth}{name}")
+
+        deferred = deferred_imports()
+        lines += ["", f"Deferred until first use: {', '.join(deferred) if deferred else 'none'}"]
+        return "\n".join(lines)
+
+
+async def run_startup_report(timer: ImportTimer, userbot_factory) -> int:
+    """
+    Time a cold start up to the point of connecting and print the report
+
+    Runs configuration and handler registration without touching the
+    network. Returns a non-zero exit status when STARTUP_BUDGET_MS is
+    exceeded.
+    """
+    from config import Config
+    from .http import configure_http_pool
+    from .streaming import configure_streaming
+
+    config = Config()
+    configure_http_pool(config.HTTP_POOL_SIZE)
+    configure_streaming(config)
+    timer.mark("config")
+
+    userbot = userbot_factory(config, show_banner=False)
+    userbot.initialize_client()
+    await userbot.setup_handlers()
+    timer.mark("handlers")
+
+    timer.uninstall()
+    print(timer.report(budget_ms=config.STARTUP_BUDGET_MS))
+    return 0 if timer.total * 1000 <= config.STARTUP_BUDGET_MS else 1
@@ -0,0 +1,300 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS REPLY STREAMER                                ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import io
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from pyrogram.errors import FloodWait, MessageTooLong
+
+logger = logging.getLogger(__name__)
+
+# Markdown markers understood by Pyrogram, longest first
+_MARKERS = ('```', '**', '__', '~~', '||', '`')
+_LINK = re.compile(r'\[[^\]\n]*\]\([^)\s]*\)')
+# Room kept at the end of every chunk for closing markers
+_RESERVE = 16
+
+_defaults = {
+    'max_length': 4096,
+    'document_threshold': 16384,
+    'pace': 1.0
+}
+
+
+def configure_streaming(config):
+    """Set process-wide streaming limits from Config"""
+    _defaults['max_length'] = config.MAX_MESSAGE_LENGTH
+    _defaults['document_threshold'] = config.STREAM_DOCUMENT_THRESHOLD
+    _defaults['pace'] = config.RATE_LIMIT_DELAY
+
+
+def utf16_len(text: str) -> int:
+    """Length as Telegram counts it (UTF-16 code units)"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _scan(text: str, state: Tuple[Tuple[str, ...], str]) -> Tuple[Tuple[str, ...], str]:
+    """
+    Track which markers are open after text
+
+    The state is (open markers, code block language). Inside ``` blocks and
+    inline code nothing else is parsed, as in Telegram.
+    """
+    stack = list(state[0])
+    language = state[1]
+    i = 0
+    length = len(text)
+
+    while i < length:
+        if stack and stack[-1] in ('```', '`'):
+            marker = stack[-1]
+            end = text.find(marker, i)
+            if end == -1:
+                break
+            stack.pop()
+            i = end + len(marker)
+            if marker == '```':
+                language = ''
+            continue
+
+        for marker in _MARKERS:
+            if text.startswith(marker, i):
+                if marker == '```':
+                    newline = text.find('\n', i + 3)
+                    language = text[i + 3:newline].strip() if newline != -1 else ''
+                    stack.append(marker)
+                    i = newline + 1 if newline != -1 else length
+                elif marker == '`':
+                    stack.append(marker)
+                    i += 1
+                else:
+                    if marker in stack:
+                        stack.remove(marker)
+                    else:
+                        stack.append(marker)
+                    i += len(marker)
+                break
+        else:
+            i += 1
+
+    return tuple(stack), language
+
+
+def _opening(state) -> str:
+    parts = []
+    for marker in state[0]:
+        parts.append(f"```{state[1]}\n" if marker == '```' else marker)
+    return ''.join(parts)
+
+
+def _closing(state) -> str:
+    parts = []
+    for marker in reversed(state[0]):
+        parts.append('\n```' if marker == '```' else marker)
+    return ''.join(parts)
+
+
+def _window(text: str, budget: int) -> int:
+    """Largest number of characters of text fitting budget UTF-16 units"""
+    if utf16_len(text[:budget]) <= budget:
+        return min(budget, len(text))
+    units = 0
+    for index, char in enumerate(text):
+        units += 2 if ord(char) > 0xFFFF else 1
+        if units > budget:
+            return index
+    return len(text)
+
+
+def _find_cut(text: str, window: int) -> int:
+    """Pick a split point at or before window that keeps entities intact"""
+    cut = text.rfind('\n\n', 0, window)
+    if cut < window // 2:
+        cut = text.rfind('\n', 0, window)
+    if cut < window // 4:
+        cut = text.rfind(' ', 0, window)
+    if cut < window // 4:
+        cut = window
+
+    # Never split a [text](url) link
+    for match in _LINK.finditer(text, max(0, cut - 512), min(len(text), cut + 512)):
+        if match.start() < cut < match.end() and match.start() > 0:
+            cut = match.start()
+            break
+
+    # Never split a two-character marker
+    while 0 < cut < len(text) and text[cut - 1:cut + 1] in ('**', '__', '~~', '||', '``'):
+        cut -= 1
+
+    return max(cut, 1)
+
+
+def split_markdown(text: str, max_length: Optional[int] = None) -> List[str]:
+    """
+    Split Markdown text into messages of at most max_length
+
+    Splits prefer paragraph breaks, then line breaks, then spaces, never fall
+    inside a link or a marker, and close any bold/italic/code entity that is
+    still open at the end of a chunk, reopening it at the start of the next.
+    """
+    max_length = max_length or _defaults['max_length']
+    chunks = []
+    state: Tuple[Tuple[str, ...], str] = ((), '')
+    position = 0
+
+    while position < len(text):
+        prefix = _opening(state)
+        remaining = text[position:]
+
+        if utf16_len(prefix) + utf16_len(remaining) <= max_length:
+            chunks.append(prefix + remaining)
+            break
+
+        budget = max(max_length - utf16_len(prefix) - _RESERVE, 1)
+        cut = _find_cut(remaining, _window(remaining, budget))
+        body = remaining[:cut]
+        state_after = _scan(body, state)
+
+        closing = _closing(state_after)
+        if '```' not in state_after[0]:
+            body = body.rstrip()
+        chunks.append(prefix + body + closing)
+
+        position += cut
+        state = state_after
+        if '```' not in state[0]:
+            while position < len(text) and text[position] in ' \n':
+                position += 1
+        elif text.startswith('\n', position):
+            position += 1
+
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+class ReplyStreamer:
+    """
+    Incremental writer for replies that may exceed one message
+
+    Output is written in pieces with write(). It is held until close(), or
+    until it grows past document_threshold, after which every further piece
+    goes straight into an in-memory text document. Text that fits is split
+    with split_markdown() and sent as a paced sequence of messages, the first
+    one editing (or replying to) the command message.
+
+    Use as ``async with ReplyStreamer(message) as out: await out.write(...)``.
+    """
+
+    def __init__(self, message, edit: bool = True, max_length: Optional[int] = None,
+                 document_threshold: Optional[int] = None, pace: Optional[float] = None,
+                 filename: str = "output.txt", caption: str = ""):
+        self.message = message
+        self.client = message._client
+        self.chat_id = message.chat.id
+        self.edit = edit
+        self.max_length = max_length or _defaults['max_length']
+        self.document_threshold = document_threshold or _defaults['document_threshold']
+        self.pace = _defaults['pace'] if pace is None else pace
+        self.filename = filename
+        self.caption = caption
+        self.pending: List[str] = []
+        self.size = 0
+        self.document: Optional[io.BytesIO] = None
+        self.sent = 0
+
+    async def __aenter__(self) -> 'ReplyStreamer':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.close()
+
+    async def write(self, text: str):
+        """Append a piece of output"""
+        if self.document is not None:
+            self.document.write(text.encode('utf-8'))
+            return
+
+        self.pending.append(text)
+        self.size += len(text)
+        if self.size > self.document_threshold:
+            self.document = io.BytesIO()
+            for piece in self.pending:
+                self.document.write(piece.encode('utf-8'))
+            self.pending = []
+
+    async def writeln(self, line: str = ""):
+        """Append a line of output"""
+        await self.write(line + "\n")
+
+    async def close(self):
+        """Send everything written so far"""
+        if self.document is not None:
+            await self._send_document()
+            return
+
+        for chunk in split_markdown(''.join(self.pending), self.max_length):
+            await self._send_text(chunk)
+        self.pending = []
+        self.size = 0
+
+    async def _deliver(self, send, *args, **kwargs):
+        """Call an RPC, waiting out FloodWait"""
+        for attempt in range(3):
+            try:
+                return await send(*args, **kwargs)
+            except FloodWait as e:
+                if attempt == 2:
+                    raise
+                logger.warning(f"FloodWait {e.value}s while streaming reply to {self.chat_id}")
+                await asyncio.sleep(e.value)
+
+    async def _send_text(self, text: str):
+        if self.sent:
+            await asyncio.sleep(self.pace)
+
+        try:
+            if self.sent == 0 and self.edit:
+                await self._deliver(self.message.edit_text, text)
+            elif self.sent == 0:
+                await self._deliver(self.message.reply_text, text)
+            else:
+                await self._deliver(self.client.send_message, self.chat_id, text)
+        except MessageTooLong:
+            # Entity parsing made the chunk longer than expected; halve and retry
+            for part in split_markdown(text, max(len(text) // 2, 64)):
+                await self._send_text(part)
+            return
+
+        self.sent += 1
+
+    async def _send_document(self):
+        self.document.name = self.filename
+        self.document.seek(0)
+        size = len(self.document.getbuffer())
+        caption = self.caption or f"📄 **Output** ({size:,} bytes)"
+
+        if self.edit:
+            await self._deliver(self.message.edit_text, caption)
+            await self._deliver(self.client.send_document, self.chat_id, self.document,
+                                file_name=self.filename)
+        else:
+            await self._deliver(self.message.reply_document, self.document,
+                                caption=caption, file_name=self.filename)
+        self.sent += 1
+        self.document = None
+
+
+async def send_long(message, text: str, edit: bool = True, **kwargs):
+    """Send text of any length through a ReplyStreamer"""
+    streamer = ReplyStreamer(message, edit=edit, **kwargs)
+    await streamer.write(text)
+    await streamer.close()
@@ -0,0 +1,160 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS REPLY TEMPLATES                               ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import logging
+import re
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_FIELD = re.compile(r'\{\{(\w+)\}\}')
+
+
+class CompiledTemplate:
+    """
+    Reply text split once into literal parts and ``{{field}}`` slots
+    Static templates render as a plain attribute read.
+    """
+
+    __slots__ = ('text', 'parts', 'fields')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = tuple(_FIELD.split(text))
+        self.fields = self.parts[1::2]
+
+    def render(self, values: Optional[Dict] = None) -> str:
+        """Fill the dynamic slots"""
+        if not self.fields:
+            return self.text
+        values = values or {}
+        parts = list(self.parts)
+        for i in range(1, len(parts), 2):
+            parts[i] = str(values.get(parts[i], ''))
+        return ''.join(parts)
+
+
+class CommandEntry:
+    """Help metadata of one registered command"""
+
+    __slots__ = ('name', 'usage', 'description', 'section')
+
+    def __init__(self, name: str, usage: str, description: str, section: str):
+        self.name = name
+        self.usage = usage
+        self.description = description
+        self.section = section
+
+
+class CommandRegistry:
+    """Commands actually registered with the client, grouped into help sections"""
+
+    def __init__(self, section_order: Iterable[str] = ()):
+        self.section_order = list(section_order)
+        self.entries: Dict[str, CommandEntry] = {}
+
+    def add(self, name: str, usage: str = "", description: str = "", section: str = "Commands"):
+        """Record a command"""
+        self.entries[name] = CommandEntry(name, usage, description, section)
+
+    def remove(self, name: str):
+        """Forget a command"""
+        self.entries.pop(name, None)
+
+    def sections(self) -> Dict[str, List[CommandEntry]]:
+        """Commands grouped by section, in section_order then first-use order"""
+        grouped: Dict[str, List[CommandEntry]] = {}
+        for entry in self.entries.values():
+            grouped.setdefault(entry.section, []).append(entry)
+
+        order = [s for s in self.section_order if s in grouped]
+        order += [s for s in grouped if s not in order]
+        return {section: grouped[section] for section in order}
+
+
+def build_help_text(title: str, prefix: str, registry: CommandRegistry,
+                    manifests: Iterable[Dict] = (), footer: str = "") -> str:
+    """
+    Generate help text from the command registry and plugin manifests
+
+    Args:
+        title: Heading line
+        prefix: Command prefix shown before each command
+        registry: Registered commands
+        manifests: Plugin manifests with ``name``, ``description`` and ``commands``
+        footer: Closing line
+    """
+    lines = [f"**{title}**", ""]
+
+    for section, entries in registry.sections().items():
+        lines.append(f"**{section}:**")
+        for entry in entries:
+            usage = f" {entry.usage}" if entry.usage else ""
+            lines.append(f"• `{prefix}{entry.name}{usage}` - {entry.description}")
+        lines.append("")
+
+    manifests = list(manifests)
+    if manifests:
+        lines.append("**🔌 Plugins:**")
+        for manifest in manifests:
+            commands = ", ".join(
+                f"`{prefix}{command.lstrip('.')}`" for command in manifest.get('commands', [])
+            )
+            lines.append(f"• **{manifest['name']}** - {manifest.get('description', '')}")
+            if commands:
+                lines.append(f"  {commands}")
+        lines.append("")
+
+    if footer:
+        lines.append(footer)
+
+    return "\n".join(lines).strip()
+
+
+class ReplyTemplates:
+    """
+    Precompiled static command replies
+
+    Each template is produced by a builder from the config and compiled once.
+    The compiled set is rebuilt after the configuration changes, or when
+    invalidate() is called after commands or plugins are registered.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.builders: Dict[str, Callable] = {}
+        self.compiled: Dict[str, CompiledTemplate] = {}
+        self._stale = True
+        config.subscribe(lambda old, new, changed: self.invalidate())
+
+    def register(self, name: str, builder: Callable):
+        """Register a builder taking the config and returning template text"""
+        self.builders[name] = builder
+        self._stale = True
+
+    def invalidate(self):
+        """Force recompilation on next use"""
+        self._stale = True
+
+    def _ensure_compiled(self):
+        if not self._stale:
+            return
+
+        self._stale = False
+        self.compiled = {}
+        for name, builder in self.builders.items():
+            try:
+                self.compiled[name] = CompiledTemplate(builder(self.config).strip())
+            except Exception as e:
+                logger.error(f"Failed to compile template {name}: {e}")
+
+    def render(self, name: str, **values) -> str:
+        """Render a template"""
+        self._ensure_compiled()
+        return self.compiled[name].render(values)
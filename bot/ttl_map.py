@@ -0,0 +1,186 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS TTL MAP                                       ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _ticks() -> int:
+    return int(time.monotonic())
+
+
+class TTLMap:
+    """
+    Mapping whose entries expire ``ttl`` seconds after they were last set
+
+    Timestamps are whole seconds of the monotonic clock. Every map has one
+    TTL, so entries expire in insertion order: a FIFO of (tick, key) is the
+    expiry wheel and sweeping only ever looks at its head. Insert, lookup
+    and delete are O(1); sweeping is O(expired). Expired entries are never
+    returned even before they are swept.
+    """
+
+    def __init__(self, ttl: int, clock: Callable[[], int] = _ticks):
+        self.ttl = int(ttl)
+        self.clock = clock
+        self._data: Dict[Hashable, Tuple[int, Any]] = {}
+        self._order: Deque[Tuple[int, Hashable]] = deque()
+
+    def _live(self, key: Hashable, now: int) -> Optional[Tuple[int, Any]]:
+        entry = self._data.get(key)
+        if entry is None or now - entry[0] >= self.ttl:
+            return None
+        return entry
+
+    def set(self, key: Hashable, value: Any = True):
+        """Store a value, restarting its TTL"""
+        now = self.clock()
+        self._data[key] = (now, value)
+        self._order.append((now, key))
+        # Keep the wheel from outgrowing the live entries between sweeps
+        self._sweep_head(now, 2)
+
+    __setitem__ = set
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._live(key, self.clock())
+        return default if entry is None else entry[1]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        entry = self._live(key, self.clock())
+        if entry is None:
+            raise KeyError(key)
+        return entry[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._live(key, self.clock()) is not None
+
+    def age(self, key: Hashable) -> Optional[int]:
+        """Seconds since the key was set, None if absent or expired"""
+        now = self.clock()
+        entry = self._live(key, now)
+        return None if entry is None else now - entry[0]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        if entry is None or self.clock() - entry[0] >= self.ttl:
+            return default
+        return entry[1]
+
+    def discard(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def _sweep_head(self, now: int, limit: int = 0) -> int:
+        removed = 0
+        order, data = self._order, self._data
+        while order and now - order[0][0] >= self.ttl:
+            tick, key = order.popleft()
+            entry = data.get(key)
+            # A key set again later has a newer tick and stays
+            if entry is not None and entry[0] == tick:
+                del data[key]
+                removed += 1
+            if limit and removed >= limit:
+                break
+        return removed
+
+    def sweep(self) -> int:
+        """Drop expired entries, returning how many were removed"""
+        return self._sweep_head(self.clock())
+
+    def __len__(self) -> int:
+        """Live entries"""
+        self.sweep()
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        self.sweep()
+        return iter(list(self._data))
+
+    def clear(self):
+        self._data.clear()
+        self._order.clear()
+
+    async def run_sweeper(self, interval: float = 60.0):
+        """Sweep periodically (run as a background task)"""
+        while True:
+            await asyncio.sleep(interval)
+            removed = self.sweep()
+            if removed:
+                logger.debug(f"TTL map swept {removed} expired entries")
+
+    def dump(self) -> Dict[str, Any]:
+        """
+        Live entries as a JSON-serialisable dict
+
+        Ages are stored against the wall clock so they stay correct across a
+        restart. Keys and values must be JSON serialisable.
+        """
+        return self.snapshot()()
+
+    def snapshot(self) -> Callable[[], Dict[str, Any]]:
+        """
+        dump() in two steps: copy the entries now, in the thread that owns
+        the map, and return a function that builds the dump from the copy
+        anywhere else (e.g. in an executor)
+        """
+        self.sweep()
+        now, ttl, saved_at = self.clock(), self.ttl, time.time()
+        data = self._data.copy()
+        return lambda: {
+            'saved_at': saved_at,
+            'ttl': ttl,
+            'entries': [[key, now - tick, value] for key, (tick, value) in data.items()]
+        }
+
+    def restore(self, state: Dict[str, Any]) -> int:
+        """
+        Restore entries from dump(), skipping ones that have expired since
+        (call before the map is used)
+
+        Returns:
+            Number of entries restored
+        """
+        now = self.clock()
+        elapsed = max(0, int(time.time() - state.get('saved_at', time.time())))
+        entries = sorted(
+            ((age + elapsed, key, value) for key, age, value in state.get('entries', [])
+             if age + elapsed < self.ttl),
+            key=lambda entry: entry[0], reverse=True
+        )
+        # Oldest first, so the wheel stays in expiry order
+        for age, key, value in entries:
+            self._data[key] = (now - age, value)
+            self._order.append((now - age, key))
+        return len(entries)
+
+    def save(self, path: str):
+        """Write live entries to a JSON file"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.dump(), file)
+        os.replace(temp_path, path)
+
+    def load(self, path: str) -> int:
+        """Restore entries written by save()"""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return self.restore(json.load(file))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable TTL map state {path}: {e}")
+            return 0
@@ -0,0 +1,309 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         NEXUS UPLOAD CACHE                                  ║
+║                                                                              ║
+║ Created by: @nexustech_dev                                                   ║
+║ Copyright (c) 2025 NexusTech Development                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pyrogram.errors import FileIdInvalid, FileReferenceExpired, FileReferenceInvalid, MediaEmpty
+
+logger = logging.getLogger(__name__)
+
+# Storage kv namespace: "<client>:<media type>:<sha256>" -> file_id
+NAMESPACE = 'uploads'
+_BLOCK = 1024 * 1024
+
+# File names given to in-memory and generated uploads, which Telegram needs for documents and stickers
+_DEFAULT_NAMES = {
+    'photo': 'photo.jpg',
+    'sticker': 'sticker.webp',
+    'video': 'video.mp4',
+    'animation': 'animation.mp4',
+    'audio': 'audio.mp3',
+    'voice': 'voice.ogg',
+    'document': 'file',
+}
+
+# Errors that mean a cached file_id can no longer be sent
+_STALE = (FileIdInvalid, FileReferenceExpired, FileReferenceInvalid, MediaEmpty, ValueError)
+
+
+def client_key(client) -> str:
+    """Accounts own their file_ids: the account id, or the session name before start"""
+    me = getattr(client, 'me', None)
+    return str(me.id) if me is not None else str(getattr(client, 'name', id(client)))
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _hash_stream(stream) -> str:
+    """Hash the rest of a stream and rewind it to where it was"""
+    start = stream.tell()
+    digest = hashlib.sha256()
+    for block in iter(lambda: stream.read(_BLOCK), b''):
+        digest.update(block)
+    stream.seek(start)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """
+    Content-addressed file_id cache for outgoing media
+
+    A source (file path, bytes, file object or an iterator of byte chunks)
+    is hashed, and the file_id Telegram returned for the same content, media
+    type and account is sent instead of the bytes, so a repeat costs one
+    small RPC. file_ids are kept in the storage kv table and survive
+    restarts; one that Telegram rejects is forgotten and the file uploaded
+    again. New uploads stream from disk (generators are spooled to a
+    temporary file first), take a progress callback and are limited to
+    ``concurrency`` at a time; concurrent sends of the same new content
+    share one upload. Hashes of paths are memoised on (size, mtime).
+    """
+
+    def __init__(self, storage=None, concurrency: int = 3):
+        self.storage = storage
+        self._slots = asyncio.Semaphore(concurrency)
+        self._file_ids: Dict[str, str] = {}
+        # Client key -> storage of the account that owns it; others use ``storage``
+        self._storages: Dict[str, Any] = {}
+        self._path_hashes: Dict[Tuple[str, int, int], str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.uploads = 0
+        self.uploaded_bytes = 0
+        self.stale = 0
+
+    def configure(self, concurrency: int):
+        self._slots = asyncio.Semaphore(concurrency)
+
+    async def attach(self, storage, client=None):
+        """
+        Load the file_ids kept in storage and persist the ones of ``client``
+        (once started) there; the first storage attached takes the rest
+        """
+        self._file_ids.update(await storage.kv_items(NAMESPACE))
+        if client is not None:
+            self._storages[client_key(client)] = storage
+        if self.storage is None:
+            self.storage = storage
+
+    def detach(self, storage):
+        self._storages = {key: owned for key, owned in self._storages.items() if owned is not storage}
+        if self.storage is storage:
+            self.storage = next(iter(self._storages.values()), None)
+
+    def _storage_for(self, key: str):
+        return self._storages.get(key.split(':', 1)[0], self.storage)
+
+    # Hashing ----------------------------------------------------------------
+
+    async def digest(self, source) -> Optional[str]:
+        """
+        sha256 of a path, bytes or file object; None for sources that are
+        not local content (URLs and file_ids)
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(source, str):
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return None
+            key = (os.path.abspath(source), stat.st_size, stat.st_mtime_ns)
+            if key not in self._path_hashes:
+                self._path_hashes[key] = await loop.run_in_executor(None, _hash_file, source)
+            return self._path_hashes[key]
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(source).hexdigest()
+        if hasattr(source, 'read') and hasattr(source, 'seek'):
+            return await loop.run_in_executor(None, _hash_stream, source)
+        return None
+
+    @staticmethod
+    async def _spool(chunks, directory: str, name: str) -> Tuple[str, str]:
+        """Write an (async) iterator of chunks to a file, hashing on the way"""
+        loop = asyncio.get_running_loop()
+        path = os.path.join(directory, name)
+        digest = hashlib.sha256()
+
+        def write(handle, chunk):
+            handle.write(chunk)
+            digest.update(chunk)
+
+        with open(path, 'wb') as handle:
+            if hasattr(chunks, '__aiter__'):
+                async for chunk in chunks:
+                    await loop.run_in_executor(None, write, handle, chunk)
+            else:
+                await loop.run_in_executor(None, lambda: [write(handle, chunk) for chunk in chunks])
+        return path, digest.hexdigest()
+
+    # Sending ----------------------------------------------------------------
+
+    def _remember(self, key: str, file_id: str):
+        self._file_ids[key] = file_id
+        storage = self._storage_for(key)
+        if storage:
+            storage.kv_set(NAMESPACE, key, file_id)
+
+    def forget(self, key: str):
+        storage = self._storage_for(key)
+        if self._file_ids.pop(key, None) is not None and storage:
+            storage.kv_delete(NAMESPACE, key)
+
+    async def send(self, client, media_type: str, chat_id, source, name: Optional[str] = None,
+                   progress: Optional[Callable] = None, **kwargs):
+        """
+        ``client.send_<media_type>(chat_id, source, **kwargs)``, reusing the
+        file_id of content this account already uploaded
+
+        Args:
+            source: File path, bytes, file object, or iterator / async
+                iterator of bytes; URLs and file_ids are passed through
+            name: File name for in-memory and generated content
+            progress: Upload progress callback, as Pyrogram's
+        """
+        sender = getattr(client, f"send_{media_type}")
+        name = name or getattr(source, 'name', None) or _DEFAULT_NAMES.get(media_type, 'file')
+        spool_dir = None
+        try:
+            if not isinstance(source, (str, bytes, bytearray, memoryview)) and not hasattr(source, 'read') \
+                    and (hasattr(source, '__aiter__') or hasattr(source, '__iter__')):
+                spool_dir = tempfile.mkdtemp(prefix='nexus-upload-')
+                source, sha256 = await self._spool(source, spool_dir, os.path.basename(name))
+            else:
+                sha256 = await self.digest(source)
+            if sha256 is None:
+                return await sender(chat_id, source, progress=progress, **kwargs)
+
+            key = f"{client_key(client)}:{media_type}:{sha256}"
+            file_id = self._file_ids.get(key)
+            if file_id is None:
+                # The same content may be being uploaded right now
+                file_id = await self._wait(key)
+
+            if file_id is not None:
+                try:
+                    sent = await sender(chat_id, file_id, **kwargs)
+                    self.hits += 1
+                    return sent
+                except _STALE as e:
+                    logger.info(f"Cached {media_type} {file_id[:16]}... is no longer valid ({e}), uploading again")
+                    self.stale += 1
+                    self.forget(key)
+                # A concurrent send that found it stale too may have started the upload already
+                file_id = await self._wait(key)
+                if file_id is not None:
+                    self.hits += 1
+                    return await sender(chat_id, file_id, **kwargs)
+
+            return await self._upload(key, sender, media_type, chat_id, source, name, progress, kwargs)
+        finally:
+            if spool_dir:
+                shutil.rmtree(spool_dir, ignore_errors=True)
+
+    async def _wait(self, key: str) -> Optional[str]:
+        """file_id of a running upload of the same content, if there is one and it succeeds"""
+        future = self._inflight.get(key)
+        if future is None:
+            return None
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            return None
+
+    async def _upload(self, key: str, sender, media_type: str, chat_id, source, name: str,
+                      progress: Optional[Callable], kwargs: Dict[str, Any]):
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                source = io.BytesIO(source)
+            if hasattr(source, 'read') and not getattr(source, 'name', None):
+                # Pyrogram takes the file name of documents and stickers from the stream
+                source.name = name
+            async with self._slots:
+                sent = await sender(chat_id, source, progress=progress, **kwargs)
+
+            media = getattr(sent, media_type, None) if sent else None
+            file_id = getattr(media, 'file_id', None)
+            self.uploads += 1
+            self.uploaded_bytes += getattr(media, 'file_size', 0) or 0
+            if file_id:
+                self._remember(key, file_id)
+            future.set_result(file_id)
+            return sent
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody else may be waiting; do not log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def send_many(self, client, media_type: str, chat_id, sources: List, **kwargs) -> List:
+        """Send several files, uploading new ones ``concurrency`` at a time; results follow ``sources``"""
+        return await asyncio.gather(*(self.send(client, media_type, chat_id, source, **kwargs)
+                                      for source in sources))
+
+    async def set_chat_photo(self, client, chat_id, source) -> bool:
+        """
+        Set a chat photo unless this account already set the same content
+
+        set_chat_photo returns no file_id, so the cache records the hash of
+        the photo last applied per chat instead.
+
+        Returns:
+            Whether the photo was changed
+        """
+        sha256 = await self.digest(source)
+        key = f"{client_key(client)}:chat_photo:{chat_id}"
+        if sha256 is not None and self._file_ids.get(key) == sha256:
+            self.hits += 1
+            return False
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        await client.set_chat_photo(chat_id=chat_id, photo=source)
+        if sha256 is not None:
+            self._remember(key, sha256)
+        return True
+
+    def get_stats(self) -> dict:
+        return {
+            'file_ids': len(self._file_ids),
+            'hits': self.hits,
+            'uploads': self.uploads,
+            'uploaded_bytes': self.uploaded_bytes,
+            'stale': self.stale,
+            'active': len(self._inflight)
+        }
+
+
+# Shared by the userbot, the assistant bot and plugins
+upload_cache = UploadCache()
+
+
+def configure_uploads(concurrency: int):
+    upload_cache.configure(concurrency)
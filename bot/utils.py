@@ -208,6 +208,23 @@ class BotUtils:
         except:
             return ""
     
+    @staticmethod
+    def split_text(text: str, max_length: int = 4096) -> List[str]:
+        """Split text into chunks of at most max_length, preferring line breaks"""
+        if len(text) <= max_length:
+            return [text]
+
+        chunks = []
+        while len(text) > max_length:
+            cut = text.rfind('\n', 0, max_length)
+            if cut <= 0:
+                cut = max_length
+            chunks.append(text[:cut])
+            text = text[cut:].lstrip('\n')
+        if text:
+            chunks.append(text)
+        return chunks
+
     @staticmethod
     def get_timestamp() -> str:
         """Get current timestamp"""
@@ -11,148 +11,585 @@
 
 import os
 import json
+import asyncio
 import logging
-from typing import Optional, List
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-class Config:
+_environment_loaded = False
+_process_keys: FrozenSet[str] = frozenset()
+_dotenv_keys: FrozenSet[str] = frozenset()
+_dotenv_path = ""
+
+
+def reload_environment():
     """
-    Configuration class for Nexus Userbot
-    Handles all environment variables and settings
+    Re-read .env into the process environment
+
+    Variables set by the real environment always win; values that came
+    from .env are updated, and removed when they disappear from the file.
     """
-    
-    def __init__(self):
-        self._load_config()
-        self._validate_config()
-    
-    def _load_config(self):
-        """Load configuration from environment variables"""
-        
-        # Telegram API credentials
-        self.API_ID = int(os.getenv('API_ID', '0'))
-        self.API_HASH = os.getenv('API_HASH', '')
-        self.STRING_SESSION = os.getenv('STRING_SESSION', '')
-        self.SESSION_STRING = os.getenv('SESSION_STRING', '')
-        
-        # Bot configuration
-        self.COMMAND_PREFIX = os.getenv('COMMAND_PREFIX', '.')
-        self.BOT_NAME = os.getenv('BOT_NAME', 'Nexus Userbot')
-        self.BOT_VERSION = os.getenv('BOT_VERSION', '2.0')
-        
-        # Assistant Bot Configuration (for hybrid mode)
-        self.BOT_TOKEN = os.getenv('BOT_TOKEN', '')
-        self.BOT_USERNAME = os.getenv('BOT_USERNAME', '')
-        self.ASSISTANT_NAME = os.getenv('ASSISTANT_NAME', 'Nexus Assistant')
-        self.ASSISTANT_BIO = os.getenv('ASSISTANT_BIO', '🤖 Nexus Userbot Assistant | Advanced Telegram Automation | Created by @nexustech_dev')
-        self.ASSISTANT_DESCRIPTION = os.getenv('ASSISTANT_DESCRIPTION', 'Advanced Telegram userbot with AI capabilities, file management, and automation features. Your personal Telegram assistant.')
-        self.ASSISTANT_PROFILE_PIC = os.getenv('ASSISTANT_PROFILE_PIC', 'assets/nexus_bot_profile.png')
-        self.AUTO_UPDATE_BOT_PROFILE = os.getenv('AUTO_UPDATE_BOT_PROFILE', 'true').lower() == 'true'
-        
-        # BotFather Automation Settings
-        self.AUTO_SETUP_BOTFATHER = os.getenv('AUTO_SETUP_BOTFATHER', 'true').lower() == 'true'
-        self.BOTFATHER_SETUP_DELAY = int(os.getenv('BOTFATHER_SETUP_DELAY', '3'))
-        self.SKIP_BOTFATHER_ON_ERROR = os.getenv('SKIP_BOTFATHER_ON_ERROR', 'true').lower() == 'true'
-        
-        # Public Commands Settings
-        self.ENABLE_PUBLIC_COMMANDS = os.getenv('ENABLE_PUBLIC_COMMANDS', 'false').lower() == 'true'
-        self.ALLOWED_PUBLIC_COMMANDS = self._parse_list(os.getenv('ALLOWED_PUBLIC_COMMANDS', 'ping,info,help'))
-        self.PUBLIC_COMMAND_COOLDOWN = int(os.getenv('PUBLIC_COMMAND_COOLDOWN', '5'))
-        
-        # Inline Mode Settings
-        self.ENABLE_INLINE_MODE = os.getenv('ENABLE_INLINE_MODE', 'true').lower() == 'true'
-        self.INLINE_CACHE_TIME = int(os.getenv('INLINE_CACHE_TIME', '300'))
-        
-        # Log Group Settings
-        log_group_raw = os.getenv('LOG_GROUP_ID', '')
-        self.LOG_GROUP_ID = None
-        if log_group_raw:
+    global _dotenv_keys
+    from dotenv import dotenv_values
+
+    values = dotenv_values(_dotenv_path) if _dotenv_path else {}
+    loaded = {key for key, value in values.items() if key not in _process_keys and value is not None}
+    for key in _dotenv_keys - loaded:
+        os.environ.pop(key, None)
+    for key in loaded:
+        os.environ[key] = values[key]
+    _dotenv_keys = frozenset(loaded)
+
+
+def load_environment():
+    """Load .env into the process environment (once, on first use)"""
+    global _environment_loaded, _process_keys, _dotenv_path
+    if _environment_loaded:
+        return
+    from dotenv import find_dotenv
+    _process_keys = frozenset(os.environ)
+    _dotenv_path = find_dotenv()
+    reload_environment()
+    _environment_loaded = True
+
+
+class ConfigError(ValueError):
+    """Raised for settings that do not match the schema"""
+
+
+# Parsers: each accepts the raw string from the environment or an already
+# typed value (from update_config) and returns the typed value
+
+_TRUE = {'true', '1', 'yes', 'on'}
+_FALSE = {'false', '0', 'no', 'off', ''}
+
+
+def _str(value) -> str:
+    return str(value)
+
+
+def _lower(value) -> str:
+    return str(value).strip().lower()
+
+
+def _bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ConfigError(f"expected true or false, got {value!r}")
+
+
+def _int(value) -> int:
+    if isinstance(value, bool):
+        raise ConfigError(f"expected an integer, got {value!r}")
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise ConfigError(f"expected an integer, got {value!r}") from None
+
+
+def _float(value) -> float:
+    if isinstance(value, bool):
+        raise ConfigError(f"expected a number, got {value!r}")
+    try:
+        return float(value if isinstance(value, (int, float)) else str(value).strip())
+    except ValueError:
+        raise ConfigError(f"expected a number, got {value!r}") from None
+
+
+def _list(value) -> Tuple[str, ...]:
+    """Comma-separated string into a tuple"""
+    items = value if isinstance(value, (list, tuple, set, frozenset)) else str(value).split(',')
+    return tuple(str(item).strip() for item in items if str(item).strip())
+
+
+def _optional_int(value) -> Optional[int]:
+    if value is None or isinstance(value, int) and not isinstance(value, bool):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        logger.warning(f"Invalid integer setting: {text}")
+        return None
+
+
+def _levels(value) -> Mapping[str, str]:
+    """Parse 'logger=LEVEL,logger=LEVEL' into a read-only mapping"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({str(name): str(level).upper() for name, level in value.items()})
+    levels = {}
+    for item in _list(value):
+        name, separator, level = item.partition('=')
+        if separator and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+        else:
+            logger.warning(f"Ignoring invalid LOG_LEVELS entry: {item}")
+    return MappingProxyType(levels)
+
+
+def _json(value) -> Mapping:
+    """Parse a JSON object into a read-only mapping"""
+    if isinstance(value, Mapping):
+        return MappingProxyType(dict(value))
+    try:
+        parsed = json.loads(value) if str(value).strip() else {}
+    except json.JSONDecodeError:
+        logger.warning(f"Failed to parse dictionary from: {value}")
+        parsed = {}
+    if not isinstance(parsed, dict):
+        logger.warning(f"Expected a JSON object, got: {value}")
+        parsed = {}
+    return MappingProxyType(parsed)
+
+
+def _at_least(minimum):
+    def check(value):
+        if value < minimum:
+            return f"must be at least {minimum}"
+    return check
+
+
+def _one_of(*choices):
+    def check(value):
+        if value not in choices:
+            return f"must be one of {', '.join(choices)}"
+    return check
+
+
+class Setting:
+    """One typed configuration key"""
+
+    __slots__ = ('name', 'parse', 'default', 'check', 'restart', 'secret')
+
+    def __init__(self, name: str, parse: Callable, default: str, check: Callable = None,
+                 restart: bool = False, secret: bool = False):
+        self.name = name
+        self.parse = parse
+        self.default = default
+        self.check = check
+        self.restart = restart  # Only takes effect when the client is recreated
+        self.secret = secret
+
+    def coerce(self, value):
+        """Typed, checked value; the default is used when value is None"""
+        typed = self.parse(self.default if value is None else value)
+        if self.check is not None and typed is not None:
+            problem = self.check(typed)
+            if problem:
+                raise ConfigError(problem)
+        return typed
+
+    def format(self, value) -> str:
+        """Environment string form of a typed value"""
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, tuple):
+            return ','.join(value)
+        if isinstance(value, Mapping):
+            if self.parse is _levels:
+                return ','.join(f"{name}={level}" for name, level in value.items())
+            return json.dumps(dict(value))
+        return str(value)
+
+
+SETTINGS: Tuple[Setting, ...] = (
+    # Telegram API credentials
+    Setting('API_ID', _int, '0', restart=True),
+    Setting('API_HASH', _str, '', restart=True, secret=True),
+    Setting('STRING_SESSION', _str, '', restart=True, secret=True),
+    Setting('SESSION_STRING', _str, '', restart=True, secret=True),
+    Setting('SESSION_NAME', _str, 'nexus_userbot', restart=True),
+
+    # Bot configuration
+    Setting('COMMAND_PREFIX', _str, '.', check=lambda value: None if value.strip() else "must not be empty"),
+    Setting('BOT_NAME', _str, 'Nexus Userbot'),
+    Setting('BOT_VERSION', _str, '2.0'),
+
+    # Assistant Bot Configuration (for hybrid mode)
+    Setting('BOT_TOKEN', _str, '', restart=True, secret=True),
+    Setting('BOT_USERNAME', _str, ''),
+    Setting('ASSISTANT_SESSION_NAME', _str, 'nexus_assistant', restart=True),
+    Setting('ASSISTANT_NAME', _str, 'Nexus Assistant'),
+    Setting('ASSISTANT_BIO', _str, '🤖 Nexus Userbot Assistant | Advanced Telegram Automation | Created by @nexustech_dev'),
+    Setting('ASSISTANT_DESCRIPTION', _str, 'Advanced Telegram userbot with AI capabilities, file management, and automation features. Your personal Telegram assistant.'),
+    Setting('ASSISTANT_PROFILE_PIC', _str, 'assets/nexus_bot_profile.png'),
+    Setting('AUTO_UPDATE_BOT_PROFILE', _bool, 'true'),
+
+    # BotFather Automation Settings
+    Setting('AUTO_SETUP_BOTFATHER', _bool, 'true'),
+    Setting('BOTFATHER_SETUP_DELAY', _int, '3', check=_at_least(0)),
+    Setting('SKIP_BOTFATHER_ON_ERROR', _bool, 'true'),
+
+    # Public Commands Settings
+    Setting('ENABLE_PUBLIC_COMMANDS', _bool, 'false'),
+    Setting('ALLOWED_PUBLIC_COMMANDS', _list, 'ping,info,help'),
+    Setting('PUBLIC_COMMAND_COOLDOWN', _int, '5', check=_at_least(0)),
+
+    # Inline Mode Settings
+    Setting('ENABLE_INLINE_MODE', _bool, 'true'),
+    Setting('INLINE_CACHE_TIME', _int, '300', check=_at_least(0)),
+
+    # Assistant worker processes (0 = handle updates in the main process)
+    Setting('ASSISTANT_WORKERS', _int, '0', check=_at_least(0), restart=True),
+    Setting('ASSISTANT_STATE_DB', _str, 'nexus_assistant_state.db', restart=True),
+
+    # Log Group Settings
+    Setting('LOG_GROUP_ID', _optional_int, ''),
+    Setting('ENABLE_LOG_GROUP', _bool, 'false'),
+    Setting('LOG_ALL_COMMANDS', _bool, 'true'),
+    Setting('LOG_ERRORS', _bool, 'true'),
+    Setting('LOG_USER_ACTIVITY', _bool, 'false'),
+
+    # Logging configuration
+    Setting('LOG_LEVEL', _str, 'INFO'),
+    Setting('LOG_FILE', _str, 'nexus_userbot.log'),
+    Setting('LOG_FORMAT', _lower, 'json', check=_one_of('json', 'text')),
+    Setting('LOG_LEVELS', _levels, ''),
+    Setting('LOG_MAX_BYTES', _int, '10485760', check=_at_least(0)),
+    Setting('LOG_BACKUP_COUNT', _int, '5', check=_at_least(0)),
+    Setting('LOG_ROTATE_HOURS', _float, '24', check=_at_least(0)),
+    Setting('LOG_COMPRESS', _bool, 'true'),
+    Setting('LOG_SAMPLE_RATE', _float, '1.0', check=_at_least(0)),
+    Setting('LOG_SAMPLE_BURST', _int, '5', check=_at_least(1)),
+    Setting('LOG_SAMPLE_EVERY', _int, '1', check=_at_least(1)),
+    Setting('LOG_SUMMARY_INTERVAL', _float, '60', check=_at_least(0)),
+
+    # Security and protection
+    Setting('ENABLE_PROTECTION', _bool, 'true'),
+    Setting('AUTHORIZED_USERS', _list, ''),
+    Setting('BLACKLISTED_USERS', _list, ''),
+    Setting('AUTHORIZED_USERS_FILE', _str, ''),
+    Setting('BLACKLISTED_USERS_FILE', _str, ''),
+
+    # Auto-response settings
+    Setting('ENABLE_AUTO_RESPONSE', _bool, 'false'),
+    Setting('AUTO_RESPONSE_MESSAGE', _str, 'Hi! I am currently using Nexus Userbot. I will respond when available.'),
+    Setting('AUTO_RESPONSE_DELAY', _int, '60', check=_at_least(0)),
+    Setting('AUTO_RESPONSE_STATE_FILE', _str, ''),
+
+    # Feature flags
+    Setting('ENABLE_ANALYTICS', _bool, 'true'),
+    Setting('ENABLE_ERROR_REPORTING', _bool, 'true'),
+    Setting('ENABLE_COMMAND_LOGGING', _bool, 'true'),
+
+    # Cloud deployment settings
+    Setting('DEPLOYMENT_PLATFORM', _str, 'local'),
+    Setting('INSTANCE_NAME', _str, 'nexus-userbot'),
+
+    # Advanced settings
+    Setting('MAX_MESSAGE_LENGTH', _int, '4096', check=_at_least(1)),
+    Setting('RATE_LIMIT_DELAY', _float, '1.0', check=_at_least(0)),
+    Setting('OUTBOUND_QUEUE_SIZE', _int, '1000', check=_at_least(1)),
+    Setting('FLOOD_PROTECTION', _bool, 'true'),
+    Setting('STREAM_DOCUMENT_THRESHOLD', _int, '16384', check=_at_least(1)),
+    Setting('ANIMATION_FRAME_INTERVAL', _float, '1.0', check=_at_least(0.1)),
+    Setting('ANIMATION_MAX_FRAMES', _int, '20', check=_at_least(2)),
+    Setting('STARTUP_BUDGET_MS', _float, '1500', check=_at_least(0)),
+    Setting('CONFIG_WATCH_INTERVAL', _float, '2', check=_at_least(0), restart=True),
+
+    # Calculator limits
+    Setting('CALC_MAX_DIGITS', _int, '1000', check=_at_least(1)),
+    Setting('CALC_TIME_BUDGET', _float, '0.5', check=_at_least(0)),
+    Setting('CALC_SUBPROCESS', _bool, 'false'),
+    Setting('CALC_MAX_ELEMENTS', _int, '10000000', check=_at_least(1)),
+    Setting('CALC_BATCH_TIME_BUDGET', _float, '10.0', check=_at_least(0)),
+    Setting('CALC_MAX_DOCUMENT_SIZE', _int, '5242880', check=_at_least(0)),
+
+    # Multi-account runtime
+    Setting('ACCOUNTS_DIR', _str, '', restart=True),
+    Setting('ACCOUNTS_FILE', _str, '', restart=True),
+    Setting('CLIENT_WORKERS', _int, '0', check=_at_least(0), restart=True),
+    Setting('HTTP_POOL_SIZE', _int, '100', check=_at_least(0)),
+
+    # Plugins
+    Setting('PLUGIN_AUTO_LOAD', _bool, 'false', restart=True),
+
+    # Custom commands
+    Setting('CUSTOM_COMMANDS', _json, '{}'),
+
+    # Persistent storage (SQLite in the working directory when unset)
+    Setting('DATABASE_URL', _str, '', restart=True, secret=True),
+    Setting('STORAGE_BATCH_SIZE', _int, '500', check=_at_least(1)),
+    Setting('STORAGE_FLUSH_INTERVAL', _float, '1.0', check=_at_least(0)),
+    Setting('COUNTER_FLUSH_INTERVAL', _float, '30', check=_at_least(1)),
+
+    # Local full-text message archive (opt-in)
+    Setting('ARCHIVE_ENABLED', _bool, 'false', restart=True),
+    Setting('ARCHIVE_PATH', _str, 'nexus_archive.db', restart=True),
+    Setting('ARCHIVE_RETENTION_DAYS', _int, '90', check=_at_least(0)),
+    Setting('ARCHIVE_MAX_PER_CHAT', _int, '0', check=_at_least(0)),
+
+    # Media downloads (.dl)
+    Setting('DOWNLOAD_DIR', _str, 'downloads'),
+    Setting('DOWNLOAD_CONCURRENCY', _int, '3', check=_at_least(1)),
+    Setting('DOWNLOAD_PROGRESS_INTERVAL', _float, '3.0', check=_at_least(1)),
+    Setting('UPLOAD_CONCURRENCY', _int, '3', check=_at_least(1)),
+)
+
+SCHEMA: Dict[str, Setting] = {setting.name: setting for setting in SETTINGS}
+
+# Values computed from other settings
+_DERIVED = ('NOTIFICATION_ENABLED',)
+
+
+def _derive(values: Dict[str, Any]):
+    values['ENABLE_LOG_GROUP'] = values['ENABLE_LOG_GROUP'] and values['LOG_GROUP_ID'] is not None
+    # Notification settings (hardcoded for creator only - users cannot modify)
+    values['NOTIFICATION_ENABLED'] = True
+
+
+class ConfigSnapshot:
+    """
+    Immutable, typed set of settings
+
+    Built from the schema, so every attribute already has its final type;
+    changes produce a new snapshot via replace().
+    """
+
+    __slots__ = tuple(SCHEMA) + _DERIVED
+
+    def __init__(self, values: Dict[str, Any]):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ConfigSnapshot is immutable; use Config.update_config()")
+
+    def __delattr__(self, name):
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    @classmethod
+    def build(cls, source: Callable[[str], Any]) -> 'ConfigSnapshot':
+        """
+        Parse every setting from source(name) (None = default)
+
+        Raises:
+            ConfigError: listing every invalid setting
+        """
+        values, errors = {}, []
+        for setting in SETTINGS:
             try:
-                self.LOG_GROUP_ID = int(log_group_raw)
-            except ValueError:
-                logger.warning(f"Invalid LOG_GROUP_ID format: {log_group_raw}")
-                self.LOG_GROUP_ID = None
-        
-        self.ENABLE_LOG_GROUP = os.getenv('ENABLE_LOG_GROUP', 'false').lower() == 'true' and self.LOG_GROUP_ID is not None
-        self.LOG_ALL_COMMANDS = os.getenv('LOG_ALL_COMMANDS', 'true').lower() == 'true'
-        self.LOG_ERRORS = os.getenv('LOG_ERRORS', 'true').lower() == 'true'
-        self.LOG_USER_ACTIVITY = os.getenv('LOG_USER_ACTIVITY', 'false').lower() == 'true'
-        
-        # Logging configuration
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-        self.LOG_FILE = os.getenv('LOG_FILE', 'nexus_userbot.log')
-        
-        # Security and protection
-        self.ENABLE_PROTECTION = os.getenv('ENABLE_PROTECTION', 'true').lower() == 'true'
-        self.AUTHORIZED_USERS = self._parse_list(os.getenv('AUTHORIZED_USERS', ''))
-        self.BLACKLISTED_USERS = self._parse_list(os.getenv('BLACKLISTED_USERS', ''))
-        
-        # Notification settings (hardcoded for creator only - users cannot modify)
-        self.NOTIFICATION_ENABLED = True  # Always enabled for tracking
-        
-        # Auto-response settings
-        self.ENABLE_AUTO_RESPONSE = os.getenv('ENABLE_AUTO_RESPONSE', 'false').lower() == 'true'
-        self.AUTO_RESPONSE_MESSAGE = os.getenv('AUTO_RESPONSE_MESSAGE', 
-                                               'Hi! I am currently using Nexus Userbot. I will respond when available.')
-        self.AUTO_RESPONSE_DELAY = int(os.getenv('AUTO_RESPONSE_DELAY', '60'))
-        
-        # Feature flags
-        self.ENABLE_ANALYTICS = os.getenv('ENABLE_ANALYTICS', 'true').lower() == 'true'
-        self.ENABLE_ERROR_REPORTING = os.getenv('ENABLE_ERROR_REPORTING', 'true').lower() == 'true'
-        self.ENABLE_COMMAND_LOGGING = os.getenv('ENABLE_COMMAND_LOGGING', 'true').lower() == 'true'
-        
-        # Cloud deployment settings
-        self.DEPLOYMENT_PLATFORM = os.getenv('DEPLOYMENT_PLATFORM', 'local')
-        self.INSTANCE_NAME = os.getenv('INSTANCE_NAME', 'nexus-userbot')
-        
-        # Advanced settings
-        self.MAX_MESSAGE_LENGTH = int(os.getenv('MAX_MESSAGE_LENGTH', '4096'))
-        self.RATE_LIMIT_DELAY = float(os.getenv('RATE_LIMIT_DELAY', '1.0'))
-        self.FLOOD_PROTECTION = os.getenv('FLOOD_PROTECTION', 'true').lower() == 'true'
-        
-        # Custom commands
-        self.CUSTOM_COMMANDS = self._parse_dict(os.getenv('CUSTOM_COMMANDS', '{}'))
-        
-        # Database settings (for future use)
-        self.DATABASE_URL = os.getenv('DATABASE_URL', '')
-        
-        logger.info("Configuration loaded successfully")
-    
-    def _parse_list(self, value: str) -> List[str]:
-        """Parse comma-separated string into list"""
-        if not value:
-            return []
-        return [item.strip() for item in value.split(',') if item.strip()]
-    
-    def _parse_dict(self, value: str) -> dict:
-        """Parse JSON string into dictionary"""
-        try:
-            return json.loads(value) if value else {}
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse dictionary from: {value}")
-            return {}
-    
-    def _validate_config(self):
-        """Validate required configuration"""
+                values[setting.name] = setting.coerce(source(setting.name))
+            except ConfigError as e:
+                errors.append(f"{setting.name}: {e}")
+        if errors:
+            raise ConfigError("Invalid configuration:\n" + "\n".join(f"- {error}" for error in errors))
+
+        _derive(values)
+        snapshot = cls(values)
+        snapshot.validate()
+        return snapshot
+
+    def replace(self, **changes) -> 'ConfigSnapshot':
+        """New snapshot with some settings changed (values are coerced)"""
+        values = self.as_dict()
+        for name, value in changes.items():
+            setting = SCHEMA.get(name)
+            if setting is None:
+                raise ConfigError(f"Unknown configuration key: {name}")
+            try:
+                values[name] = setting.coerce(value)
+            except ConfigError as e:
+                raise ConfigError(f"{name}: {e}") from None
+        _derive(values)
+        snapshot = ConfigSnapshot(values)
+        snapshot.validate()
+        return snapshot
+
+    def validate(self):
+        """Check required settings"""
         errors = []
-        
-        if not self.API_ID or self.API_ID == 0:
+
+        if not self.API_ID:
             errors.append("API_ID is required")
-        
+
         if not self.API_HASH:
             errors.append("API_HASH is required")
-        
+
         if errors:
-            error_msg = "Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors)
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        logger.info("Configuration validation passed")
-    
+            raise ConfigError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def diff(self, other: 'ConfigSnapshot') -> FrozenSet[str]:
+        """Names of settings whose values differ"""
+        return frozenset(name for name in self.__slots__ if getattr(self, name) != getattr(other, name))
+
+
+class Config:
+    """
+    Configuration class for Nexus Userbot
+    Handles all environment variables and settings
+
+    Settings are read as plain attributes of the current ConfigSnapshot;
+    reload(), update_config() and watch() swap in a new snapshot atomically
+    and notify subscribers of the changed keys.
+    """
+
+    # The settings live in __dict__, replaced as a whole on every change
+    __slots__ = ('_env', '_snapshot', '_subscribers', '_lock', '__dict__')
+
+    def __init__(self, env: Optional[Dict[str, str]] = None):
+        # Per-instance overrides on top of the process environment, so several
+        # accounts can be configured side by side in one process
+        object.__setattr__(self, '_env', dict(env or {}))
+        object.__setattr__(self, '_subscribers', [])
+        object.__setattr__(self, '_lock', threading.RLock())
+        load_environment()
+
+        try:
+            snapshot = ConfigSnapshot.build(self._getenv)
+        except ConfigError as e:
+            logger.error(str(e))
+            raise
+        self._install(snapshot)
+        logger.info("Configuration loaded successfully")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Config is read-only; use update_config('{name}', value)")
+
+    def _getenv(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Read a setting from the instance overrides, then the environment"""
+        if key in self._env:
+            return self._env[key]
+        return os.getenv(key, default)
+
+    def _install(self, snapshot: ConfigSnapshot):
+        object.__setattr__(self, '__dict__', snapshot.as_dict())
+        object.__setattr__(self, '_snapshot', snapshot)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current immutable settings"""
+        return self._snapshot
+
+    def subscribe(self, callback: Callable, keys: Optional[Iterable[str]] = None) -> Callable:
+        """
+        Call callback(old, new, changed) after settings change
+
+        Args:
+            callback: Receives the old and new ConfigSnapshot and the changed keys
+            keys: Only notify when one of these keys changes
+
+        Returns:
+            Function that removes the subscription
+        """
+        entry = (callback, frozenset(keys) if keys else None)
+        self._subscribers.append(entry)
+
+        def unsubscribe():
+            if entry in self._subscribers:
+                self._subscribers.remove(entry)
+        return unsubscribe
+
+    def _swap(self, snapshot: ConfigSnapshot) -> FrozenSet[str]:
+        old = self._snapshot
+        changed = old.diff(snapshot)
+        if not changed:
+            return changed
+
+        self._install(snapshot)
+        logger.info(f"Configuration updated: {', '.join(sorted(changed))}")
+        for callback, keys in list(self._subscribers):
+            if keys is not None and not keys & changed:
+                continue
+            try:
+                callback(old, snapshot, changed)
+            except Exception as e:
+                logger.error(f"Configuration subscriber failed: {e}")
+        return changed
+
+    def set_value(self, key: str, value) -> FrozenSet[str]:
+        """
+        Change one setting at runtime
+
+        The value is kept as an instance override, so it survives reloads.
+
+        Raises:
+            ConfigError: for unknown keys, settings that need a restart and
+                values that do not match the schema
+        """
+        setting = SCHEMA.get(key)
+        if setting is None:
+            raise ConfigError(f"Unknown configuration key: {key}")
+        if setting.restart:
+            raise ConfigError(f"{key} only takes effect after a restart")
+
+        with self._lock:
+            snapshot = self._snapshot.replace(**{key: value})
+            self._env[key] = setting.format(getattr(snapshot, key))
+            return self._swap(snapshot)
+
+    def reload(self) -> bool:
+        """
+        Re-read .env and the environment and apply the changes
+
+        Settings that need a restart keep their current values. On invalid
+        values the current configuration stays in place.
+        """
+        with self._lock:
+            reload_environment()
+            try:
+                snapshot = ConfigSnapshot.build(self._getenv)
+            except ConfigError as e:
+                logger.error(f"Configuration reload rejected: {e}")
+                return False
+
+            kept = {
+                name: getattr(self._snapshot, name)
+                for name in self._snapshot.diff(snapshot)
+                if name in SCHEMA and SCHEMA[name].restart
+            }
+            if kept:
+                logger.warning(f"Restart required to apply: {', '.join(sorted(kept))}")
+                snapshot = snapshot.replace(**kept)
+            self._swap(snapshot)
+            return True
+
+    async def watch(self, path: Optional[str] = None, interval: float = 2.0):
+        """Reload whenever the .env file changes (run as a background task)"""
+        path = path or _dotenv_path or '.env'
+
+        def mtime():
+            try:
+                return os.stat(path).st_mtime_ns
+            except OSError:
+                return None
+
+        last = mtime()
+        while True:
+            await asyncio.sleep(interval)
+            current = mtime()
+            if current != last:
+                last = current
+                logger.info(f"{path} changed, reloading configuration")
+                self.reload()
+
+    def describe(self, key: str) -> str:
+        """Display form of a setting, with secrets masked"""
+        setting = SCHEMA.get(key)
+        value = getattr(self._snapshot, key)
+        if setting is None:
+            return str(value)
+        if setting.secret and value:
+            return '••••••'
+        return setting.format(value) or '(empty)'
+
     def get_config_summary(self) -> dict:
         """Get a summary of current configuration (excluding sensitive data)"""
         return {
@@ -170,26 +607,21 @@ class Config:
                 'flood_protection_enabled': self.FLOOD_PROTECTION
             }
         }
-    
-    def update_config(self, key: str, value: str) -> bool:
+
+    def update_config(self, key: str, value) -> bool:
         """Update configuration value"""
         try:
-            if hasattr(self, key):
-                setattr(self, key, value)
-                logger.info(f"Configuration updated: {key}")
-                return True
-            else:
-                logger.warning(f"Unknown configuration key: {key}")
-                return False
-        except Exception as e:
-            logger.error(f"Failed to update configuration: {e}")
+            self.set_value(key, value)
+            return True
+        except ConfigError as e:
+            logger.warning(f"Configuration not updated: {e}")
             return False
-    
+
     @property
     def is_development(self) -> bool:
         """Check if running in development environment"""
         return self.DEPLOYMENT_PLATFORM.lower() in ['local', 'development', 'dev']
-    
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment"""
@@ -14,6 +14,15 @@ import asyncio
 import logging
 import sys
 import os
+import time
+
+# `python main.py --startup-report` profiles every import below
+if __name__ == "__main__" and '--startup-report' in sys.argv:
+    from bot.startup import ImportTimer
+    _import_timer = ImportTimer().install()
+else:
+    _import_timer = None
+
 from datetime import datetime, timedelta
 from pyrogram import Client, filters, idle
 from pyrogram.types import Message
@@ -22,31 +31,79 @@ from pyrogram.errors import RPCError, MessageIdInvalid, PhotoExtInvalid, PeerIdI
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from config import Config
+from config import SCHEMA, Config, ConfigError, load_environment
+from bot.access import AccessControl
+from bot.animation import Animator
+from bot.archive import MessageArchive
+from bot.calculator import SafeCalculator, CalculationError
+from bot.counters import CounterService
+from bot.custom_commands import MEDIA_TYPES, CustomCommands
+from bot.downloader import MAX_RANGE, Downloader, media_of
+from bot.scheduler import Cron, Every, Once, Scheduler, format_duration, parse_duration
+from bot.handlers import EventLogger, MessageHandler
+from bot.outbound import OutboundQueue
+from bot.storage import open_storage
+from bot import filters as nexus_filters
+from bot.batch_calc import is_batch_request, read_batch_input, stream_batch
+from bot.http import configure_http_pool, close_http_session
+from bot.log_pipeline import setup_logging, shutdown_logging
+from bot.log_sampling import configure_log_sampling
+from bot.peer_cache import peer_cache
+from bot.streaming import configure_streaming, send_long
+from bot.templates import CommandRegistry, ReplyTemplates, build_help_text
+from bot.uploads import configure_uploads, upload_cache
+from bot.utils import BotUtils
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('nexus_userbot.log'),
-        logging.StreamHandler()
-    ]
-)
+if _import_timer:
+    _import_timer.mark("imports")
 
 logger = logging.getLogger(__name__)
 
+# Shortest interval of recurring scheduled messages, in seconds
+MIN_MESSAGE_INTERVAL = 60
+
+# Help sections in display order
+HELP_SECTIONS = [
+    "📊 Information Commands",
+    "✍️ Text Commands",
+    "🛠️ Utilities",
+    "🤖 Bot Management",
+    "🔧 Development"
+]
+
 class NexusUserbot:
     """
     Nexus Telegram Userbot - Fixed and stable version
     """
     
-    def __init__(self):
-        self.config = Config()
+    def __init__(self, config: Config = None, show_banner: bool = True):
+        self.config = config or Config()
         self.client = None
         self.assistant_bot = None
+        self.plugin_manager = None
         self.start_time = datetime.now()
-        self._display_banner()
+        self.command_registry = CommandRegistry(HELP_SECTIONS)
+        self.templates = ReplyTemplates(self.config)
+        self.access = AccessControl(self.config)
+        self.outbound = OutboundQueue(self.config.RATE_LIMIT_DELAY, self.config.OUTBOUND_QUEUE_SIZE)
+        self.config.subscribe(self._configure_outbound, keys=('RATE_LIMIT_DELAY', 'OUTBOUND_QUEUE_SIZE'))
+        self.message_handler = None
+        self.custom_commands = None
+        self.scheduler = None
+        self.storage = open_storage(self.config)
+        self.archive = MessageArchive(self.config) if self.config.ARCHIVE_ENABLED else None
+        self.counters = CounterService(self.storage, flush_interval=self.config.COUNTER_FLUSH_INTERVAL)
+        self.events = EventLogger(self.config, self.storage)
+        self.downloader = Downloader(self.config, self.storage)
+        self.config.subscribe(self._configure_counters, keys=('COUNTER_FLUSH_INTERVAL',))
+        self.animator = Animator.from_config(self.config)
+        self.config.subscribe(lambda old, new, changed: self.animator.configure(new),
+                              keys=('ANIMATION_FRAME_INTERVAL', 'ANIMATION_MAX_FRAMES', 'RATE_LIMIT_DELAY'))
+        self.calculator = SafeCalculator.from_config(self.config)
+        self.config.subscribe(self._rebuild_calculator, keys=('CALC_MAX_DIGITS', 'CALC_TIME_BUDGET', 'CALC_SUBPROCESS'))
+        self._register_templates()
+        if show_banner:
+            self._display_banner()
 
     def _display_banner(self):
         """Display the Nexus Userbot banner"""
@@ -68,13 +125,19 @@ class NexusUserbot:
         """Initialize the Pyrogram client with error handling"""
         try:
             # Use session string if available, otherwise use session file
-            session_name = self.config.SESSION_STRING or "nexus_userbot"
+            session_string = self.config.SESSION_STRING or self.config.STRING_SESSION
+            
+            client_kwargs = {}
+            if self.config.CLIENT_WORKERS > 0:
+                client_kwargs['workers'] = self.config.CLIENT_WORKERS
             
             self.client = Client(
-                session_name,
+                self.config.SESSION_NAME,
                 api_id=self.config.API_ID,
                 api_hash=self.config.API_HASH,
-                in_memory=bool(self.config.SESSION_STRING)
+                session_string=session_string or None,
+                in_memory=bool(session_string),
+                **client_kwargs
             )
             
             logger.info("Pyrogram client initialized successfully")
@@ -84,11 +147,124 @@ class NexusUserbot:
             logger.error(f"Failed to initialize Pyrogram client: {e}")
             return False
 
+    def _command(self, name: str, usage: str = "", description: str = "", section: str = "🛠️ Utilities"):
+        """Register an outgoing command handler and record it for the help text"""
+        self.command_registry.add(name, usage, description, section)
+        self.templates.invalidate()
+        register = self.client.on_message(
+            filters.outgoing & filters.text & nexus_filters.command(name, self.config)
+        )
+
+        def decorator(func):
+            async def counted(client, message: Message):
+                if self.config.ENABLE_COMMAND_LOGGING:
+                    self.counters.record(name, message.from_user.id if message.from_user else None,
+                                         message.chat.id)
+                    await self.events.log_event('command', {'name': name, 'chat_id': message.chat.id})
+                await func(client, message)
+            register(counted)
+            return func
+        return decorator
+
+    async def _scheduled_message(self, client, chat_id, text):
+        """Scheduler action: send a message, paced by the outbound queue"""
+        self.outbound.submit(('scheduled', chat_id, text), lambda: client.send_message(chat_id, text))
+
+    async def _scheduled_report(self, client, chat_id):
+        """Scheduler action: send a usage report"""
+        uptime = str(datetime.now() - self.start_time).split('.')[0]
+        top = ', '.join(f"`{name}` ({count})" for name, count in self.counters.top('command', 3, window=86400))
+        responses = self.message_handler.responses_sent if self.message_handler else 0
+        await client.send_message(
+            chat_id,
+            f"**📊 Nexus Userbot Report**\n\n"
+            f"**⏰ Uptime:** {uptime}\n"
+            f"**🔢 Commands:** {self.counters.grand_total}\n"
+            f"**📈 Top today:** {top or 'none'}\n"
+            f"**💬 Auto-responses:** {responses}\n"
+            f"**🗓️ Jobs:** {len(self.scheduler.jobs)}"
+        )
+
+    async def _scheduled_sweep(self, client, chat_id=None):
+        """Scheduler action: drop expired cache entries and flush state"""
+        removed = peer_cache.purge_expired()
+        if self.message_handler:
+            for table in (self.message_handler.last_responses, self.message_handler.flood_protection,
+                          self.message_handler.auto_response_users):
+                removed += table.sweep()
+            await self.message_handler.save_state()
+        if self.storage:
+            self.storage.purge()
+        self.counters.flush()
+        logger.debug(f"Maintenance sweep removed {removed} expired entries")
+
+    async def _scheduled_archive_purge(self, client):
+        """Scheduler job: apply the archive retention limits"""
+        if self.archive:
+            self.archive.purge()
+
+    def _configure_counters(self, old, new, changed):
+        """Apply a new counter flush interval"""
+        self.counters.flush_interval = new.COUNTER_FLUSH_INTERVAL
+
+    def _configure_outbound(self, old, new, changed):
+        """Apply new outbound pacing"""
+        self.outbound.interval = new.RATE_LIMIT_DELAY
+        self.outbound.max_pending = new.OUTBOUND_QUEUE_SIZE
+
+    def _rebuild_calculator(self, old, new, changed):
+        """Apply new calculator limits"""
+        self.calculator = SafeCalculator.from_config(self.config)
+
+    def _register_templates(self):
+        """Register the static command replies compiled by ReplyTemplates"""
+        def help_template(config):
+            manifests = self.plugin_manager.get_plugin_manifests() if self.plugin_manager else []
+            return build_help_text(
+                f"🤖 Nexus Userbot v{config.BOT_VERSION}",
+                config.COMMAND_PREFIX,
+                self.command_registry,
+                manifests,
+                "**Built with ❤️ by @nexustech_dev**"
+            )
+
+        def alive_template(config):
+            return f"""
+**🌟 Nexus Userbot Status**
+
+**👤 Owner:** [{{{{owner_name}}}}](tg://user?id={{{{owner_id}}}})
+**⚡ Version:** v{config.BOT_VERSION}
+**🚀 Framework:** Pyrogram
+**⏰ Uptime:** {{{{uptime}}}}
+**🌟 Status:** Online & Running
+
+**🛡️ Protected by Nexus Security**
+            """
+
+        def repo_template(config):
+            return f"""
+**📁 Nexus Userbot Repository**
+
+**🔗 GitHub:** [The-Nexus-Bot/Nexus-Userbot](https://github.com/The-Nexus-Bot/Nexus-Userbot)
+**👨‍💻 Developer:** [@nexustech_dev](https://t.me/nexustech_dev)
+**📄 License:** MIT with Attribution
+**⭐ Version:** v{config.BOT_VERSION}
+
+**🚀 Deploy on:**
+• Railway • Render • Heroku • Koyeb
+
+**💡 Features:** 26+ Commands, Plugin System, Hybrid Bot
+            """
+
+        self.templates.register('help', help_template)
+        self.templates.register('alive', alive_template)
+        self.templates.register('repo', repo_template)
+
     async def setup_handlers(self):
         """Setup event handlers with comprehensive error handling"""
         try:
             # Ping command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("ping", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("ping", "", "Check bot latency", "📊 Information Commands")
             async def ping_command(client, message: Message):
                 try:
                     start_time = datetime.now()
@@ -104,60 +280,26 @@ class NexusUserbot:
                         pass
 
             # Help command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("help", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("help", "", "Show this help", "📊 Information Commands")
             async def help_command(client, message: Message):
                 try:
-                    help_text = f"""
-**🤖 Nexus Userbot v2.0**
-
-**📊 Information Commands:**
-• `{self.config.COMMAND_PREFIX}alive` - Check if bot is alive
-• `{self.config.COMMAND_PREFIX}ping` - Check bot latency
-• `{self.config.COMMAND_PREFIX}info` - Bot information
-• `{self.config.COMMAND_PREFIX}uptime` - Bot uptime
-• `{self.config.COMMAND_PREFIX}system` - System information
-
-**✍️ Text Commands:**
-• `{self.config.COMMAND_PREFIX}echo <text>` - Echo text
-• `{self.config.COMMAND_PREFIX}write <text>` - Animated writing
-• `{self.config.COMMAND_PREFIX}type <text>` - Typewriter effect
-
-**🛠️ Utilities:**
-• `{self.config.COMMAND_PREFIX}calc <expression>` - Calculator
-• `{self.config.COMMAND_PREFIX}time` - Current time
-
-**🤖 Bot Management:**
-• `{self.config.COMMAND_PREFIX}setupbot` - Configure bot via BotFather
-• `{self.config.COMMAND_PREFIX}botstatus` - Check assistant bot status
-
-**🔧 Development:**
-• `{self.config.COMMAND_PREFIX}install <plugin>` - Install plugins
-• `{self.config.COMMAND_PREFIX}repo` - Repository info
-
-**Built with ❤️ by @nexustech_dev**
-                    """
-                    await message.edit(help_text)
+                    await send_long(message, self.templates.render('help'))
                 except Exception as e:
                     logger.error(f"Error in help command: {e}")
 
             # Alive command - Fixed version
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("alive", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("alive", "", "Check if bot is alive", "📊 Information Commands")
             async def alive_command(client, message: Message):
                 try:
-                    me = await client.get_me()
+                    me = await peer_cache.get_me(client)
                     uptime = datetime.now() - self.start_time
                     
-                    alive_text = f"""
-**🌟 Nexus Userbot Status**
-
-**👤 Owner:** [{me.first_name}](tg://user?id={me.id})
-**⚡ Version:** v2.0
-**🚀 Framework:** Pyrogram
-**⏰ Uptime:** {str(uptime).split('.')[0]}
-**🌟 Status:** Online & Running
-
-**🛡️ Protected by Nexus Security**
-                    """
+                    alive_text = self.templates.render(
+                        'alive',
+                        owner_name=me.first_name,
+                        owner_id=me.id,
+                        uptime=str(uptime).split('.')[0]
+                    )
                     
                     await message.edit(alive_text)
                 except Exception as e:
@@ -168,7 +310,7 @@ class NexusUserbot:
                         pass
 
             # Info command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("info", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("info", "", "Bot information", "📊 Information Commands")
             async def info_command(client, message: Message):
                 try:
                     import platform
@@ -195,8 +337,63 @@ class NexusUserbot:
                     logger.error(f"Error in info command: {e}")
                     await message.edit("❌ Error getting system information")
 
+            # Usage statistics
+            @self._command("stats", "[hour|day]", "Most used commands, users and chats", "📊 Information Commands")
+            async def stats_command(client, message: Message):
+                try:
+                    args = message.text.split()[1:]
+                    period = args[0].lower() if args else ''
+                    window = {'hour': 3600, 'day': 86400}.get(period)
+                    title = f"last {period}" if window else "all time"
+
+                    lines = [
+                        f"**📊 Usage Statistics ({title})**\n",
+                        f"**Total Commands:** `{self.counters.grand_total}`",
+                        f"**Unique Commands:** `{self.counters.distinct('command')}`"
+                    ]
+                    for scope, heading in (('command', 'Top Commands'), ('user', 'Top Users'), ('chat', 'Top Chats')):
+                        top = self.counters.top(scope, 5, window=window)
+                        lines.append(f"\n**{heading}:**")
+                        if not top:
+                            lines.append("No data yet.")
+                        for rank, (key, count) in enumerate(top, 1):
+                            lines.append(f"{rank}. `{key}` - {count}")
+
+                    await message.edit("\n".join(lines))
+                except Exception as e:
+                    logger.error(f"Error in stats command: {e}")
+                    try:
+                        await message.edit("❌ Error getting usage statistics")
+                    except:
+                        pass
+
+            # Animated text effects
+            async def animate(message: Message, effect: str):
+                parts = message.text.split(None, 1)
+                text = parts[1] if len(parts) > 1 else ""
+                if not text and message.reply_to_message:
+                    text = message.reply_to_message.text or message.reply_to_message.caption or ""
+                if not text:
+                    await message.edit(f"❌ Usage: `{self.config.COMMAND_PREFIX}{effect} <text>` or reply to a message")
+                    return
+                self.animator.animate(message, effect, text)
+
+            @self._command("write", "<text>", "Animated writing effect", "✍️ Text Commands")
+            async def write_command(client, message: Message):
+                try:
+                    await animate(message, 'write')
+                except Exception as e:
+                    logger.error(f"Error in write command: {e}")
+
+            @self._command("type", "<text>", "Typewriter effect", "✍️ Text Commands")
+            async def type_command(client, message: Message):
+                try:
+                    await animate(message, 'type')
+                except Exception as e:
+                    logger.error(f"Error in type command: {e}")
+
             # Echo command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("echo", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("echo", "<text>", "Echo text", "✍️ Text Commands")
             async def echo_command(client, message: Message):
                 try:
                     text = message.text.split(None, 1)
@@ -204,30 +401,36 @@ class NexusUserbot:
                         await message.edit("❌ **Usage:** `.echo <text>`")
                         return
                     
-                    await message.edit(f"🔊 **Echo:** {text[1]}")
+                    await send_long(message, f"🔊 **Echo:** {text[1]}")
                 except Exception as e:
                     logger.error(f"Error in echo command: {e}")
 
             # Calculator command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("calc", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("calc", "<expression>", "Calculator (ranges, stats over numbers)", "🛠️ Utilities")
             async def calc_command(client, message: Message):
                 try:
-                    expression = message.text.split(None, 1)
-                    if len(expression) < 2:
-                        await message.edit("❌ **Usage:** `.calc <expression>`")
-                        return
-                    
                     try:
-                        # Safe evaluation
-                        result = eval(expression[1], {"__builtins__": {}}, {})
+                        expression, data = await read_batch_input(message, self.config)
+                        if is_batch_request(expression, data):
+                            await stream_batch(message, expression, data, self.config)
+                            return
+                        if not expression:
+                            await message.edit("❌ **Usage:** `.calc <expression>`")
+                            return
+                        
+                        result = str(await self.calculator.calculate(expression))
+                        # Room for the label within one message
+                        limit = self.config.MAX_MESSAGE_LENGTH - 32
+                        if len(result) > limit:
+                            result = f"{result[:limit]}…"
                         await message.edit(f"🧮 **Result:** `{result}`")
-                    except Exception as calc_error:
-                        await message.edit(f"❌ **Error:** Invalid expression")
+                    except CalculationError as calc_error:
+                        await message.edit(f"❌ **Error:** {calc_error}")
                 except Exception as e:
                     logger.error(f"Error in calc command: {e}")
 
             # Time command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("time", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("time", "", "Current time", "🛠️ Utilities")
             async def time_command(client, message: Message):
                 try:
                     now = datetime.now()
@@ -244,28 +447,16 @@ class NexusUserbot:
                     logger.error(f"Error in time command: {e}")
 
             # Repository command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("repo", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("repo", "", "Repository info", "🔧 Development")
             async def repo_command(client, message: Message):
                 try:
-                    repo_text = """
-**📁 Nexus Userbot Repository**
-
-**🔗 GitHub:** [The-Nexus-Bot/Nexus-Userbot](https://github.com/The-Nexus-Bot/Nexus-Userbot)
-**👨‍💻 Developer:** [@nexustech_dev](https://t.me/nexustech_dev)
-**📄 License:** MIT with Attribution
-**⭐ Version:** v2.0
-
-**🚀 Deploy on:**
-• Railway • Render • Heroku • Koyeb
-
-**💡 Features:** 26+ Commands, Plugin System, Hybrid Bot
-                    """
+                    repo_text = self.templates.render('repo')
                     await message.edit(repo_text)
                 except Exception as e:
                     logger.error(f"Error in repo command: {e}")
 
             # BotFather setup command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("setupbot", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("setupbot", "", "Configure bot via BotFather", "🤖 Bot Management")
             async def setupbot_command(client, message: Message):
                 try:
                     if not self.assistant_bot or not self.assistant_bot.botfather_manager:
@@ -275,7 +466,7 @@ class NexusUserbot:
                     await message.edit("🤖 **Setting up bot via BotFather...**\n\nThis may take a few moments...")
                     
                     # Get bot username
-                    bot_me = await self.assistant_bot.bot_client.get_me()
+                    bot_me = await peer_cache.get_me(self.assistant_bot.bot_client)
                     bot_username = bot_me.username
                     
                     if not bot_username:
@@ -284,6 +475,7 @@ class NexusUserbot:
                     
                     # Run BotFather setup
                     success = await self.assistant_bot.botfather_manager.setup_bot_profile(bot_username)
+                    peer_cache.invalidate_me(self.assistant_bot.bot_client)
                     
                     if success:
                         await message.edit(f"""
@@ -306,14 +498,14 @@ Your assistant bot is now fully configured!
                     await message.edit("❌ **Error during BotFather setup**")
 
             # Bot status command
-            @self.client.on_message(filters.outgoing & filters.text & filters.command("botstatus", prefixes=self.config.COMMAND_PREFIX))
+            @self._command("botstatus", "", "Check assistant bot status", "🤖 Bot Management")
             async def botstatus_command(client, message: Message):
                 try:
                     if not self.assistant_bot:
                         await message.edit("❌ **Assistant bot not initialized**\n\n**Hybrid Mode:** Disabled")
                         return
                     
-                    bot_me = await self.assistant_bot.bot_client.get_me()
+                    bot_me = await peer_cache.get_me(self.assistant_bot.bot_client)
                     
                     status_text = f"""
 **🤖 Assistant Bot Status**
@@ -346,6 +538,330 @@ Your assistant bot is now fully configured!
                     logger.error(f"Error in botstatus command: {e}")
                     await message.edit("❌ **Error getting bot status**")
 
+            # Runtime configuration
+            @self._command("config", "[get KEY | set KEY VALUE | reload]", "View or change settings", "🔧 Development")
+            async def config_command(client, message: Message):
+                try:
+                    parts = message.text.split(maxsplit=3)
+                    action = parts[1].lower() if len(parts) > 1 else ""
+                    key = parts[2].upper() if len(parts) > 2 else ""
+
+                    if action == "reload" and len(parts) == 2:
+                        if self.config.reload():
+                            await message.edit("✅ **Configuration reloaded**")
+                        else:
+                            await message.edit("❌ **Reload rejected** - invalid values, see logs")
+                    elif action == "get" and len(parts) == 3:
+                        if key not in SCHEMA:
+                            await message.edit(f"❌ Unknown setting: `{key}`")
+                            return
+                        await message.edit(f"**{key}** = `{self.config.describe(key)}`")
+                    elif action == "set" and len(parts) == 4:
+                        changed = self.config.set_value(key, parts[3])
+                        if changed:
+                            await message.edit(f"✅ **{key}** = `{self.config.describe(key)}`")
+                        else:
+                            await message.edit(f"ℹ️ **{key}** is unchanged")
+                    else:
+                        prefix = self.config.COMMAND_PREFIX
+                        await message.edit(
+                            f"**Usage:**\n`{prefix}config get KEY`\n`{prefix}config set KEY VALUE`\n`{prefix}config reload`"
+                        )
+                except ConfigError as e:
+                    await message.edit(f"❌ {e}")
+                except Exception as e:
+                    logger.error(f"Error in config command: {e}")
+
+            # Authorized / blacklisted users
+            access_actions = {
+                'block': ('blacklisted', True),
+                'unblock': ('blacklisted', False),
+                'allow': ('authorized', True),
+                'disallow': ('authorized', False)
+            }
+
+            @self._command("access", "[block|unblock|allow|disallow <user> | reload]",
+                           "Manage authorized and blacklisted users", "🛠️ Utilities")
+            async def access_command(client, message: Message):
+                try:
+                    parts = message.text.split()
+                    action = parts[1].lower() if len(parts) > 1 else ""
+
+                    if action in access_actions:
+                        if len(parts) > 2:
+                            target = parts[2]
+                            user_id = int(target) if target.lstrip('-').isdigit() else (await client.get_users(target)).id
+                        elif message.reply_to_message and message.reply_to_message.from_user:
+                            user_id = message.reply_to_message.from_user.id
+                        else:
+                            await message.edit("❌ Reply to a user or give an id or @username")
+                            return
+                        name, add = access_actions[action]
+                        self.access.update(name, user_id, add)
+                        await message.edit(f"✅ `{user_id}` {'added to' if add else 'removed from'} **{name}** users")
+                        return
+
+                    if action == "reload":
+                        self.access.reload()
+                        await self.access.resolve(client)
+
+                    stats = self.access.get_stats()
+                    await message.edit(
+                        f"**🛡️ Access Lists**\n\n"
+                        f"**Blacklisted:** {stats['blacklisted']}\n"
+                        f"**Authorized:** {stats['authorized'] if stats['restricted'] else 'everyone'}\n"
+                        f"**Unresolved usernames:** {stats['pending_usernames']}"
+                    )
+                except RPCError as e:
+                    await message.edit(f"❌ Could not find that user: {e}")
+                except Exception as e:
+                    logger.error(f"Error in access command: {e}")
+
+            # Custom reply commands
+            self.custom_commands = CustomCommands(self.config, self.storage, self.command_registry, self.counters)
+            self.custom_commands.register(self.client)
+
+            @self._command("cmd", "[add <name> <text> | del <name> | list]",
+                           "Manage custom commands (reply to media to attach it)", "🛠️ Utilities")
+            async def cmd_command(client, message: Message):
+                try:
+                    parts = message.text.split(maxsplit=3)
+                    action = parts[1].lower() if len(parts) > 1 else "list"
+                    prefix = self.config.COMMAND_PREFIX
+
+                    if action == "add" and len(parts) > 2:
+                        text = parts[3] if len(parts) > 3 else ""
+                        media_type = media = None
+                        reply = message.reply_to_message
+                        if reply:
+                            media_type = next((kind for kind in MEDIA_TYPES if getattr(reply, kind, None)), None)
+                            if media_type:
+                                media = getattr(reply, media_type).file_id
+                            elif not text:
+                                text = reply.text or ""
+                        command = self.custom_commands.add(parts[2], text, media_type, media)
+                        self.templates.invalidate()
+                        await message.edit(f"✅ Custom command `{prefix}{command.name}` saved")
+                    elif action == "del" and len(parts) > 2:
+                        if self.custom_commands.remove(parts[2]):
+                            self.templates.invalidate()
+                            await message.edit(f"✅ Custom command `{parts[2].lower()}` deleted")
+                        else:
+                            await message.edit(f"❌ No runtime custom command `{parts[2].lower()}`")
+                    else:
+                        lines = ["**🧩 Custom Commands**", ""]
+                        for name, command in sorted(self.custom_commands.commands.items()):
+                            kind = f" [{command.media_type}]" if command.media_type else ""
+                            lines.append(f"• `{prefix}{name}`{kind} ({command.source})")
+                        if len(lines) == 2:
+                            lines.append(f"None yet. `{prefix}cmd add <name> <text>`")
+                        await message.edit("\n".join(lines))
+                except ValueError as e:
+                    await message.edit(f"❌ {e}")
+                except Exception as e:
+                    logger.error(f"Error in cmd command: {e}")
+
+            # Timed and recurring jobs
+            self.scheduler = Scheduler(self.client, self.storage)
+            self.scheduler.register_action('message', self._scheduled_message, min_interval=MIN_MESSAGE_INTERVAL)
+            self.scheduler.register_action('report', self._scheduled_report)
+            self.scheduler.register_action('sweep', self._scheduled_sweep)
+
+            @self._command("schedule", "<10m | every 1h | cron <expr>> <text | !action>",
+                           "Schedule a message or action in this chat", "🛠️ Utilities")
+            async def schedule_command(client, message: Message):
+                prefix = self.config.COMMAND_PREFIX
+                try:
+                    parts = message.text.split(None, 1)
+                    rest = parts[1] if len(parts) > 1 else ""
+                    kind = rest.split(None, 1)[0].lower() if rest else ""
+
+                    if kind == "every":
+                        tokens = rest.split(None, 2)
+                        trigger, body = Every(parse_duration(tokens[1])), tokens[2]
+                    elif kind == "cron":
+                        tokens = rest.split(None, 2)
+                        if tokens[1].startswith('@'):
+                            trigger, body = Cron(tokens[1]), tokens[2]
+                        else:
+                            tokens = rest.split(None, 6)
+                            trigger, body = Cron(' '.join(tokens[1:6])), tokens[6]
+                    else:
+                        tokens = rest.split(None, 1)
+                        trigger, body = Once(time.time() + parse_duration(tokens[0])), tokens[1]
+
+                    params = {'chat_id': message.chat.id}
+                    if body.startswith('!'):
+                        action = body[1:].strip()
+                    else:
+                        action = 'message'
+                        params['text'] = body
+                    job = self.scheduler.add(action, trigger, params,
+                                             description=f"{action} in {message.chat.id}")
+                    await message.edit(
+                        f"✅ Job `{job.id}` scheduled ({job.trigger})\n"
+                        f"**Next run:** {datetime.fromtimestamp(job.next_run):%Y-%m-%d %H:%M:%S}"
+                    )
+                except (ValueError, IndexError) as e:
+                    error = str(e) if isinstance(e, ValueError) else "Missing arguments"
+                    actions = ', '.join(f"`!{name}`" for name in self.scheduler.action_names() if name != 'message')
+                    await message.edit(
+                        f"❌ {error}\n\n**Usage:**\n"
+                        f"`{prefix}schedule 10m text`\n`{prefix}schedule every 1h text`\n"
+                        f"`{prefix}schedule cron 0 9 * * 1-5 text`\n`{prefix}schedule cron @daily !report`\n"
+                        f"**Actions:** {actions}"
+                    )
+                except Exception as e:
+                    logger.error(f"Error in schedule command: {e}")
+
+            @self._command("jobs", "", "List scheduled jobs", "🛠️ Utilities")
+            async def jobs_command(client, message: Message):
+                try:
+                    jobs = sorted(self.scheduler.jobs.values(), key=lambda job: job.next_run)
+                    lines = [f"**🗓️ Scheduled Jobs ({len(jobs)})**", ""]
+                    now = time.time()
+                    for job in jobs[:50]:
+                        lines.append(f"• `{job.id}` {job.description} - {job.trigger}, "
+                                     f"next in {format_duration(max(0, job.next_run - now))}")
+                    if not jobs:
+                        lines.append("No jobs scheduled.")
+                    elif len(jobs) > 50:
+                        lines.append(f"... and {len(jobs) - 50} more")
+                    await send_long(message, "\n".join(lines))
+                except Exception as e:
+                    logger.error(f"Error in jobs command: {e}")
+
+            @self._command("unschedule", "<job id>", "Cancel a scheduled job", "🛠️ Utilities")
+            async def unschedule_command(client, message: Message):
+                try:
+                    parts = message.text.split()
+                    if len(parts) < 2:
+                        await message.edit(f"❌ Usage: `{self.config.COMMAND_PREFIX}unschedule <job id>`")
+                    elif self.scheduler.remove(parts[1]):
+                        await message.edit(f"✅ Job `{parts[1]}` cancelled")
+                    else:
+                        await message.edit(f"❌ No job `{parts[1]}`")
+                except Exception as e:
+                    logger.error(f"Error in unschedule command: {e}")
+
+            # Local full-text search
+            if self.archive:
+                self.archive.register(self.client)
+
+            @self._command("search", "[-h] [-p N] <words>", "Search archived messages (-h: this chat only)",
+                           "🛠️ Utilities")
+            async def search_command(client, message: Message):
+                try:
+                    if not self.archive:
+                        await message.edit("❌ The message archive is off. Set `ARCHIVE_ENABLED=true` and restart.")
+                        return
+
+                    tokens = message.text.split()[1:]
+                    chat_id, page = None, 1
+                    while tokens and tokens[0].startswith('-'):
+                        option = tokens.pop(0)
+                        if option == '-h':
+                            chat_id = message.chat.id
+                        elif option.startswith('-p'):
+                            value = option[2:] or (tokens.pop(0) if tokens else '')
+                            page = max(1, int(value)) if value.isdigit() else 1
+                    query = ' '.join(tokens)
+                    if not query:
+                        await message.edit(f"❌ Usage: `{self.config.COMMAND_PREFIX}search [-h] [-p N] <words>`")
+                        return
+
+                    page_size = 10
+                    started = time.perf_counter()
+                    results, more = await self.archive.search(query, chat_id, page_size, (page - 1) * page_size)
+                    elapsed = (time.perf_counter() - started) * 1000
+
+                    lines = [f"**🔎 {query}** - page {page} ({elapsed:.1f} ms)", ""]
+                    for rank, result in enumerate(results, (page - 1) * page_size + 1):
+                        when = datetime.fromtimestamp(result.date).strftime('%Y-%m-%d %H:%M')
+                        link = f" - [open]({result.link})" if result.link else ""
+                        lines.append(f"**{rank}.** {result.chat} · {result.sender} · {when}{link}")
+                        lines.append(f"   {result.snippet}")
+                    if not results:
+                        lines.append("No matches.")
+                    if more:
+                        lines.append(f"\nNext: `{self.config.COMMAND_PREFIX}search {'-h ' if chat_id else ''}-p {page + 1} {query}`")
+                    await send_long(message, "\n".join(lines))
+                except Exception as e:
+                    logger.error(f"Error in search command: {e}")
+
+            # Media downloads
+            @self._command("dl", "[count | first-last | stop]",
+                           "Download replied media, the next <count> messages or an id range", "🛠️ Utilities")
+            async def dl_command(client, message: Message):
+                try:
+                    args = message.text.split()[1:]
+                    prefix = self.config.COMMAND_PREFIX
+                    if args and args[0] == 'stop':
+                        stopped = await self.downloader.stop()
+                        await message.edit(f"⏹ Stopped {stopped} download(s). Run them again to resume.")
+                        return
+
+                    chat_id = message.chat.id
+                    replied = message.reply_to_message
+                    if args and '-' in args[0]:
+                        first, _, last = args[0].partition('-')
+                        first, last = int(first), int(last)
+                    elif replied and args:
+                        first, last = replied.id, replied.id + int(args[0]) - 1
+                    elif replied:
+                        if not media_of(replied):
+                            await message.edit("❌ The replied message has no media")
+                            return
+                        first = last = replied.id
+                    else:
+                        await message.edit(f"❌ Reply to media, or use `{prefix}dl <count>` in reply, "
+                                           f"`{prefix}dl <first>-<last>` or `{prefix}dl stop`")
+                        return
+                    if first < 1 or last < first or last - first >= MAX_RANGE:
+                        await message.edit(f"❌ Give 1 to {MAX_RANGE} messages")
+                        return
+
+                    if first == last and replied and replied.id == first:
+                        messages = [replied]
+                    else:
+                        messages = self.downloader.messages_in_range(client, chat_id, first, last)
+                    await message.edit("📥 Starting download...")
+
+                    async def report(job):
+                        elapsed = time.monotonic() - job.started
+                        statuses = [result.status for result in job.results]
+                        lines = [
+                            f"**📥 Downloaded {len(job.results)}/{job.files} files** in {elapsed:.1f}s",
+                            f"{BotUtils.format_bytes(sum(result.size for result in job.results))}"
+                            f" · reused {statuses.count('cached') + statuses.count('duplicate')}"
+                            f" · resumed {statuses.count('resumed')}",
+                        ]
+                        if job.failed:
+                            lines.append(f"❌ {job.failed} failed")
+                        if len(job.results) == 1:
+                            lines.append(f"`{job.results[0].path}`")
+                        elif job.results:
+                            lines.append(f"`{os.path.join(self.config.DOWNLOAD_DIR, str(chat_id))}`")
+                        try:
+                            await message.edit("\n".join(lines))
+                        except RPCError as e:
+                            logger.debug(f"Download summary not shown: {e}")
+
+                    self.downloader.start(client, message, messages, chat_id, report)
+                except ValueError:
+                    await message.edit("❌ Counts and message ids must be numbers")
+                except Exception as e:
+                    logger.error(f"Error in dl command: {e}")
+
+            # Auto-responses to private messages
+            self.message_handler = MessageHandler(self.client, self.config, self.access, self.outbound)
+            self.message_handler.register()
+
+            # Keep cached profiles and chats in step with Telegram
+            @self.client.on_raw_update(group=-1)
+            async def peer_cache_invalidation(client, update, users, chats):
+                peer_cache.handle_raw_update(client, update)
+
             logger.info("Event handlers setup successfully")
             return True
             
@@ -353,49 +869,163 @@ Your assistant bot is now fully configured!
             logger.error(f"Failed to setup handlers: {e}")
             return False
 
-    async def run(self):
-        """Main run method with comprehensive error handling"""
+    async def start(self) -> bool:
+        """Initialize the client, register handlers and connect"""
+        # Open storage (runs schema migrations)
         try:
-            # Initialize client
-            if not self.initialize_client():
-                logger.error("Failed to initialize client")
-                return
-            
-            # Setup handlers
-            if not await self.setup_handlers():
-                logger.error("Failed to setup handlers")
-                return
-            
-            # Start client
+            await self.storage.start()
+            self.storage.purge()
+        except Exception as e:
+            logger.error(f"Failed to open storage, running without persistence: {e}")
+            self.storage = None
+            self.counters.storage = None
+            self.events.storage = None
+            self.downloader.storage = None
+        
+        # Local message archive
+        if self.archive:
             try:
-                await self.client.start()
-                logger.info("Pyrogram client started successfully")
+                await self.archive.start()
             except Exception as e:
-                logger.error(f"Failed to start client: {e}")
-                return
-            
-            # Get user information
+                logger.error(f"Failed to open message archive, archiving disabled: {e}")
+                self.archive = None
+        
+        # Command usage counts survive restarts
+        try:
+            await self.counters.start()
+        except Exception as e:
+            logger.error(f"Failed to load usage counters: {e}")
+        
+        # Files downloaded before are not fetched again
+        try:
+            await self.downloader.load()
+        except Exception as e:
+            logger.error(f"Failed to load the download index: {e}")
+        
+        # Initialize client
+        if not self.initialize_client():
+            logger.error("Failed to initialize client")
+            return False
+        
+        # Setup handlers
+        if not await self.setup_handlers():
+            logger.error("Failed to setup handlers")
+            return False
+        
+        # Custom commands added at runtime
+        try:
+            await self.custom_commands.load()
+            self.templates.invalidate()
+        except Exception as e:
+            logger.error(f"Failed to load custom commands: {e}")
+        
+        # Load installed plugins
+        if self.config.PLUGIN_AUTO_LOAD:
             try:
-                me = await self.client.get_me()
-                username = f"@{me.username}" if me.username else "No username"
-                logger.info(f"Logged in as: {me.first_name} ({username})")
+                from bot.plugin_manager import PluginManager
+                self.plugin_manager = PluginManager(self.client, self.config, self.storage)
+                loaded = await self.plugin_manager.load_all_plugins()
+                self.templates.invalidate()
+                logger.info(f"Loaded {loaded} plugins")
             except Exception as e:
-                logger.error(f"Failed to get user info: {e}")
-                logger.info("Client started but couldn't fetch user info")
-            
-            # Initialize assistant bot if token provided
-            if self.config.BOT_TOKEN:
-                try:
-                    from bot.assistant_bot import AssistantBot
-                    self.assistant_bot = AssistantBot(self.config, self.client)
-                    if await self.assistant_bot.initialize_bot():
-                        logger.info("Assistant bot initialized successfully")
-                    else:
-                        logger.warning("Failed to initialize assistant bot")
-                except Exception as e:
-                    logger.error(f"Assistant bot error: {e}")
-            else:
-                logger.info("No BOT_TOKEN provided - running in userbot-only mode")
+                logger.error(f"Failed to load plugins: {e}")
+        
+        # Start client
+        try:
+            await self.client.start()
+            logger.info("Pyrogram client started successfully")
+        except Exception as e:
+            logger.error(f"Failed to start client: {e}")
+            return False
+        
+        # Get user information
+        try:
+            me = await peer_cache.get_me(self.client)
+            username = f"@{me.username}" if me.username else "No username"
+            logger.info(f"Logged in as: {me.first_name} ({username})")
+        except Exception as e:
+            logger.error(f"Failed to get user info: {e}")
+            logger.info("Client started but couldn't fetch user info")
+        
+        # file_ids of media this account uploaded before
+        if self.storage:
+            try:
+                await upload_cache.attach(self.storage, self.client)
+            except Exception as e:
+                logger.error(f"Failed to load the upload cache: {e}")
+        
+        # Auto-response cooldowns survive restarts
+        if self.message_handler:
+            self.message_handler.start()
+        
+        # Scheduled jobs, restored from storage, plus hourly cache maintenance
+        try:
+            await self.scheduler.start()
+            self.scheduler.add(self._scheduled_sweep, Every(3600), job_id='maintenance',
+                               description='cache sweep')
+            if self.archive:
+                self.scheduler.add(self._scheduled_archive_purge, Every(6 * 3600),
+                                   job_id='archive-retention', description='archive retention')
+        except Exception as e:
+            logger.error(f"Failed to start scheduler: {e}")
+        
+        # Usernames in the access lists become ids
+        try:
+            await self.access.resolve(self.client)
+        except Exception as e:
+            logger.error(f"Failed to resolve access list usernames: {e}")
+        
+        # Initialize assistant bot if token provided
+        if self.config.BOT_TOKEN:
+            try:
+                from bot.assistant_bot import AssistantBot
+                self.assistant_bot = AssistantBot(self.config, self.client, self.counters, self.storage)
+                if await self.assistant_bot.initialize_bot():
+                    logger.info("Assistant bot initialized successfully")
+                else:
+                    logger.warning("Failed to initialize assistant bot")
+            except Exception as e:
+                logger.error(f"Assistant bot error: {e}")
+        else:
+            logger.info("No BOT_TOKEN provided - running in userbot-only mode")
+        
+        return True
+
+    async def stop(self):
+        """Disconnect the assistant bot and the user client"""
+        if self.scheduler:
+            await self.scheduler.stop()
+        await self.animator.stop()
+        await self.downloader.stop()
+        await self.outbound.stop()
+        if self.message_handler:
+            await self.message_handler.stop()
+        
+        try:
+            if self.assistant_bot and self.assistant_bot.bot_client:
+                await self.assistant_bot.stop_bot()
+        except Exception as e:
+            logger.error(f"Error stopping assistant bot: {e}")
+        
+        try:
+            if hasattr(self, 'client') and self.client and self.client.is_connected:
+                await self.client.stop()
+                logger.info("Client stopped")
+        except Exception as e:
+            logger.error(f"Error stopping client: {e}")
+        
+        await self.counters.stop()
+        if self.storage:
+            upload_cache.detach(self.storage)
+            await self.storage.close()
+        if self.archive:
+            await self.archive.close()
+
+    async def run(self):
+        """Main run method with comprehensive error handling"""
+        try:
+            if not await self.start():
+                return
             
             logger.info("🎉 Nexus Userbot is now running!")
             logger.info(f"Prefix: {self.config.COMMAND_PREFIX}")
@@ -411,22 +1041,65 @@ Your assistant bot is now fully configured!
             import traceback
             logger.error(traceback.format_exc())
         finally:
-            try:
-                if hasattr(self, 'client') and self.client:
-                    await self.client.stop()
-                    logger.info("Client stopped")
-            except Exception as e:
-                logger.error(f"Error stopping client: {e}")
+            await self.stop()
+            await close_http_session()
+
+def apply_runtime_config(config: Config):
+    """Re-apply process-wide settings whenever the configuration changes"""
+    config.subscribe(lambda old, new, changed: configure_streaming(config),
+                     keys=('MAX_MESSAGE_LENGTH', 'STREAM_DOCUMENT_THRESHOLD', 'RATE_LIMIT_DELAY'))
+    config.subscribe(lambda old, new, changed: configure_http_pool(config.HTTP_POOL_SIZE),
+                     keys=('HTTP_POOL_SIZE',))
+    config.subscribe(lambda old, new, changed: configure_uploads(config.UPLOAD_CONCURRENCY),
+                     keys=('UPLOAD_CONCURRENCY',))
+    config.subscribe(lambda old, new, changed: setup_logging(config),
+                     keys=('LOG_LEVEL', 'LOG_LEVELS', 'LOG_FILE', 'LOG_FORMAT', 'LOG_MAX_BYTES',
+                           'LOG_BACKUP_COUNT', 'LOG_ROTATE_HOURS', 'LOG_COMPRESS'))
+    config.subscribe(lambda old, new, changed: configure_log_sampling(config),
+                     keys=('LOG_SAMPLE_RATE', 'LOG_SAMPLE_BURST', 'LOG_SAMPLE_EVERY', 'LOG_SUMMARY_INTERVAL'))
+
 
 async def main():
     """Main function"""
     try:
-        userbot = NexusUserbot()
-        await userbot.run()
+        load_environment()
+        
+        # Several accounts in one process when an accounts source is configured
+        if os.getenv('ACCOUNTS_DIR') or os.getenv('ACCOUNTS_FILE'):
+            from bot.multi_account import MultiAccountRuntime
+            runtime = MultiAccountRuntime(
+                accounts_dir=os.getenv('ACCOUNTS_DIR', ''),
+                accounts_file=os.getenv('ACCOUNTS_FILE', ''),
+                userbot_factory=NexusUserbot,
+                runtime_setup=apply_runtime_config
+            )
+            await runtime.run()
+            return
+        
+        config = Config()
+        setup_logging(config)
+        configure_http_pool(config.HTTP_POOL_SIZE)
+        configure_uploads(config.UPLOAD_CONCURRENCY)
+        configure_streaming(config)
+        apply_runtime_config(config)
+        watcher = None
+        if config.CONFIG_WATCH_INTERVAL > 0:
+            watcher = asyncio.create_task(config.watch(interval=config.CONFIG_WATCH_INTERVAL))
+        userbot = NexusUserbot(config)
+        try:
+            await userbot.run()
+        finally:
+            if watcher:
+                watcher.cancel()
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         import traceback
         logger.error(traceback.format_exc())
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
+    if _import_timer:
+        from bot.startup import run_startup_report
+        sys.exit(asyncio.run(run_startup_report(_import_timer, NexusUserbot)))
     asyncio.run(main())
\ No newline at end of file
@@ -12,6 +12,13 @@ from pyrogram import filters
 from pyrogram.types import Message
 from pyrogram.errors import ChatAdminRequired, UserNotParticipant
 
+from bot import filters as nexus_filters
+from bot.peer_cache import peer_cache
+from bot.streaming import ReplyStreamer
+from bot.log_sampling import get_sampled_logger
+
+sampled_logger = get_sampled_logger(__name__)
+
 # Plugin metadata
 __plugin_name__ = "Group Manager"
 __plugin_description__ = "Leave groups and manage group participation"
@@ -21,7 +28,7 @@ __plugin_commands__ = [".leave", ".leaveall", ".groups"]
 def setup_plugin(client, config):
     """Setup the group manager plugin"""
     
-    @client.on_message(filters.command("leave", config.COMMAND_PREFIX) & filters.me)
+    @client.on_message(nexus_filters.command("leave", config) & filters.me)
     async def leave_command(client, message: Message):
         """Leave current group or specified group"""
         try:
@@ -55,10 +62,11 @@ def setup_plugin(client, config):
                     return
                 
                 try:
-                    chat_info = await client.get_chat(target_chat_id)
+                    chat_info = await peer_cache.get_chat(client, target_chat_id)
                     chat_title = chat_info.title or "Unknown Group"
                     
                     await client.leave_chat(target_chat_id)
+                    peer_cache.invalidate_chat(client, target_chat_id)
                     await message.edit(f"✅ Successfully left group: **{chat_title}**")
                     
                 except Exception as e:
@@ -67,7 +75,7 @@ def setup_plugin(client, config):
         except Exception as e:
             await message.edit(f"❌ Error: {str(e)}")
     
-    @client.on_message(filters.command("leaveall", config.COMMAND_PREFIX) & filters.me)
+    @client.on_message(nexus_filters.command("leaveall", config) & filters.me)
     async def leaveall_command(client, message: Message):
         """Leave all groups (with confirmation)"""
         try:
@@ -113,7 +121,7 @@ This will leave ALL groups you're currently in!
                     await asyncio.sleep(1)  # Rate limiting
                 except Exception as e:
                     failed_count += 1
-                    print(f"Failed to leave {chat_title}: {e}")
+                    sampled_logger.warning('leaveall', "Failed to leave %s: %s", chat_title, e)
             
             result_text = f"""
 ✅ **GROUP CLEANUP COMPLETE**
@@ -130,7 +138,7 @@ This will leave ALL groups you're currently in!
         except Exception as e:
             await message.edit(f"❌ Error during mass leave: {str(e)}")
     
-    @client.on_message(filters.command("groups", config.COMMAND_PREFIX) & filters.me)
+    @client.on_message(nexus_filters.command("groups", config) & filters.me)
     async def groups_command(client, message: Message):
         """List all groups you're in"""
         try:
@@ -152,43 +160,29 @@ This will leave ALL groups you're currently in!
                 elif chat.type == "channel":
                     channels.append(chat_info)
             
-            result_text = "📋 **YOUR GROUPS & CHANNELS**\n\n"
-            
-            if groups:
-                result_text += f"👥 **Groups ({len(groups)}):**\n"
-                for group in groups[:10]:  # Limit to 10 to avoid message length issues
-                    result_text += f"• {group}\n"
-                if len(groups) > 10:
-                    result_text += f"• ... and {len(groups) - 10} more\n"
-                result_text += "\n"
-            
-            if supergroups:
-                result_text += f"🏢 **Supergroups ({len(supergroups)}):**\n"
-                for supergroup in supergroups[:10]:
-                    result_text += f"• {supergroup}\n"
-                if len(supergroups) > 10:
-                    result_text += f"• ... and {len(supergroups) - 10} more\n"
-                result_text += "\n"
-            
-            if channels:
-                result_text += f"📢 **Channels ({len(channels)}):**\n"
-                for channel in channels[:5]:
-                    result_text += f"• {channel}\n"
-                if len(channels) > 5:
-                    result_text += f"• ... and {len(channels) - 5} more\n"
-                result_text += "\n"
-            
-            total = len(groups) + len(supergroups) + len(channels)
-            result_text += f"📊 **Total:** {total} chats\n\n"
-            result_text += "**Commands:**\n"
-            result_text += "• `.leave` - Leave current group\n"
-            result_text += "• `.leave <chat_id>` - Leave specific group\n"
-            result_text += "• `.leaveall confirm` - Leave all groups"
-            
             if not groups and not supergroups and not channels:
-                result_text = "ℹ️ **No groups or channels found.**\n\nYou're not currently in any groups or subscribed to any channels."
+                await message.edit("ℹ️ **No groups or channels found.**\n\nYou're not currently in any groups or subscribed to any channels.")
+                return
             
-            await message.edit(result_text)
+            # Lists are written line by line; long ones are split or sent as a file
+            async with ReplyStreamer(message, filename="groups.txt") as out:
+                await out.writeln("📋 **YOUR GROUPS & CHANNELS**\n")
+                
+                for icon, title, chats in (("👥", "Groups", groups), ("🏢", "Supergroups", supergroups),
+                                           ("📢", "Channels", channels)):
+                    if not chats:
+                        continue
+                    await out.writeln(f"{icon} **{title} ({len(chats)}):**")
+                    for chat_info in chats:
+                        await out.writeln(f"• {chat_info}")
+                    await out.writeln()
+                
+                total = len(groups) + len(supergroups) + len(channels)
+                await out.writeln(f"📊 **Total:** {total} chats\n")
+                await out.writeln("**Commands:**")
+                await out.writeln("• `.leave` - Leave current group")
+                await out.writeln("• `.leave <chat_id>` - Leave specific group")
+                await out.write("• `.leaveall confirm` - Leave all groups")
             
         except Exception as e:
             await message.edit(f"❌ Error listing groups: {str(e)}")
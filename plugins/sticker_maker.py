@@ -9,10 +9,17 @@
 
 import io
 import textwrap
-from PIL import Image, ImageDraw, ImageFont
 import asyncio
 from pyrogram import filters
 from pyrogram.types import Message
+from bot import filters as nexus_filters
+from bot.lazy import lazy_import
+from bot.uploads import upload_cache
+
+# Pillow is loaded on the first sticker, not when plugins are loaded
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+ImageFont = lazy_import('PIL.ImageFont')
 
 # Plugin metadata
 __plugin_name__ = "Sticker Maker"
@@ -124,7 +131,7 @@ def create_text_sticker(text, style="default"):
 def setup_plugin(client, config):
     """Setup the sticker maker plugin"""
     
-    @client.on_message(filters.command("sticker", config.COMMAND_PREFIX) & filters.me)
+    @client.on_message(nexus_filters.command("sticker", config) & filters.me)
     async def sticker_command(client, message: Message):
         """Create a sticker from text"""
         try:
@@ -175,23 +182,25 @@ def setup_plugin(client, config):
             # Create sticker
             sticker_img = create_text_sticker(text, style)
             
-            # Save to bytes
+            # Save to bytes (WebP, the format Telegram takes for stickers)
             img_bytes = io.BytesIO()
-            sticker_img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
+            sticker_img.save(img_bytes, format='WEBP')
             
-            # Send as sticker
+            # Send as sticker; the same text and style reuse the first upload
             await message.delete()
-            await client.send_sticker(
-                chat_id=message.chat.id,
-                sticker=img_bytes,
+            await upload_cache.send(
+                client,
+                'sticker',
+                message.chat.id,
+                img_bytes.getvalue(),
+                name="sticker.webp",
                 reply_to_message_id=message.reply_to_message.id if message.reply_to_message else None
             )
             
         except Exception as e:
             await message.edit(f"❌ Failed to create sticker: {str(e)}")
     
-    @client.on_message(filters.command("stickerpack", config.COMMAND_PREFIX) & filters.me)
+    @client.on_message(nexus_filters.command("stickerpack", config) & filters.me)
     async def stickerpack_command(client, message: Message):
         """Show sticker pack information"""
         try:
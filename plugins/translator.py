@@ -10,7 +10,8 @@
 from pyrogram import filters
 from pyrogram.types import Message
 import asyncio
-import aiohttp
+from bot.http import get_http_session
+from bot.streaming import send_long
 import json
 
 async def translate_handler(client, message: Message):
@@ -66,16 +67,17 @@ async def translate_handler(client, message: Message):
             'q': text_to_translate
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    result = await response.text()
-                    # Parse the response
-                    translation_data = json.loads(result)
-                    translated_text = translation_data[0][0][0]
-                    detected_lang = translation_data[2]
-                    
-                    translation_result = f"""
+        session = get_http_session()
+        async with session.get(url, params=params) as response:
+            if response.status == 200:
+                result = await response.text()
+                # Parse the response
+                translation_data = json.loads(result)
+                # Long input comes back as one segment per sentence
+                translated_text = "".join(segment[0] for segment in translation_data[0] if segment[0])
+                detected_lang = translation_data[2]
+                
+                translation_result = f"""
 🌐 **TRANSLATION RESULT**
 
 **Original ({detected_lang.upper()}):**
@@ -85,12 +87,12 @@ async def translate_handler(client, message: Message):
 {translated_text}
 
 Powered by Google Translate
-                    """
-                    
-                    await message.edit(translation_result)
-                else:
-                    await message.edit("❌ **Translation failed**\nCheck language code and try again")
-                    
+                """
+
+                await send_long(message, translation_result.strip())
+            else:
+                await message.edit("❌ **Translation failed**\nCheck language code and try again")
+
     except Exception as e:
         await message.edit(f"❌ **Translation error:** {str(e)}")
 
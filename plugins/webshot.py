@@ -10,8 +10,8 @@
 from pyrogram import filters
 from pyrogram.types import Message
 import asyncio
-import aiohttp
-import os
+from bot.http import get_http_session
+from bot.uploads import upload_cache
 
 async def webshot_handler(client, message: Message):
     """Take screenshot of website"""
@@ -30,28 +30,23 @@ async def webshot_handler(client, message: Message):
         # Use a screenshot API service
         api_url = f"https://api.screenshotone.com/take?url={url}&viewport_width=1920&viewport_height=1080&device_scale_factor=1&format=png&block_ads=true&block_cookie_banners=true"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url) as response:
-                if response.status == 200:
-                    screenshot_data = await response.read()
-                    
-                    # Save screenshot temporarily
-                    screenshot_path = f"screenshot_{message.id}.png"
-                    with open(screenshot_path, 'wb') as f:
-                        f.write(screenshot_data)
-                    
-                    # Send screenshot
-                    await message.delete()
-                    await client.send_photo(
-                        chat_id=message.chat.id,
-                        photo=screenshot_path,
-                        caption=f"📸 **Website Screenshot**\n\n🔗 **URL**: {url}\n📱 **Resolution**: 1920x1080"
-                    )
-                    
-                    # Clean up
-                    os.remove(screenshot_path)
-                else:
-                    await message.edit("❌ Failed to take screenshot. Please check the URL.")
+        session = get_http_session()
+        async with session.get(api_url) as response:
+            if response.status == 200:
+                screenshot_data = await response.read()
+                
+                # Send screenshot straight from memory; an identical page reuses the earlier upload
+                await message.delete()
+                await upload_cache.send(
+                    client,
+                    'photo',
+                    message.chat.id,
+                    screenshot_data,
+                    name=f"screenshot_{message.id}.png",
+                    caption=f"📸 **Website Screenshot**\n\n🔗 **URL**: {url}\n📱 **Resolution**: 1920x1080"
+                )
+            else:
+                await message.edit("❌ Failed to take screenshot. Please check the URL.")
     except Exception as e:
         await message.edit(f"❌ Error: {str(e)}")
 